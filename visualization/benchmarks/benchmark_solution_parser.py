@@ -0,0 +1,76 @@
+"""
+Benchmark for SolutionParser scaling with the number of worker processes
+
+Usage (from the visualization directory):
+    python benchmarks/benchmark_solution_parser.py path/to/solution.sol --workers 1 2 4 8 --scale 20
+
+--scale repeats the variable lines of the input file to get a file large enough for
+chunked parsing. Repeated names overwrite each other, so the variable count stays
+the same while the amount of text to parse grows.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Make the application packages importable
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.solution_parser import SolutionParser
+
+
+def create_scaled_file(source: Path, scale: int) -> Path:
+    """Write a copy of the solution with its variable lines repeated `scale` times"""
+    header, body = [], []
+    with open(source, 'r') as f:
+        for line in f:
+            (header if line.startswith('#') else body).append(line)
+
+    fd, target = tempfile.mkstemp(suffix=".sol")
+    with os.fdopen(fd, 'w') as f:
+        f.writelines(header)
+        for _ in range(scale):
+            f.writelines(body)
+    return Path(target)
+
+
+def run_benchmark(file_path: Path, workers_list, repeat: int):
+    """Time parse_solution_file for each worker count and print a scaling table"""
+    size_mb = file_path.stat().st_size / 1024 / 1024
+    print(f"File: {file_path} ({size_mb:.1f} MB), CPUs available: {os.cpu_count()}")
+    print(f"{'workers':>8} {'best [s]':>10} {'speedup':>8} {'variables':>10}")
+
+    baseline = None
+    for workers in workers_list:
+        parser = SolutionParser(workers=workers)
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            solution = parser.parse_solution_file(file_path)
+            timings.append(time.perf_counter() - start)
+
+        best = min(timings)
+        baseline = baseline or best
+        print(f"{workers:>8} {best:>10.3f} {baseline / best:>7.2f}x {len(solution.variables):>10}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark chunked solution parsing")
+    arg_parser.add_argument("solution", type=Path, help="Path to a .sol file")
+    arg_parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    arg_parser.add_argument("--scale", type=int, default=1, help="Repeat the variable lines N times")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Runs per worker count (best is reported)")
+    args = arg_parser.parse_args()
+
+    file_path = create_scaled_file(args.solution, args.scale) if args.scale > 1 else args.solution
+    try:
+        run_benchmark(file_path, args.workers, args.repeat)
+    finally:
+        if file_path != args.solution:
+            file_path.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+IIS explorer page for infeasible models (constraint families, filters and variable search)
+"""
+import streamlit as st
+from typing import Optional
+
+from core.instance_manager import InstanceManager
+from core.data_models import InstanceMetadata, MISSING_INT
+from core.iis_reader import IisModel
+from config.visualization_config import CHART_CONFIG
+
+# Constraints offered in the detail view (the table always shows all filtered rows)
+MAX_DETAIL_OPTIONS = 2000
+
+class IisExplorerPage:
+    """Page for the irreducible infeasible subsystems (.ilp) written for infeasible models"""
+
+    def __init__(self, instance_manager: InstanceManager):
+        self.instance_manager = instance_manager
+
+    def render(self, selected_instance: Optional[InstanceMetadata] = None):
+        """Render the IIS explorer page"""
+
+        st.header("IIS-Analyse")
+        st.markdown(
+            "Nebenbedingungen und Schranken eines irreduziblen unzulässigen Teilsystems (IIS, `.ilp`), "
+            "gefiltert nach Gebäude, Periode und Nebenbedingungsfamilie."
+        )
+
+        if not selected_instance:
+            st.warning("Bitte wählen Sie eine Instanz aus der Seitenleiste, um ein IIS anzuzeigen.")
+            return
+
+        files = self.instance_manager.get_iis_files(selected_instance)
+        if not files:
+            st.info("Keine IIS-Dateien (results/**/*.ilp) für diese Instanz gefunden.")
+            return
+
+        file_name = st.selectbox("IIS-Datei:", list(files), key="iis_file")
+        with st.spinner("Lese IIS-Datei..."):
+            model = self.instance_manager.load_iis(files[file_name])
+
+        if model is None:
+            st.error("Die IIS-Datei konnte nicht gelesen werden.")
+            return
+        if model.constraints.empty:
+            st.info("Die Datei enthält keine Nebenbedingungen.")
+            return
+
+        self._render_summary(model)
+        constraints, variables = self._render_filters(model)
+
+        if constraints.empty:
+            st.info("Keine Nebenbedingungen für die gewählten Filter.")
+            return
+
+        self._render_family_chart(constraints)
+        self._render_constraint_table(constraints)
+        self._render_constraint_detail(model, constraints)
+        self._render_bounds(model, variables)
+
+    def _render_summary(self, model: IisModel):
+        """Size of the IIS"""
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Nebenbedingungen", f"{len(model.constraints):,}")
+        with col2:
+            st.metric("Familien", f"{len(model.families):,}")
+        with col3:
+            st.metric("Variablen", f"{model.num_variables:,}")
+        with col4:
+            st.metric("Schranken", f"{len(model.bounds):,}", help="Variablen im Bounds-Abschnitt der Datei")
+
+    def _render_filters(self, model: IisModel):
+        """Filter widgets, returns the matching constraints and the searched variables (None without search)"""
+        constraints = model.constraints
+        family_counts = constraints["family"].value_counts()
+        buildings = sorted(b for b in constraints["building"].unique() if b != MISSING_INT)
+        periods = sorted(p for p in constraints["period"].unique() if p != MISSING_INT)
+
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
+            families = st.multiselect(
+                "Familien:",
+                model.families,
+                format_func=lambda family: f"{family} ({family_counts[family]})",
+                key="iis_families",
+                placeholder="Alle Familien"
+            )
+        with col2:
+            selected_buildings = st.multiselect("Gebäude:", buildings, key="iis_buildings", placeholder="Alle Gebäude")
+        with col3:
+            selected_periods = st.multiselect("Perioden:", periods, key="iis_periods", placeholder="Alle Perioden")
+
+        search = st.text_input(
+            "Variable enthält:",
+            key="iis_variable_search",
+            help="Zeigt nur Nebenbedingungen, in denen eine passende Variable vorkommt (z. B. X_in_0_3 oder hp_air)"
+        ).strip()
+
+        filtered = model.filter_constraints(
+            buildings=selected_buildings or None,
+            periods=selected_periods or None,
+            families=families or None
+        )
+
+        variables = None
+        if search:
+            variables = model.find_variables(search)
+            containing = model.get_constraints_of(variables)
+            filtered = filtered[filtered.index.isin(containing.index)]
+            st.caption(f"{len(variables):,} passende Variablen in {len(containing):,} Nebenbedingungen")
+
+        return filtered, variables
+
+    def _render_family_chart(self, constraints):
+        """Number of constraints per family"""
+        import plotly.express as px
+
+        counts = constraints["family"].value_counts().sort_values()
+        fig = px.bar(
+            x=counts.values,
+            y=counts.index,
+            orientation='h',
+            labels={'x': 'Anzahl Nebenbedingungen', 'y': 'Familie'}
+        )
+        fig.update_layout(
+            title="Nebenbedingungen je Familie",
+            template=CHART_CONFIG["default_theme"],
+            height=max(CHART_CONFIG["height"]["small"], 22 * len(counts) + 100)
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    def _render_constraint_table(self, constraints):
+        """Filtered constraints, one row each"""
+        import pandas as pd
+
+        table = pd.DataFrame({
+            "Name": constraints["name"],
+            "Familie": constraints["family"],
+            "Gebäude": constraints["building"].where(constraints["building"] != MISSING_INT).astype("Int64"),
+            "Periode": constraints["period"].where(constraints["period"] != MISSING_INT).astype("Int64"),
+            "Sinn": constraints["sense"],
+            "RHS": constraints["rhs"],
+            "Terme": constraints["num_terms"]
+        })
+        st.subheader(f"Nebenbedingungen ({len(table):,})")
+        st.dataframe(table, use_container_width=True, hide_index=True)
+
+    def _render_constraint_detail(self, model: IisModel, constraints):
+        """LP text of one constraint with bounds and occurrences of its variables"""
+        import pandas as pd
+
+        names = constraints["name"].tolist()
+        if len(names) > MAX_DETAIL_OPTIONS:
+            st.caption(f"Detailansicht für die ersten {MAX_DETAIL_OPTIONS:,} Nebenbedingungen, weitere über die Filter eingrenzen.")
+            names = names[:MAX_DETAIL_OPTIONS]
+
+        name = st.selectbox("Nebenbedingung anzeigen:", names, key="iis_constraint")
+        row = constraints[constraints["name"] == name].iloc[0]
+        st.code(IisModel.format_constraint(row), language=None)
+
+        bounds = model.bounds.set_index("variable")
+        variables = list(row["variables"])
+        terms = pd.DataFrame({
+            "Variable": variables,
+            "Koeffizient": row["coefficients"],
+            "Untere Schranke": bounds["lower"].reindex(variables).to_numpy(),
+            "Obere Schranke": bounds["upper"].reindex(variables).to_numpy(),
+            "Ganzzahlig": [variable in model.integer_variables for variable in variables],
+            "Nebenbedingungen": [len(model.variable_index[variable]) for variable in variables]
+        })
+        st.dataframe(
+            terms,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Untere Schranke": st.column_config.NumberColumn(help="Leer: Variable steht nicht im Bounds-Abschnitt"),
+                "Nebenbedingungen": st.column_config.NumberColumn(help="Anzahl der IIS-Nebenbedingungen mit dieser Variable")
+            }
+        )
+
+    def _render_bounds(self, model: IisModel, variables):
+        """Bounds section of the file, restricted to the searched variables"""
+        bounds = model.bounds
+        if variables is not None:
+            bounds = bounds[bounds["variable"].isin(variables)]
+        if bounds.empty:
+            return
+
+        with st.expander(f"Schranken ({len(bounds):,})"):
+            st.dataframe(
+                bounds.rename(columns={"variable": "Variable", "lower": "Untere Schranke", "upper": "Obere Schranke"}),
+                use_container_width=True,
+                hide_index=True
+            )
@@ -208,6 +208,11 @@ class InstanceOverviewPage:
     def _check_data_availability(self, instance: InstanceMetadata):
         """Check data availability across different categories with actual validation"""
         
+        # Reuse the last validation from the instance manifest while the config files are unchanged
+        cached_status = self.instance_manager.get_validation_status(instance)
+        if cached_status is not None:
+            return cached_status
+        
         config_files = instance.config_files if instance.config_files else {}
         
         # Validate Building Data
@@ -248,11 +253,13 @@ class InstanceOverviewPage:
         else:
             portfolio_status = 'yellow'
         
-        return {
+        data_status = {
             'building': building_status,
             'financial': financial_status,
             'portfolio': portfolio_status
         }
+        self.instance_manager.store_validation_status(instance, data_status)
+        return data_status
     
     def _evaluate_files_status(self, files_dict):
         """Evaluate the status of a set of files
@@ -2,14 +2,31 @@
 Optimization results visualization page
 """
 import streamlit as st
-from typing import Optional
+from pathlib import Path
+from typing import Dict, Optional
 
 from core.instance_manager import InstanceManager
-from core.data_models import OptimizationSolution, InstanceMetadata
+from core.data_models import OptimizationSolution, InstanceMetadata, MISSING_INT
 from components.sidebar import StatusIndicator, MetricsDisplay
 from visualizations.investment_analysis import InvestmentAnalysis
 from visualizations.technology_mix import TechnologyMix
-from config.translations import get_technology_translation
+from config.translations import get_technology_translation, get_metric_translation
+from utils.data_processing import create_variables_dataframe
+from core.building_results import get_building_results
+from core.results_source import ResultsSources, ProcessedResultsSource, get_solution_source
+
+# Names of the results sources shown with the metrics
+SOURCE_LABELS = {
+    "processed_results": "aufbereitete Ergebnisse (processed_results)",
+    "solution": "Lösungsdatei (.sol)"
+}
+
+# Selector option that reads the metrics from the loaded solution only
+SOLUTION_ONLY_OPTION = "Lösungsdatei (keine aufbereiteten Ergebnisse)"
+
+# Portfolio metrics of the debugging model charts
+CREDIT_METRICS = ["credit_repayment", "credit_interest", "credit_payment", "pre_credit_payment"]
+INVESTMENT_METRICS = ["bonus_costs", "total_investment_measures", "CO2_costs"]
 
 class OptimizationResultsPage:
     """Page for visualizing optimization results"""
@@ -61,6 +78,11 @@ class OptimizationResultsPage:
             return
         
         if not selected_instance.has_solution:
+            if self.instance_manager.get_processed_results_runs(selected_instance):
+                # Benders runs without .sol file still have their processed results
+                st.info(f"Keine Lösungsdatei für die Instanz '{selected_instance.name}', Kennzahlen aus den aufbereiteten Ergebnissen.")
+                self._render_key_figures(self._get_results_sources(selected_instance, None))
+                return
             st.error(f"Keine Lösung verfügbar für die Instanz '{selected_instance.name}'")
             st.info("Bitte stellen Sie sicher, dass die Optimierung für diese Instanz durchgeführt wurde.")
             return
@@ -85,24 +107,37 @@ class OptimizationResultsPage:
             solution.solution_status
         )
         
+        if st.session_state.get('advanced_view', False):
+            cache_stats = self.instance_manager.get_solution_cache_stats()
+            st.caption(
+                f"Lösungs-Cache: {cache_stats['hits']} Treffer / {cache_stats['misses']} Fehlzugriffe, "
+                f"{cache_stats['entries']}/{cache_stats['max_entries']} Lösungen im Speicher"
+            )
+        
+        # Charts of the solution read its own variables; processed results of a run are
+        # only offered in the metrics tab, where they can be chosen explicitly
+        solution_sources = ResultsSources([get_solution_source(solution)])
+        
         st.markdown("---")
         
         # Visualization tabs - conditional based on advanced view
         if st.session_state.get('advanced_view', False):
-            tab0, tab1, tab2, tab3, tab4, tab5 = st.tabs([
+            tab0, tab1, tab2, tab3, tab_metrics, tab4, tab5 = st.tabs([
                 "Zielfunktion",
                 "Finanzen",
                 "Portfolio-Analyse", 
                 "Gebäude-Analyse",
+                "Kennzahlen",
                 "Rohdaten",
                 "Erweiterte Analysen"
             ])
         else:
-            tab0, tab1, tab2, tab3 = st.tabs([
+            tab0, tab1, tab2, tab3, tab_metrics = st.tabs([
                 "Zielfunktion",
                 "Finanzübersicht",
                 "Portfolio-Analyse", 
-                "Gebäude-Analyse"
+                "Gebäude-Analyse",
+                "Kennzahlen"
             ])
         
         with tab0:
@@ -117,28 +152,31 @@ class OptimizationResultsPage:
                 
                 # Yearly Rental Income
                 st.subheader("Jährliche Mieteinnahmen des Gebäudeportfolios")
-                self._render_yearly_rental_income_chart(solution)
+                self._render_yearly_rental_income_chart(solution_sources)
                 st.markdown("---")
 
                 # Credit Analysis
                 st.subheader("Bestandskredite, neue Kredite sowie zugehörige Zins- und Tilgungszahlungen")
-                self._render_credit_analysis_chart(solution)
+                self._render_credit_analysis_chart(solution_sources)
                 st.markdown("---")
 
                 # Investment Analysis
                 st.subheader("Gesamtinvestitionsmaßnahmen, CO2-Kosten sowie Bonuserträge")
-                self._render_investment_analysis_chart(solution)
+                self._render_investment_analysis_chart(solution_sources)
                 st.markdown("---")
 
                 # Total Subsidies
                 st.subheader("Gesamtförderung des Gebäudeportfolios")
-                self._render_subsidies_chart(solution)
+                self._render_subsidies_chart(solution_sources)
         
         with tab2:
             self.technology_viz.render(solution, instance_data=instance_data)
 
         with tab3:
             self._render_building_pathway(solution, instance_data)
+
+        with tab_metrics:
+            self._render_key_figures(self._get_results_sources(selected_instance, solution))
             
         # Advanced tabs only shown when advanced view is enabled
         if st.session_state.get('advanced_view', False):
@@ -148,6 +186,102 @@ class OptimizationResultsPage:
             with tab5:
                 self._render_advanced_analytics(solution)
     
+    def _get_results_sources(self, instance: InstanceMetadata, solution: Optional[OptimizationSolution]) -> ResultsSources:
+        """Sources of the result metrics: processed results of the selected Benders run before the solution
+
+        With a loaded solution, processed results are only used when chosen, by default only
+        for the run that contains the solution file, since other runs may be different solves.
+        """
+        sources = []
+        runs = self.instance_manager.get_processed_results_runs(instance)
+        if runs:
+            options = list(runs)
+            index = 0
+            if solution is not None:
+                options.insert(0, SOLUTION_ONLY_OPTION)
+                solution_run = self._get_solution_run(instance, runs)
+                index = options.index(solution_run) if solution_run else 0
+            run_name = st.selectbox(
+                "Aufbereitete Ergebnisse (Benders-Lauf):",
+                options,
+                index=index,
+                key="results_processed_run",
+                help="Kennzahlen, die der Lauf bereits aggregiert hat, werden von dort gelesen statt aus der Lösungsdatei abgeleitet"
+            )
+            if run_name != SOLUTION_ONLY_OPTION:
+                with st.spinner("Lade aufbereitete Ergebnisse..."):
+                    processed = self.instance_manager.load_processed_results(runs[run_name])
+                if processed is not None:
+                    sources.append(ProcessedResultsSource(processed))
+                    if processed.truncated_files:
+                        st.caption(f"⚠️ {len(processed.truncated_files)} unvollständige Ergebnisdateien, nur vollständige Werte werden verwendet.")
+        if solution is not None:
+            sources.append(get_solution_source(solution))
+        return ResultsSources(sources)
+
+    @staticmethod
+    def _get_solution_run(instance: InstanceMetadata, runs: Dict[str, Path]) -> Optional[str]:
+        """Name of the run whose folder contains the solution file, None if it is in none of them"""
+        if instance.solution_path is None:
+            return None
+        for run_name, run_path in runs.items():
+            if run_path in instance.solution_path.parents:
+                return run_name
+        return None
+
+    def _render_key_figures(self, sources: ResultsSources):
+        """Portfolio metrics by name, each answered by the fastest source that has it"""
+        import plotly.graph_objects as go
+
+        metrics = sources.get_metrics()
+        if not metrics:
+            st.info("Keine Kennzahlen verfügbar.")
+            return
+
+        metric = st.selectbox(
+            "Kennzahl:",
+            list(metrics),
+            format_func=lambda name: f"{get_metric_translation(name)} – {SOURCE_LABELS.get(metrics[name], metrics[name])}",
+            key="results_key_figure"
+        )
+        label = get_metric_translation(metric)
+        rows, source_name = sources.get_metric(metric)
+        st.caption(f"Quelle: {SOURCE_LABELS.get(source_name, source_name)}")
+
+        table = sources.get_portfolio_table(metric)
+        if table.empty:
+            # Totals without time period
+            totals = rows[(rows["building"] == MISSING_INT) & (rows["period"] == MISSING_INT)]
+            if totals.empty:
+                st.info("Keine Werte für diese Kennzahl.")
+            else:
+                st.metric(label, f"{totals['value'].sum():,.2f}")
+            return
+
+        fig = go.Figure()
+        for key in table.columns:
+            fig.add_trace(go.Bar(
+                x=table.index,
+                y=table[key],
+                name=get_technology_translation(key) if key else label
+            ))
+        fig.update_layout(
+            barmode='stack',
+            xaxis_title="Jahr",
+            yaxis_title=label,
+            height=400,
+            showlegend=len(table.columns) > 1
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+        per_building = rows[(rows["building"] != MISSING_INT) & (rows["period"] != MISSING_INT)]
+        if not per_building.empty:
+            with st.expander(f"Werte je Gebäude ({per_building['building'].nunique():,} Gebäude)"):
+                st.dataframe(
+                    per_building.pivot_table(index="building", columns="period", values="value", aggfunc="sum"),
+                    use_container_width=True
+                )
+
     def _render_advanced_analytics(self, solution: OptimizationSolution):
         """Render advanced analytics and in-depth analysis of the solution"""
         
@@ -177,8 +311,11 @@ class OptimizationResultsPage:
             st.warning("Keine Variablen in der Lösung gefunden")
             return
         
+        # All variables as one frame (vectorized for columnar solutions)
+        variables_df = create_variables_dataframe(solution)
+        
         # Variable type filter
-        variable_types = sorted(set(var.variable_type for var in solution.variables.values()))
+        variable_types = sorted(variables_df['variable_type'].dropna().unique())
         
         col1, col2 = st.columns([3, 1])
         
@@ -194,29 +331,24 @@ class OptimizationResultsPage:
         with col1:
             if selected_types:
                 # Filter variables
-                filtered_vars = {}
-                for name, var in solution.variables.items():
-                    if var.variable_type in selected_types:
-                        if show_zeros or var.value != 0:
-                            filtered_vars[name] = var
+                mask = variables_df['variable_type'].isin(selected_types)
+                if not show_zeros:
+                    mask &= variables_df['value'] != 0
+                filtered = variables_df[mask]
                 
-                if filtered_vars:
+                if not filtered.empty:
                     # Create dataframe for display
                     import pandas as pd
                     
-                    data = []
-                    for name, var in filtered_vars.items():
-                        data.append({
-                            'Variable': name,
-                            'Type': var.variable_type,
-                            'Value': var.value,
-                            'Building': var.building_id or 'N/A',
-                            'Time Period': var.time_period if var.time_period is not None else 'N/A',
-                            'Technology': var.technology or 'N/A',
-                            'Category': var.category or 'N/A'
-                        })
-                    
-                    df = pd.DataFrame(data)
+                    df = pd.DataFrame({
+                        'Variable': filtered['variable'],
+                        'Type': filtered['variable_type'].astype(str),
+                        'Value': filtered['value'],
+                        'Building': filtered['building_id'].astype(object).where(filtered['building_id'].notna(), 'N/A').astype(str),
+                        'Time Period': filtered['time_period'].astype(object).where(filtered['time_period'].notna(), 'N/A'),
+                        'Technology': filtered['technology'].astype(object).where(filtered['technology'].notna(), 'N/A'),
+                        'Category': filtered['category'].astype(object).where(filtered['category'].notna(), 'N/A')
+                    })
                     
                     # Sort by value (descending) and then by variable name
                     df = df.sort_values(['Value', 'Variable'], ascending=[False, True])
@@ -338,8 +470,8 @@ class OptimizationResultsPage:
         st.subheader("Gebäude-Analyse: Modernisierungspfad")
         st.markdown("Analyse von Technologiepfaden und Maßnahmen an der Gebäudehülle für einzelne Gebäude.")
 
-        # Extract buildings from solution data
-        buildings = self._extract_buildings_from_solution(solution)
+        # Extract buildings from solution data (all building series are extracted once per solution)
+        buildings = get_building_results(solution).buildings
         
         if not buildings:
             st.warning("Keine Gebäudedaten in der Lösung gefunden")
@@ -369,33 +501,6 @@ class OptimizationResultsPage:
         if selected_building is not None:
             self._render_building_pathway_content(solution, selected_building, instance_data)
     
-    def _extract_buildings_from_solution(self, solution: OptimizationSolution):
-        """Extract unique building IDs from solution variables"""
-        import re
-        
-        buildings = set()
-        
-        # Look for building IDs in variable names
-        for var_name in solution.variables.keys():
-            # Try to extract building ID from various variable name patterns
-            patterns = [
-                r'X_(?:in|out)_(\d+)_',  # X_in_1_2_tech or X_out_1_2_tech
-                r'E_(\d+)_',             # E_1_2_tech
-                r'_(\d+)_\d+_',          # Any pattern with building_timeperiod
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, var_name)
-                if match:
-                    try:
-                        building_id = int(match.group(1))
-                        buildings.add(building_id)
-                        break
-                    except (ValueError, IndexError):
-                        continue
-        
-        return sorted(list(buildings))
-    
     def _render_building_pathway_content(self, solution: OptimizationSolution, building_id: int, instance_data):
         """Render the actual building pathway content"""
                 
@@ -414,14 +519,15 @@ class OptimizationResultsPage:
         # Financials Section - Rent and Energy Costs over Time
         st.subheader("Finanzen - Kaltmiete, Energiekosten und CO2-Kosten")
         
-        # Extract rent and energy cost data for the selected building
-        rent_data = self._extract_rent_data(solution, building_id)
-        energy_data = self._extract_energy_cost_data(solution, building_id)
+        # Rent and energy cost data of the selected building
+        building = get_building_results(solution).get(building_id)
+        rent_data = building.rent
+        energy_data = building.energy_cost
         
-        # Extract CO2 costs for debugging model
+        # CO2 costs for debugging model
         co2_costs_data = {}
         if self._is_debugging_model(solution):
-            co2_costs_data = self._extract_co2_costs_building_data(solution, building_id, instance_data)
+            co2_costs_data = building.get_co2_costs(instance_data["params"]["c_co2"])
         
         if rent_data or energy_data or co2_costs_data:
             # Get all time periods from all datasets
@@ -517,34 +623,17 @@ class OptimizationResultsPage:
 
     def _render_installed_capacity_chart(self, solution: OptimizationSolution, building_id: int):
         """Render installed capacity chart showing E_av variables over time as stacked bars"""
-        import re
         import plotly.graph_objects as go
         import pandas as pd
 
-        # Extract E_av data for the specific building
+        # E_av data for the specific building
         capacity_data = {}
-
-        # Look for E_av variables for the specific building
-        for var_name, var in solution.variables.items():
-            # Pattern: E_av_{building_id}_{time_period}_{technology}
-            pattern = rf'E_av_{building_id}_(\d+)_(.+)'
-            match = re.match(pattern, var_name)
-
-            if match and var.value is not None and var.value > 0:
-                try:
-                    time_period = int(match.group(1))
-                    technology = match.group(2)
-
-                    if time_period not in capacity_data:
-                        capacity_data[time_period] = {}
-
-                    # Convert from W to kW for all technologies except PV (which is already in kW)
-                    if technology.startswith('pv'):
-                        capacity_data[time_period][technology] = var.value  # PV already in kW
-                    else:
-                        capacity_data[time_period][technology] = var.value / 1000.0  # Convert from W to kW
-                except (ValueError, IndexError):
-                    continue
+        for time_period, technologies in get_building_results(solution).get(building_id).capacity.items():
+            capacity_data[time_period] = {
+                # Convert from W to kW for all technologies except PV (which is already in kW)
+                technology: value if technology.startswith('pv') else value / 1000.0
+                for technology, value in technologies.items()
+            }
 
         if not capacity_data:
             st.warning(f"Keine installierten Kapazitätsdaten (E_av-Variablen) für Gebäude {building_id} gefunden")
@@ -608,35 +697,11 @@ class OptimizationResultsPage:
 
     def _render_envelope_components_chart(self, solution: OptimizationSolution, building_id: int):
         """Render building envelope components chart showing X_av variables for roof, wall, win components"""
-        import re
         import plotly.graph_objects as go
         import pandas as pd
 
-        # Extract X_av data for building envelope components (roof, wall, win)
-        envelope_data = {}
-
-        # Look for X_av variables for the specific building and envelope components
-        for var_name, var in solution.variables.items():
-            # Pattern: X_av_{building_id}_{time_period}_{component}_{number}
-            # where component is one of: roof, wall, win
-            pattern = rf'X_av_{building_id}_(\d+)_(roof|wall|win)_(\d+)'
-            match = re.match(pattern, var_name)
-
-            if match and var.value is not None and var.value == 1:  # Only binary vars with value 1
-                try:
-                    time_period = int(match.group(1))
-                    component_type = match.group(2)
-                    component_number = int(match.group(3))
-
-                    if time_period not in envelope_data:
-                        envelope_data[time_period] = {}
-
-                    if component_type not in envelope_data[time_period]:
-                        envelope_data[time_period][component_type] = []
-
-                    envelope_data[time_period][component_type].append(component_number)
-                except (ValueError, IndexError):
-                    continue
+        # X_av data for building envelope components (roof, wall, win), only binary vars with value 1
+        envelope_data = get_building_results(solution).get(building_id).envelope
 
         if not envelope_data:
             st.warning(f"Keine Daten zu Gebäudehüllenkomponenten (X_av-Variablen für Dach/Wand/Fenster) für Gebäude {building_id} gefunden")
@@ -754,328 +819,17 @@ class OptimizationResultsPage:
 
         
 
-    def _extract_rent_data(self, solution: OptimizationSolution, building_id: int):
-        """Extract rent data for a specific building from solution variables"""
-        import re
-        
-        rent_data = {}
-        
-        # Look for C_rent variables for the specific building
-        for var_name, var in solution.variables.items():
-            # Pattern: C_rent_{building_id}_{time_period}
-            pattern = rf'C_rent_{building_id}_(\d+)'
-            match = re.match(pattern, var_name)
-            
-            if match and var.value is not None:
-                try:
-                    time_period = int(match.group(1))
-                    rent_data[time_period] = var.value
-                except (ValueError, IndexError):
-                    continue
-        
-        return rent_data
-    
-    def _extract_energy_cost_data(self, solution: OptimizationSolution, building_id: int):
-        """Extract energy cost data for a specific building from solution variables"""
-        import re
-        
-        energy_data = {}
-        
-        # Look for C_en variables for the specific building
-        for var_name, var in solution.variables.items():
-            # Pattern: C_en_{building_id}_{time_period}
-            pattern = rf'C_en_{building_id}_(\d+)'
-            match = re.match(pattern, var_name)
-            
-            if match and var.value is not None:
-                try:
-                    time_period = int(match.group(1))
-                    energy_data[time_period] = var.value
-                except (ValueError, IndexError):
-                    continue
-        
-        return energy_data
-    
-    def _extract_cmod_data(self, solution: OptimizationSolution, building_id: int):
-        """Extract C_mod and C_mod_heat data for a specific building from solution variables"""
-        import re
-        
-        cmod_data = {}
-        cmod_heat_data = {}
-        
-        # Look for C_mod and C_mod_heat variables for the specific building
-        for var_name, var in solution.variables.items():
-            # Pattern: C_mod_{building_id}_{time_period}
-            cmod_pattern = rf'C_mod_{building_id}_(\d+)'
-            cmod_match = re.match(cmod_pattern, var_name)
-            
-            # Pattern: C_mod_heat_{building_id}_{time_period}  
-            cmod_heat_pattern = rf'C_mod_heat_{building_id}_(\d+)'
-            cmod_heat_match = re.match(cmod_heat_pattern, var_name)
-            
-            if cmod_match and var.value is not None:
-                try:
-                    time_period = int(cmod_match.group(1))
-                    cmod_data[time_period] = var.value
-                except (ValueError, IndexError):
-                    continue
-            elif cmod_heat_match and var.value is not None:
-                try:
-                    time_period = int(cmod_heat_match.group(1))
-                    cmod_heat_data[time_period] = var.value
-                except (ValueError, IndexError):
-                    continue
-        
-        return {
-            'cmod': cmod_data,
-            'cmod_heat': cmod_heat_data
-        }
-    
-    def _extract_yearly_rental_income_data(self, solution: OptimizationSolution):
-        """Extract yearly rental income data for debugging model analysis"""
-        import re
-        
-        rental_income_data = {}
-        
-        # Look for yearly_rental_income variables (these are time-period specific)
-        for var_name, var in solution.variables.items():
-            # Pattern: yearly_rental_income_{time_period}
-            pattern = rf'yearly_rental_income_(\d+)'
-            match = re.match(pattern, var_name)
-            
-            if match and var.value is not None:
-                try:
-                    time_period = int(match.group(1))
-                    rental_income_data[time_period] = var.value
-                except (ValueError, IndexError):
-                    continue
-        
-        return rental_income_data
-    
-    def _extract_credit_analysis_data(self, solution: OptimizationSolution):
-        """Extract credit-related variables for debugging model analysis"""
-        import re
-        
-        credit_data = {
-            'credit_repayment': {},
-            'credit_interest': {},
-            'credit_payment': {},
-            'pre_credit_payment': {}
-        }
-        
-        # Extract all credit-related variables
-        for var_name, var in solution.variables.items():
-            if var.value is not None:
-                # Pattern: credit_repayment_{time_period}
-                repayment_match = re.match(rf'credit_repayment_(\d+)', var_name)
-                if repayment_match:
-                    try:
-                        time_period = int(repayment_match.group(1))
-                        credit_data['credit_repayment'][time_period] = var.value
-                    except (ValueError, IndexError):
-                        continue
-                
-                # Pattern: credit_interest_{time_period}
-                interest_match = re.match(rf'credit_interest_(\d+)', var_name)
-                if interest_match:
-                    try:
-                        time_period = int(interest_match.group(1))
-                        credit_data['credit_interest'][time_period] = var.value
-                    except (ValueError, IndexError):
-                        continue
-                
-                # Pattern: credit_payment_{time_period}
-                payment_match = re.match(rf'credit_payment_(\d+)', var_name)
-                if payment_match:
-                    try:
-                        time_period = int(payment_match.group(1))
-                        credit_data['credit_payment'][time_period] = var.value
-                    except (ValueError, IndexError):
-                        continue
-                
-                # Pattern: pre_credit_payment_{time_period}
-                pre_payment_match = re.match(rf'pre_credit_payment_(\d+)', var_name)
-                if pre_payment_match:
-                    try:
-                        time_period = int(pre_payment_match.group(1))
-                        credit_data['pre_credit_payment'][time_period] = var.value
-                    except (ValueError, IndexError):
-                        continue
-        
-        return credit_data
-    
-    def _extract_investment_analysis_data(self, solution: OptimizationSolution):
-        """Extract investment-related variables for debugging model analysis"""
-        import re
-        
-        investment_data = {
-            'bonus_costs': {},
-            'total_investment_measures': {},
-            'CO2_costs': {}
-        }
-        
-        # Extract investment-related variables
-        for var_name, var in solution.variables.items():
-            if var.value is not None:
-                # Pattern: bonus_costs_{time_period}
-                bonus_match = re.match(rf'bonus_costs_(\d+)', var_name)
-                if bonus_match:
-                    try:
-                        time_period = int(bonus_match.group(1))
-                        investment_data['bonus_costs'][time_period] = var.value
-                    except (ValueError, IndexError):
-                        continue
-                
-                # Pattern: total_investment_measures_{time_period}
-                investment_match = re.match(rf'total_investment_measures_(\d+)', var_name)
-                if investment_match:
-                    try:
-                        time_period = int(investment_match.group(1))
-                        investment_data['total_investment_measures'][time_period] = var.value
-                    except (ValueError, IndexError):
-                        continue
-                
-                # Pattern: CO2_costs_{time_period}
-                co2_match = re.match(rf'CO2_costs_(\d+)', var_name)
-                if co2_match:
-                    try:
-                        time_period = int(co2_match.group(1))
-                        investment_data['CO2_costs'][time_period] = var.value
-                    except (ValueError, IndexError):
-                        continue
-        
-        return investment_data
-    
-    def _extract_subsidies_data(self, solution: OptimizationSolution):
-        """Extract subsidies data for debugging model analysis"""
-        import re
-        
-        subsidies_data = {}
-        
-        # Extract subsidies variables
-        for var_name, var in solution.variables.items():
-            if var.value is not None:
-                # Pattern: subsidies_{time_period}
-                subsidies_match = re.match(rf'subsidies_(\d+)', var_name)
-                if subsidies_match:
-                    try:
-                        time_period = int(subsidies_match.group(1))
-                        subsidies_data[time_period] = var.value
-                    except (ValueError, IndexError):
-                        continue
-        
-        return subsidies_data
-        
-    def _extract_investment_measures_building_data(self, solution: OptimizationSolution, building_id: int):
-        """Extract building-specific investment measures data from solution variables"""
-        import re
-        
-        investment_data = {}
-        
-        # Extract total_investment_measures_building variables for the specific building
-        for var_name, var in solution.variables.items():
-            if var.value is not None:
-                # Pattern: total_investment_measures_building_{building_id}_{time_period}
-                investment_match = re.match(rf'total_investment_measures_building_{building_id}_(\d+)', var_name)
-                if investment_match:
-                    try:
-                        time_period = int(investment_match.group(1))
-                        investment_data[time_period] = var.value
-                    except (ValueError, IndexError):
-                        continue
-        
-        return investment_data
-        
-    def _extract_subsidies_building_data(self, solution: OptimizationSolution, building_id: int):
-        """Extract building-specific subsidies data from solution variables"""
-        import re
-        
-        subsidies_data = {}
-        
-        # Extract subsidies_building variables for the specific building
-        for var_name, var in solution.variables.items():
-            if var.value is not None:
-                # Pattern: subsidies_building_{building_id}_{time_period}
-                subsidies_match = re.match(rf'subsidies_building_{building_id}_(\d+)', var_name)
-                if subsidies_match:
-                    try:
-                        time_period = int(subsidies_match.group(1))
-                        subsidies_data[time_period] = var.value
-                    except (ValueError, IndexError):
-                        continue
-        
-        return subsidies_data
-        
-    def _extract_co2_costs_building_data(self, solution: OptimizationSolution, building_id: int, instance_data):
-        """Extract building-specific CO2 costs data from solution variables"""
-        import re
-        
-        co2_costs_data = {}
-        
-        # Extract CO2_costs_building variables for the specific building
-        co2_costs_data = {}
-
-        for var_name, var in solution.variables.items():
-            if var.value is not None and var_name.startswith(f"F_en_{building_id}_"):
-                match = re.match(rf"F_en_{building_id}_(\d+)$", var_name)
-                if match:
-                    time_period = int(match.group(1))
-                    co2_costs_data[time_period] = var.value * instance_data["params"]["c_co2"][time_period]
-
-        return co2_costs_data
-        
-    def _extract_depreciation_cost_data(self, solution: OptimizationSolution, building_id: int):
-        """Extract depreciation cost data for a specific building from solution variables"""
-        import re
-        
-        # Dictionary to store time period -> total depreciation cost
-        depreciation_data = {}
-        
-        # Dictionary to store time period -> {measure -> cost} for detailed breakdown
-        depreciation_by_measure = {}
-        
-        # Look for both new and legacy depreciation variables for the specific building
-        for var_name, var in solution.variables.items():
-            # Pattern for existing depreciation costs: C_dep_ex_{building_id}_{time_period}_{measure}
-            pattern_existing = rf'C_dep_ex_{building_id}_(\d+)_(.+)'
-            # Pattern for new depreciation costs: C_dep_{building_id}_{time_period}_{measure}
-            pattern_new = rf'C_dep_{building_id}_(\d+)_(.+)'
-            
-            match = re.match(pattern_existing, var_name) or re.match(pattern_new, var_name)
-            
-            if match and var.value is not None:
-                try:
-                    time_period = int(match.group(1))
-                    measure = match.group(2)
-                    cost_value = var.value
-                    
-                    # Only include non-zero costs
-                    if cost_value > 0:
-                        # Add to total depreciation for this time period
-                        if time_period not in depreciation_data:
-                            depreciation_data[time_period] = 0
-                        depreciation_data[time_period] += cost_value
-                        
-                        # Store detailed breakdown by measure
-                        if time_period not in depreciation_by_measure:
-                            depreciation_by_measure[time_period] = {}
-                        depreciation_by_measure[time_period][measure] = cost_value
-                    
-                except (ValueError, IndexError):
-                    continue
-        
-        return {
-            'total': depreciation_data,
-            'by_measure': depreciation_by_measure
-        }
-        
     def _render_depreciation_costs_chart(self, solution: OptimizationSolution, building_id: int):
         """Render a chart showing depreciation costs over time for a building"""
         import plotly.graph_objects as go
         import pandas as pd
         
         # Extract depreciation cost data
-        depreciation_data = self._extract_depreciation_cost_data(solution, building_id)
+        building = get_building_results(solution).get(building_id)
+        depreciation_data = {
+            'total': building.depreciation,
+            'by_measure': building.depreciation_by_measure
+        }
         
         if not depreciation_data['total']:
             st.info(f"Keine Abschreibungskosten für bestehende Systeme für Gebäude {building_id} gefunden. Dies könnte bedeuten, dass keine bestehenden Systeme mit Abschreibungen in den Optimierungsperioden vorhanden sind.")
@@ -1185,7 +939,11 @@ class OptimizationResultsPage:
         import pandas as pd
         
         # Extract C_mod data
-        cmod_data = self._extract_cmod_data(solution, building_id)
+        building = get_building_results(solution).get(building_id)
+        cmod_data = {
+            'cmod': building.cmod,
+            'cmod_heat': building.cmod_heat
+        }
         
         if not cmod_data['cmod'] and not cmod_data['cmod_heat']:
             st.info(f"Keine Modernisierungskostendaten (C_mod/C_mod_heat) für Gebäude {building_id} verfügbar.")
@@ -1260,13 +1018,13 @@ class OptimizationResultsPage:
         
         
 
-    def _render_yearly_rental_income_chart(self, solution: OptimizationSolution):
+    def _render_yearly_rental_income_chart(self, sources: ResultsSources):
         """Render yearly rental income chart for debugging model"""
         import plotly.graph_objects as go
         import pandas as pd
         
         # Extract yearly rental income data
-        rental_data = self._extract_yearly_rental_income_data(solution)
+        rental_data = sources.get_portfolio_series("yearly_rental_income")
         
         if not rental_data:
             st.info("No yearly rental income data available.")
@@ -1307,13 +1065,13 @@ class OptimizationResultsPage:
         
         
 
-    def _render_credit_analysis_chart(self, solution: OptimizationSolution):
+    def _render_credit_analysis_chart(self, sources: ResultsSources):
         """Render credit analysis chart for debugging model"""
         import plotly.graph_objects as go
         import pandas as pd
         
         # Extract credit analysis data
-        credit_data = self._extract_credit_analysis_data(solution)
+        credit_data = {name: sources.get_portfolio_series(name) for name in CREDIT_METRICS}
         
         # Check if any credit data exists
         has_data = any(credit_data[key] for key in credit_data.keys())
@@ -1392,14 +1150,14 @@ class OptimizationResultsPage:
         
         
 
-    def _render_investment_analysis_chart(self, solution: OptimizationSolution):
+    def _render_investment_analysis_chart(self, sources: ResultsSources):
         """Render investment analysis chart for debugging model"""
         import plotly.graph_objects as go
         import pandas as pd
         from plotly.subplots import make_subplots
         
         # Extract investment analysis data
-        investment_data = self._extract_investment_analysis_data(solution)
+        investment_data = {name: sources.get_portfolio_series(name) for name in INVESTMENT_METRICS}
         
         # Check if any investment data exists
         has_data = any(investment_data[key] for key in investment_data.keys())
@@ -1520,14 +1278,14 @@ class OptimizationResultsPage:
         
         
 
-    def _render_subsidies_chart(self, solution: OptimizationSolution):
+    def _render_subsidies_chart(self, sources: ResultsSources):
         """Render total subsidies chart for debugging model"""
         import plotly.graph_objects as go
         import pandas as pd
         
     
         # Extract subsidies data
-        subsidies_data = self._extract_subsidies_data(solution)
+        subsidies_data = sources.get_portfolio_series("subsidies")
         
         if not subsidies_data:
             st.info("No subsidies data available.")
@@ -1576,7 +1334,7 @@ class OptimizationResultsPage:
         
         
         # Extract investment measures data for the specific building
-        investment_data = self._extract_investment_measures_building_data(solution, building_id)
+        investment_data = get_building_results(solution).get(building_id).investment_measures
         
         if not investment_data:
             st.info(f"Keine Investitionsmaßnahmendaten für Gebäude {building_id} verfügbar.")
@@ -1623,7 +1381,7 @@ class OptimizationResultsPage:
         
         
         # Extract subsidies data for the specific building
-        subsidies_data = self._extract_subsidies_building_data(solution, building_id)
+        subsidies_data = get_building_results(solution).get(building_id).subsidies
         
         if not subsidies_data:
             st.info(f"Keine Fördermitteldaten für Gebäude {building_id} verfügbar.")
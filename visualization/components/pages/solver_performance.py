@@ -0,0 +1,557 @@
+"""
+Solver performance page for Benders runs (iteration timings, log and live view)
+"""
+import time
+import streamlit as st
+from pathlib import Path
+from typing import Optional
+
+from core.instance_manager import InstanceManager
+from core.data_models import InstanceMetadata
+from core.benders_timings import BendersTimings, JOB_PHASES
+from core.benders_log import BendersLog, LOG_FILE, read_log_lines
+from core.subproblem_artifacts import get_sp_idx
+from visualizations.subproblem_timeline import SubproblemTimeline
+from config.app_config import LIVE_TAIL_INTERVAL
+from config.visualization_config import CHART_CONFIG, JOB_PHASE_LABELS, JOB_PHASE_COLORS, CUT_KIND_LABELS, CUT_KIND_COLORS
+
+class SolverPerformancePage:
+    """Page for the iteration timings and the log of Benders runs"""
+
+    def __init__(self, instance_manager: InstanceManager):
+        self.instance_manager = instance_manager
+        self.timeline_viz = SubproblemTimeline()
+
+    def render(self, selected_instance: Optional[InstanceMetadata] = None):
+        """Render the solver performance page"""
+
+        st.header("Solver-Performance")
+        st.markdown(
+            "Laufzeiten der Benders-Iterationen und Subprobleme (`logging/iteration_timings.json`) "
+            "sowie Schnitte und Konvergenz aus `logging/benders.log`."
+        )
+
+        if not selected_instance:
+            st.warning("Bitte wählen Sie eine Instanz aus der Seitenleiste, um die Solver-Performance anzuzeigen.")
+            return
+
+        runs = self.instance_manager.get_benders_runs(selected_instance)
+        if not runs:
+            st.info("Keine Benders-Läufe (results/<Lauf>/logging) für diese Instanz gefunden.")
+            return
+
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            run_name = st.selectbox("Benders-Lauf:", list(runs), key="solver_performance_run")
+        with col2:
+            live = st.toggle(
+                "Live-Modus",
+                key="solver_performance_live",
+                help="Verfolgt die Logdateien eines laufenden Jobs und liest nur neu geschriebene Zeilen"
+            )
+
+        if live:
+            self._render_live(runs[run_name])
+            return
+
+        with st.spinner("Lade Iterationszeiten und Log..."):
+            timings = self.instance_manager.load_benders_timings(runs[run_name])
+            benders_log = self.instance_manager.load_benders_log(runs[run_name])
+
+        artifacts = self.instance_manager.load_subproblem_artifacts(runs[run_name])
+
+        has_timings = timings is not None and timings.num_iterations > 0
+        has_log = benders_log is not None and (benders_log.num_iterations > 0 or not benders_log.progress.empty)
+        if not has_timings and not has_log:
+            st.info("Für diesen Lauf liegen keine Iterationszeiten und kein Benders-Log vor.")
+            return
+
+        if has_timings:
+            self._render_summary(timings)
+
+        tabs = []
+        if has_timings:
+            tabs += [
+                ("Iterationen", lambda: self._render_iteration_chart(timings)),
+                ("Phasen", lambda: self._render_phase_breakdown(timings)),
+                ("Subprobleme", lambda: self._render_subproblems(timings)),
+                ("Zeitachse", lambda: self._render_timeline(timings))
+            ]
+        if has_log:
+            tabs += [
+                ("Schnitte", lambda: self._render_cuts(benders_log, runs[run_name] / LOG_FILE)),
+                ("Konvergenz", lambda: self._render_convergence(benders_log))
+            ]
+
+        if artifacts is not None and not artifacts.empty:
+            tabs.append(("Artefakte", lambda: self._render_artifacts(artifacts, timings if has_timings else None, runs[run_name])))
+
+        for tab, (_, render_tab) in zip(st.tabs([label for label, _ in tabs]), tabs):
+            with tab:
+                render_tab()
+
+    def _render_summary(self, timings: BendersTimings):
+        """Key figures of the run"""
+        iterations = timings.iterations
+        statistics = timings.summary.get("iteration_statistics", {})
+        totals = timings.summary.get("aggregated_totals", {})
+
+        wall_clock = statistics.get("total_wall_clock_time", iterations["wall_clock_time"].sum())
+        job_time = totals.get("total_job_time", timings.jobs["total_job_time"].sum())
+        # Run-level value of the per-iteration formula (the summary field is computed differently)
+        capacity = (iterations["wall_clock_time"] * iterations["num_subproblems"]).sum()
+        efficiency = iterations["sum_job_times"].sum() / capacity if capacity > 0 else None
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Iterationen", f"{timings.num_iterations:,}")
+        with col2:
+            st.metric("Wall-Clock gesamt", f"{wall_clock:.2f} s")
+        with col3:
+            st.metric("Summe Jobzeiten", f"{job_time:.2f} s", help="Summe der Laufzeiten aller Subproblem-Jobs")
+        with col4:
+            st.metric(
+                "Parallelisierungseffizienz",
+                f"{efficiency:.1%}" if efficiency is not None else "—",
+                help="Summe Jobzeiten / Summe über alle Iterationen von (Wall-Clock × Anzahl Subprobleme)"
+            )
+
+    def _render_iteration_chart(self, timings: BendersTimings):
+        """Wall-clock time vs. sum of job times and parallelization efficiency per iteration"""
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+
+        iterations = timings.iterations
+        fig = make_subplots(specs=[[{"secondary_y": True}]])
+        fig.add_trace(go.Scattergl(
+            x=iterations["iteration"], y=iterations["wall_clock_time"],
+            mode="lines+markers", name="Wall-Clock"
+        ), secondary_y=False)
+        fig.add_trace(go.Scattergl(
+            x=iterations["iteration"], y=iterations["sum_job_times"],
+            mode="lines+markers", name="Summe Jobzeiten"
+        ), secondary_y=False)
+        fig.add_trace(go.Scattergl(
+            x=iterations["iteration"], y=iterations["parallelization_efficiency"],
+            mode="lines", name="Parallelisierungseffizienz", line=dict(dash="dot")
+        ), secondary_y=True)
+
+        fig.update_layout(
+            template=CHART_CONFIG["default_theme"],
+            height=CHART_CONFIG["height"]["medium"],
+            xaxis_title="Iteration",
+            hovermode="x unified"
+        )
+        fig.update_yaxes(title_text="Zeit (s)", secondary_y=False)
+        fig.update_yaxes(title_text="Effizienz", tickformat=".0%", range=[0, 1], secondary_y=True)
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Iterations with the lowest efficiency and their slowest subproblem
+        st.markdown("**Iterationen mit der geringsten Parallelisierungseffizienz**")
+        worst = iterations.nsmallest(10, "parallelization_efficiency")[[
+            "iteration", "wall_clock_time", "sum_job_times", "parallelization_efficiency",
+            "max_job_sp_idx", "max_job_subprocess_idx", "max_job_slowest_phase"
+        ]].rename(columns={
+            "iteration": "Iteration",
+            "wall_clock_time": "Wall-Clock (s)",
+            "sum_job_times": "Summe Jobzeiten (s)",
+            "parallelization_efficiency": "Effizienz",
+            "max_job_sp_idx": "Langsamstes SP",
+            "max_job_subprocess_idx": "Subprozess",
+            "max_job_slowest_phase": "Langsamste Phase"
+        })
+        st.dataframe(worst, hide_index=True, use_container_width=True)
+
+    def _render_phase_breakdown(self, timings: BendersTimings):
+        """Job time per phase, in total and per iteration"""
+        import pandas as pd
+        import plotly.graph_objects as go
+
+        phase_totals = timings.get_phase_totals_by_iteration()
+        if phase_totals.empty:
+            st.info("Keine Job-Daten vorhanden.")
+            return
+
+        totals = phase_totals.sum()
+        col1, col2 = st.columns([1, 2])
+
+        with col1:
+            fig = go.Figure(go.Pie(
+                labels=[JOB_PHASE_LABELS[phase] for phase in JOB_PHASES],
+                values=[totals[phase] for phase in JOB_PHASES],
+                marker_colors=[JOB_PHASE_COLORS[phase] for phase in JOB_PHASES],
+                hole=0.4,
+                sort=False
+            ))
+            fig.update_layout(title="Anteil an der Summe der Jobzeiten", height=CHART_CONFIG["height"]["medium"])
+            st.plotly_chart(fig, use_container_width=True)
+
+        with col2:
+            fig = go.Figure()
+            for phase in JOB_PHASES:
+                fig.add_trace(go.Bar(
+                    x=phase_totals.index, y=phase_totals[phase],
+                    name=JOB_PHASE_LABELS[phase], marker_color=JOB_PHASE_COLORS[phase]
+                ))
+            fig.update_layout(
+                barmode="stack",
+                title="Jobzeit je Phase und Iteration",
+                template=CHART_CONFIG["default_theme"],
+                height=CHART_CONFIG["height"]["medium"],
+                xaxis_title="Iteration",
+                yaxis_title="Zeit (s)"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
+        # Phases of the slowest job per iteration (they determine the wall-clock time)
+        bottleneck = timings.summary.get("bottleneck_phase_analysis", {})
+        if bottleneck.get("max_job_phase_totals"):
+            st.markdown("**Phasen der jeweils langsamsten Jobs (bestimmen die Wall-Clock-Zeit)**")
+            frequency = bottleneck.get("slowest_phase_frequency", {})
+            st.dataframe(pd.DataFrame({
+                "Phase": [JOB_PHASE_LABELS.get(phase, phase) for phase in bottleneck["max_job_phase_totals"]],
+                "Zeit (s)": list(bottleneck["max_job_phase_totals"].values()),
+                "Anteil (%)": [bottleneck.get("max_job_phase_percentages", {}).get(phase) for phase in bottleneck["max_job_phase_totals"]],
+                "Langsamste Phase (Iterationen)": [frequency.get(phase.replace("_time", "")) for phase in bottleneck["max_job_phase_totals"]]
+            }), hide_index=True, use_container_width=True)
+
+    def _render_subproblems(self, timings: BendersTimings):
+        """Subproblems sorted by total time with their phase shares"""
+        subproblems = timings.subproblems if not timings.subproblems.empty else timings.slowest_subproblems
+        if subproblems.empty:
+            st.info("Keine Subproblem-Statistiken vorhanden.")
+            return
+
+        subproblems = subproblems.sort_values("total_time", ascending=False)
+        columns = {
+            "sp_idx": "Subproblem (Gebäude, Periode)",
+            "total_time": "Gesamtzeit (s)",
+            "num_calls": "Aufrufe",
+            "avg_time": "Ø Zeit (s)",
+            **{f"{phase}_pct": f"{JOB_PHASE_LABELS[phase]} (%)" for phase in JOB_PHASES}
+        }
+        st.dataframe(
+            subproblems[[column for column in columns if column in subproblems.columns]].rename(columns=columns),
+            hide_index=True,
+            use_container_width=True
+        )
+
+    def _render_timeline(self, timings: BendersTimings):
+        """Gantt timeline of the subprocesses for a range of iterations"""
+        first, last = int(timings.iterations["iteration"].min()), int(timings.iterations["iteration"].max())
+        iteration_range = (first, last)
+        if last > first:
+            iteration_range = st.slider(
+                "Iterationen:",
+                min_value=first,
+                max_value=last,
+                value=(first, last),
+                key="solver_performance_timeline_range",
+                help="Kleinere Bereiche zeigen die einzelnen Jobs, große Bereiche werden zusammengefasst"
+            )
+        self.timeline_viz.render(timings, iteration_range=iteration_range)
+
+    def _render_cuts(self, benders_log: BendersLog, log_path: Path):
+        """Added cuts per iteration and per subproblem"""
+        if benders_log.cuts.empty:
+            st.info("Im Log wurden keine hinzugefügten Schnitte gefunden.")
+        else:
+            self._render_cuts_chart(benders_log)
+
+            # Single cuts of integral solutions name their subproblem
+            cuts = benders_log.cuts[benders_log.cuts["sp_building"] >= 0]
+            if not cuts.empty:
+                st.markdown("**Schnitte je Subproblem**")
+                per_subproblem = cuts.groupby(["sp_building", "sp_period", "cut_type"]).agg(
+                    count=("count", "sum"),
+                    max_violation=("violation", "max"),
+                    last_iteration=("iteration", "max")
+                ).reset_index().sort_values("count", ascending=False)
+                per_subproblem["cut_type"] = per_subproblem["cut_type"].map(
+                    {"feasibility": "Zulässigkeit", "optimality": "Optimalität"}
+                )
+                st.dataframe(per_subproblem.rename(columns={
+                    "sp_building": "Gebäude",
+                    "sp_period": "Periode",
+                    "cut_type": "Schnitttyp",
+                    "count": "Anzahl",
+                    "max_violation": "Max. Verletzung",
+                    "last_iteration": "Letzte Iteration"
+                }), hide_index=True, use_container_width=True)
+
+        # Raw log lines of one iteration, read via the byte offsets of the index
+        iterations = benders_log.iterations["iteration"].tolist()
+        if iterations:
+            with st.expander("Logzeilen einer Iteration"):
+                iteration = st.selectbox("Iteration:", iterations, key="solver_performance_log_iteration")
+                span = benders_log.get_iteration_span(iteration)
+                if span:
+                    st.code("\n".join(read_log_lines(log_path, *span)), language=None)
+
+    def _render_cuts_chart(self, benders_log: BendersLog):
+        """Stacked bars of the added cuts per iteration and cut type"""
+        import plotly.graph_objects as go
+
+        cuts_per_iteration = benders_log.get_cuts_per_iteration()
+        fig = go.Figure()
+        for kind in cuts_per_iteration.columns:
+            fig.add_trace(go.Bar(
+                x=cuts_per_iteration.index, y=cuts_per_iteration[kind],
+                name=CUT_KIND_LABELS.get(kind, kind), marker_color=CUT_KIND_COLORS.get(kind)
+            ))
+        fig.update_layout(
+            barmode="stack",
+            title="Hinzugefügte Schnitte je Iteration",
+            template=CHART_CONFIG["default_theme"],
+            height=CHART_CONFIG["height"]["medium"],
+            xaxis_title="Iteration",
+            yaxis_title="Anzahl Schnitte"
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    def _render_convergence(self, benders_log: BendersLog):
+        """Incumbent, best bound and gap of the master problem from the Gurobi node log"""
+        import pandas as pd
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+
+        progress = benders_log.progress
+        if progress.empty:
+            st.info("Im Log wurde kein Gurobi-Knotenlog gefunden.")
+            return
+
+        last = progress.iloc[-1]
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Bester Zielfunktionswert", f"{last['incumbent']:,.2f}" if pd.notna(last["incumbent"]) else "—")
+        with col2:
+            st.metric("Beste Schranke", f"{last['best_bound']:,.2f}" if pd.notna(last["best_bound"]) else "—")
+        with col3:
+            st.metric("Gap", f"{last['gap']:.4f} %" if pd.notna(last["gap"]) else "—")
+
+        hover = [f"Iteration {iteration}" for iteration in progress["iteration"]]
+        fig = make_subplots(specs=[[{"secondary_y": True}]])
+        fig.add_trace(go.Scattergl(
+            x=progress["time"], y=progress["incumbent"], mode="lines+markers",
+            line_shape="hv", name="Inkumbente", hovertext=hover
+        ), secondary_y=False)
+        fig.add_trace(go.Scattergl(
+            x=progress["time"], y=progress["best_bound"], mode="lines+markers",
+            line_shape="hv", name="Beste Schranke", hovertext=hover
+        ), secondary_y=False)
+        fig.add_trace(go.Scattergl(
+            x=progress["time"], y=progress["gap"], mode="lines",
+            line=dict(dash="dot"), name="Gap", hovertext=hover
+        ), secondary_y=True)
+
+        fig.update_layout(
+            template=CHART_CONFIG["default_theme"],
+            height=CHART_CONFIG["height"]["medium"],
+            xaxis_title="Laufzeit Masterproblem (s)",
+            hovermode="x unified"
+        )
+        fig.update_yaxes(title_text="Zielfunktionswert", secondary_y=False)
+        fig.update_yaxes(title_text="Gap (%)", rangemode="tozero", secondary_y=True)
+        st.plotly_chart(fig, use_container_width=True)
+
+        if not benders_log.incumbents.empty:
+            st.markdown("**Neue Inkumbenten (wahrer Zielfunktionswert laut Cut-Manager)**")
+            st.dataframe(benders_log.incumbents[["iteration", "timestamp", "objective"]].rename(columns={
+                "iteration": "Iteration",
+                "timestamp": "Zeitpunkt",
+                "objective": "Zielfunktionswert"
+            }), hide_index=True, use_container_width=True)
+
+    def _render_artifacts(self, artifacts, timings: Optional[BendersTimings], run_path: Path):
+        """Size of the subproblem files in the temp directory next to their timings"""
+        import pandas as pd
+
+        models = artifacts[artifacts["kind"] == "model"]
+        pre_calc = artifacts[artifacts["kind"] == "pre_calc"]
+        shared = artifacts[artifacts["kind"] == "shared"]
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Subprobleme", f"{models[['building', 'period']].drop_duplicates().shape[0]:,}")
+        with col2:
+            st.metric("Dateien", f"{len(artifacts):,}")
+        with col3:
+            st.metric("Größe gesamt", f"{artifacts['size'].sum() / 1024 ** 2:,.1f} MB")
+
+        stats = None
+        if not models.empty and st.checkbox(
+            "Modellstatistiken der MPS-Dateien einlesen",
+            key="solver_performance_mps_stats",
+            help="Nichtnullen, ganzzahlige Spalten, Schranken und Koeffizientenbereiche; "
+                 "einmal je Dateiversion berechnet und im Temp-Verzeichnis zwischengespeichert"
+        ):
+            with st.spinner("Lese MPS-Dateien..."):
+                stats = self.instance_manager.load_mps_stats(run_path)
+            if stats is not None:
+                models = models.merge(stats[["file", "nonzeros", "integer_columns"]], on="file", how="left")
+
+        if not models.empty:
+            aggregations = dict(
+                depths=("depth", "nunique"),
+                mps_size=("size", "sum"),
+                rows=("rows", "max"),
+                columns=("columns", "max")
+            )
+            if stats is not None:
+                aggregations.update(nonzeros=("nonzeros", "mean"), integer_columns=("integer_columns", "max"))
+            per_subproblem = models.groupby(["building", "period"]).agg(**aggregations).join(
+                pre_calc.groupby(["building", "period"])["size"].sum().rename("pre_calc_size")
+            ).reset_index()
+            per_subproblem["sp_idx"] = [get_sp_idx(b, p) for b, p in zip(per_subproblem["building"], per_subproblem["period"])]
+
+            # Link to the timing rows of the same subproblem
+            if timings is not None and not timings.subproblems.empty:
+                timing_columns = [column for column in ("sp_idx", "num_calls", "total_time", "avg_time",
+                                                        "avg_model_load_time", "avg_optimization_time")
+                                  if column in timings.subproblems.columns]
+                per_subproblem = per_subproblem.merge(timings.subproblems[timing_columns], on="sp_idx", how="left")
+
+            per_subproblem = per_subproblem.sort_values("mps_size", ascending=False)
+            per_subproblem["mps_size"] = per_subproblem["mps_size"] / 1024 ** 2
+            per_subproblem["pre_calc_size"] = per_subproblem["pre_calc_size"] / 1024 ** 2
+
+            st.markdown("**Subprobleme nach Modellgröße**")
+            columns = {
+                "sp_idx": "Subproblem (Gebäude, Periode)",
+                "depths": "Varianten (d)",
+                "mps_size": "MPS gesamt (MB)",
+                "pre_calc_size": "pre_calc gesamt (MB)",
+                "rows": "Max. Zeilen",
+                "columns": "Max. Spalten",
+                "nonzeros": "Ø Nichtnullen",
+                "integer_columns": "Ganzzahlige Spalten",
+                "num_calls": "Aufrufe",
+                "total_time": "Gesamtzeit (s)",
+                "avg_time": "Ø Zeit (s)",
+                "avg_model_load_time": f"Ø {JOB_PHASE_LABELS['model_load_time']} (s)",
+                "avg_optimization_time": f"Ø {JOB_PHASE_LABELS['optimization_time']} (s)"
+            }
+            st.dataframe(
+                per_subproblem[[column for column in columns if column in per_subproblem.columns]].rename(columns=columns),
+                hide_index=True,
+                use_container_width=True
+            )
+
+            if stats is not None and "avg_optimization_time" in per_subproblem.columns:
+                self._render_size_vs_time(per_subproblem)
+
+        if stats is not None:
+            with st.expander("MPS-Statistiken je Datei"):
+                st.dataframe(stats.drop(columns=["mtime_ns", "version"]), hide_index=True, use_container_width=True)
+
+        with st.expander(f"Alle Dateien ({len(artifacts)})"):
+            files = artifacts.assign(
+                size=artifacts["size"] / 1024 ** 2,
+                modified=pd.to_datetime(artifacts["mtime_ns"], unit="ns")
+            )
+            st.dataframe(files[["file", "kind", "depth", "size", "rows", "columns", "modified"]].rename(columns={
+                "file": "Datei",
+                "kind": "Art",
+                "depth": "d",
+                "size": "Größe (MB)",
+                "rows": "Zeilen",
+                "columns": "Spalten",
+                "modified": "Geändert"
+            }), hide_index=True, use_container_width=True)
+
+        if not shared.empty:
+            st.caption("Gemeinsame Dateien: " + ", ".join(
+                f"{name} ({size / 1024:,.0f} KB)" for name, size in zip(shared["file"], shared["size"])
+            ))
+
+    def _render_size_vs_time(self, per_subproblem):
+        """Average model load and optimization time per subproblem over its number of nonzeros"""
+        import pandas as pd
+        import plotly.graph_objects as go
+
+        fig = go.Figure()
+        correlations = []
+        for phase in ("optimization_time", "model_load_time"):
+            column = f"avg_{phase}"
+            fig.add_trace(go.Scatter(
+                x=per_subproblem["nonzeros"], y=per_subproblem[column],
+                mode="markers", name=JOB_PHASE_LABELS[phase],
+                marker=dict(color=JOB_PHASE_COLORS[phase], size=9),
+                text=per_subproblem["sp_idx"],
+                hovertemplate="SP %{text}<br>%{x:,.0f} Nichtnullen<br>%{y:.4f} s"
+            ))
+            correlation = per_subproblem["nonzeros"].corr(per_subproblem[column])
+            if pd.notna(correlation):
+                correlations.append(f"{JOB_PHASE_LABELS[phase]}: r = {correlation:.2f}")
+
+        fig.update_layout(
+            title="Modellgröße und Laufzeit je Subproblem",
+            template=CHART_CONFIG["default_theme"],
+            height=CHART_CONFIG["height"]["medium"],
+            xaxis_title="Ø Nichtnullen der MPS-Dateien",
+            yaxis_title="Ø Zeit je Aufruf (s)"
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        if correlations:
+            st.caption("Korrelation (Pearson) mit der Anzahl Nichtnullen: " + ", ".join(correlations))
+
+    def _render_live(self, run_path: Path):
+        """Live view of a running job, updated by a fragment without rerunning the page"""
+        monitor = self.instance_manager.get_run_monitor(run_path)
+        if monitor is None:
+            st.error("Der Live-Modus konnte für diesen Lauf nicht gestartet werden.")
+            return
+
+        @st.fragment(run_every=LIVE_TAIL_INTERVAL)
+        def live_panel():
+            # Sessions watching the same run share the monitor and its reads
+            monitor.update(min_interval=LIVE_TAIL_INTERVAL / 2)
+            benders_log = monitor.benders.log
+            if benders_log.progress.empty and not monitor.run.log.progress.empty:
+                benders_log = monitor.run.log
+
+            last_change = (
+                time.strftime("%H:%M:%S", time.localtime(monitor.last_change)) if monitor.last_change else "—"
+            )
+            st.caption(
+                f"Aktualisierung alle {LIVE_TAIL_INTERVAL:g} s · letzte neue Daten: {last_change} · "
+                f"seit Start des Live-Modus gelesen: {(monitor.benders.bytes_read + monitor.run.bytes_read) / 1024:,.1f} KB"
+            )
+
+            iteration = monitor.benders.log.state.get("iteration", -1)
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Aktuelle Iteration", iteration if iteration >= 0 else "—")
+            with col2:
+                st.metric("Hinzugefügte Schnitte", f"{int(monitor.benders.log.cuts['count'].sum()):,}")
+
+            self._render_convergence(benders_log)
+            if not monitor.benders.log.cuts.empty:
+                self._render_cuts_chart(monitor.benders.log)
+            self._render_stragglers(monitor.timings)
+
+            for label, tail in (("benders.log", monitor.benders), ("run.log", monitor.run)):
+                if tail.log.offset:
+                    with st.expander(f"Letzte Zeilen von {label}"):
+                        st.code("\n".join(tail.get_last_lines(30)), language=None)
+
+        live_panel()
+
+    def _render_stragglers(self, timings: Optional[BendersTimings]):
+        """Slowest subproblem of the most recent iterations"""
+        if timings is None or timings.num_iterations == 0:
+            st.caption("`iteration_timings.json` liegt noch nicht vor, Subproblem-Laufzeiten folgen sobald der Lauf sie schreibt.")
+            return
+
+        st.markdown("**Langsamste Subprobleme der letzten Iterationen**")
+        recent = timings.iterations.tail(10).iloc[::-1]
+        st.dataframe(recent[[
+            "iteration", "max_job_time", "max_job_sp_idx", "max_job_subprocess_idx", "max_job_slowest_phase", "median_job_time"
+        ]].rename(columns={
+            "iteration": "Iteration",
+            "max_job_time": "Max. Jobzeit (s)",
+            "max_job_sp_idx": "Langsamstes SP",
+            "max_job_subprocess_idx": "Subprozess",
+            "max_job_slowest_phase": "Langsamste Phase",
+            "median_job_time": "Median Jobzeit (s)"
+        }), hide_index=True, use_container_width=True)
@@ -0,0 +1,172 @@
+"""
+Clustered time series explorer page
+"""
+import streamlit as st
+from typing import Optional
+
+from core.instance_manager import InstanceManager
+from core.data_models import InstanceMetadata
+from core.preprocessed_data import ColumnarTable, PreprocessedStore
+from config.app_config import TIMESERIES_MAX_POINTS
+from config.visualization_config import CHART_CONFIG
+from config.translations import get_timeseries_translation, get_technology_translation
+from utils.downsampling import downsample
+
+# Tables of the clustered_ts files holding the time series
+TIMESERIES_PREFIX = "timeseries/"
+
+class TimeseriesExplorerPage:
+    """Page for the clustered typical-day time series of the preprocessing"""
+
+    def __init__(self, instance_manager: InstanceManager):
+        self.instance_manager = instance_manager
+
+    def render(self, selected_instance: Optional[InstanceMetadata] = None):
+        """Render the time series explorer page"""
+
+        st.header("Zeitreihen")
+        st.markdown("Geclusterte Typtag-Zeitreihen (Bedarfe, Solarstrahlung, Temperatur) je Gebäude aus der Vorverarbeitung.")
+
+        if not selected_instance:
+            st.warning("Bitte wählen Sie eine Instanz aus der Seitenleiste, um die Zeitreihen anzuzeigen.")
+            return
+
+        files = self.instance_manager.get_clustered_timeseries_files(selected_instance)
+        if not files:
+            st.info("Keine geclusterten Zeitreihen (data/preprocessed/clustered_ts) für diese Instanz gefunden.")
+            return
+
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            building_id = st.selectbox(
+                "Gebäude:",
+                list(files),
+                format_func=lambda b: f"Gebäude {b}",
+                key="timeseries_building"
+            )
+
+        # Only the file of the selected building is opened (memory-mapped)
+        with st.spinner("Lade Zeitreihen..."):
+            store = self.instance_manager.load_preprocessed_data(files[building_id])
+
+        if store is None:
+            st.error("Die Zeitreihen konnten nicht geladen werden.")
+            return
+
+        series_names = [name for name in store.table_names if name.startswith(TIMESERIES_PREFIX)]
+        if not series_names:
+            st.info("Die Datei enthält keine Zeitreihen.")
+            return
+
+        with col2:
+            selected_series = st.multiselect(
+                "Zeitreihen:",
+                series_names,
+                default=series_names,
+                format_func=lambda name: get_timeseries_translation(name[len(TIMESERIES_PREFIX):]),
+                key="timeseries_series"
+            )
+
+        max_points = TIMESERIES_MAX_POINTS
+        if st.session_state.get('advanced_view', False):
+            max_points = st.slider("Max. Punkte je Zeitreihe (Downsampling)", 200, 20000, TIMESERIES_MAX_POINTS, step=200)
+
+        self._render_typical_days(store, building_id)
+
+        for name in selected_series:
+            self._render_series(store.get_table(name), building_id, max_points)
+
+    def _render_typical_days(self, store: PreprocessedStore, building_id: int):
+        """Selected days of the year and weights of the typical days"""
+        if "selected_days" not in store or "w_b_d" not in store:
+            return
+
+        import pandas as pd
+
+        selected_days = store.get("selected_days").get(building_id, [])
+        # Only the rows of the selected building are read from the weights table
+        weights = {day: weight for (building, day), weight in store.get("w_b_d", partition=building_id).items() if building == building_id}
+        if not weights:
+            return
+
+        with st.expander(f"Typtage ({len(weights)})"):
+            st.dataframe(pd.DataFrame({
+                "Typtag": list(weights),
+                "Tag im Jahr": [int(selected_days[day]) + 1 if day < len(selected_days) else None for day in weights],
+                "Gewicht (Tage)": [int(weight) for weight in weights.values()]
+            }), hide_index=True, use_container_width=True)
+
+    def _render_series(self, table: ColumnarTable, building_id: int, max_points: int):
+        """Plot one time series table, one trace per variant (e.g. orientation, envelope state)"""
+        import numpy as np
+        import plotly.graph_objects as go
+
+        if building_id in table.partitions:
+            table = table.slice(building_id)
+
+        frame = table.to_frame()
+        key_columns = [column for column in frame.columns if column.startswith("key_")]
+        if table.partition_column is not None:
+            key_columns.remove(f"key_{table.partition_column}")
+
+        # The last two integer keys are typical day and time step, everything before is a variant
+        time_columns = [column for column in key_columns[-2:] if np.issubdtype(frame[column].dtype, np.integer)]
+        variant_columns = [column for column in key_columns if column not in time_columns]
+
+        if len(time_columns) == 2:
+            day_column, step_column = time_columns
+            steps_per_day = int(frame[step_column].max()) + 1
+            frame["x"] = frame[day_column] * steps_per_day + frame[step_column]
+        else:
+            day_column, steps_per_day = None, None
+            frame["x"] = frame[time_columns[-1]] if time_columns else np.arange(len(frame))
+
+        title = get_timeseries_translation(table.name[len(TIMESERIES_PREFIX):])
+        fig = go.Figure()
+        total_points, shown_points = 0, 0
+
+        groups = frame.groupby(variant_columns, sort=False) if variant_columns else [((), frame)]
+        for variant, group in groups:
+            group = group.sort_values("x")
+            x, y = downsample(group["x"].to_numpy(), group["value"].to_numpy(), max_points)
+            total_points += len(group)
+            shown_points += len(x)
+            fig.add_trace(go.Scattergl(
+                x=x,
+                y=y,
+                mode="lines",
+                name=self._format_variant(variant) or title
+            ))
+
+        # Mark the borders between the typical days
+        if day_column is not None:
+            num_days = int(frame[day_column].max()) + 1
+            if num_days <= 50:
+                for day in range(1, num_days):
+                    fig.add_vline(x=day * steps_per_day - 0.5, line_width=1, line_dash="dot", line_color="lightgray")
+
+        fig.update_layout(
+            title=title,
+            xaxis_title="Zeitschritt (Typtage aneinandergereiht)",
+            template=CHART_CONFIG["default_theme"],
+            height=CHART_CONFIG["height"]["medium"],
+            showlegend=len(fig.data) > 1,
+            hovermode="x unified"
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+        if shown_points < total_points:
+            st.caption(f"Downsampling: {shown_points:,} von {total_points:,} Punkten dargestellt (Min/Max-LTTB)")
+
+    @staticmethod
+    def _format_variant(variant) -> str:
+        """Legend label of a variant key (e.g. ('wall_1', 'roof_2', 'win_3') or an orientation index)"""
+        if not isinstance(variant, tuple):
+            variant = (variant,)
+        parts = []
+        for value in variant:
+            if isinstance(value, tuple):
+                parts.append(" / ".join(get_technology_translation(str(item)) for item in value))
+            else:
+                parts.append(str(value))
+        return ", ".join(parts)
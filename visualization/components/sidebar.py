@@ -27,6 +27,9 @@ class Sidebar:
                 [
                     "Portfolio-Übersicht",
                     "Optimierungsergebnisse", 
+                    "Zeitreihen",
+                    "Solver-Performance",
+                    "IIS-Analyse",
                     "Neues Portfolio"
                 ],
                 key="navigation_radio"
@@ -18,6 +18,53 @@ INSTANCES_PATH = DATA_PATH / "instances"
 
 # File patterns
 SOLUTION_FILE_PATTERN = "*.sol"
+
+# Directory next to a .sol file holding its parsed binary cache
+SOLUTION_CACHE_DIRNAME = ".optiport_cache"
+
+# Per-instance file with discovery metadata and validation status (see core/instance_manifest.py)
+INSTANCE_MANIFEST_FILE = "instance_manifest.json"
+
+# Parsed solutions kept in memory across reruns and sessions
+SOLUTION_MEMORY_CACHE_SIZE = 4
+
+# Instance pickles (<use case>.pkl) kept in memory, see core/instance_data.py
+INSTANCE_DATA_CACHE_SIZE = 4
+
+# Opened preprocessed data (memory-mapped, see core/preprocessed_data.py) kept in memory
+PREPROCESSED_DATA_CACHE_SIZE = 16
+
+# Loaded Benders run logs (timings, log tables) kept in memory
+BENDERS_DATA_CACHE_SIZE = 8
+
+# Parsed IIS files (.ilp) kept in memory, see core/iis_reader.py
+IIS_DATA_CACHE_SIZE = 4
+
+# Live view of running Benders jobs: seconds between updates of the followed log files
+LIVE_TAIL_INTERVAL = 2.0
+
+# Benders runs followed by the live view at the same time (the least recently used is dropped)
+RUN_MONITOR_CACHE_SIZE = 8
+
+# Points per trace above which time series are downsampled before plotting
+TIMESERIES_MAX_POINTS = 2000
+
+# Background watcher over the instance directories (see core/instance_watcher.py)
+INSTANCE_WATCHER_ENABLED = False
+INSTANCE_WATCHER_POLL_INTERVAL = 2.0  # seconds, polling interval or batching delay with watchdog
+
+# Threads scanning instance directories in parallel (1 = serial) and time allowed per directory
+INSTANCE_SCAN_WORKERS = 8
+INSTANCE_SCAN_TIMEOUT = 10.0  # seconds, counted from the start of each directory scan
+
+# Worker processes for parsing large solution files (1 = parse in the app process)
+SOLUTION_PARSER_WORKERS = 1
+
+# Worker processes reading the statistics of Benders subproblem MPS files (1 = in the app process)
+MPS_STATS_WORKERS = 4
+
+# Threads reading the processed_results JSON files of a Benders run (1 = serial)
+PROCESSED_RESULTS_WORKERS = 8
 INSTANCE_CONFIG_FILES = [
     "building_constraints.csv",
     "financial_properties.csv", 
@@ -27,6 +74,9 @@ INSTANCE_CONFIG_FILES = [
     "stock_properties.csv"
 ]
 
+# Directories of an instance searched for the config files, relative to the instance (first match wins)
+INSTANCE_CONFIG_DIRS = [".", "data/input"]
+
 # Variable categories for MILP solution 
 VARIABLE_CATEGORIES = {
     "X": "Binäre Installationsentscheidungen",
@@ -47,6 +97,13 @@ TECHNOLOGY_CATEGORIES = {
     "Anschlüsse": ["_connection"]
 }
 
+# Leading indices of IIS constraint families that are not indexed by (building, period, ...)
+IIS_INDEX_LAYOUT = {
+    "liquidity_balance": ("period",),
+    "debt_balance": ("period",),
+    "minimum_liquidity_constraint": ("period",),
+}
+
 # Color schemes for visualizations
 COLOR_SCHEMES = {
     "technology": {
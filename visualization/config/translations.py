@@ -163,6 +163,49 @@ TECHNOLOGY_TRANSLATIONS = {
     'battery': 'Batterie'
 }
 
+# Clustered time series of the preprocessing (data/preprocessed/clustered_ts)
+TIMESERIES_TRANSLATIONS = {
+    'p_el': 'Strombedarf',
+    'p_dhw': 'Warmwasserbedarf',
+    'p_heat': 'Heizlast',
+    't_air': 'Außentemperatur (°C)',
+    'g': 'Solarstrahlung'
+}
+
+# Result metrics (processed results of Benders runs and metrics derived from the solution)
+METRIC_TRANSLATIONS = {
+    'costs_investment': 'Investitionskosten',
+    'costs_operational': 'Betriebskosten',
+    'costs_total': 'Gesamtkosten',
+    'emissions_embodied': 'Graue Emissionen',
+    'emissions_operational': 'Betriebsemissionen',
+    'emissions_total': 'Gesamtemissionen',
+    'thermal_demand': 'Wärmebedarf',
+    'measure_adoption_count': 'Anzahl umgesetzter Maßnahmen',
+    'capacity_installed_total': 'Installierte Kapazität',
+    'capacity_available_total': 'Verfügbare Kapazität',
+    'capacity_installed_count': 'Anzahl Installationen',
+    'capacity_available_count': 'Anzahl verfügbarer Anlagen',
+    'total_buildings': 'Anzahl Gebäude',
+    'yearly_rental_income': 'Jährliche Mieteinnahmen',
+    'credit_repayment': 'Tilgung',
+    'credit_interest': 'Zinszahlungen',
+    'credit_payment': 'Kreditzahlungen',
+    'pre_credit_payment': 'Zahlungen für Bestandskredite',
+    'bonus_costs': 'Bonuserträge',
+    'total_investment_measures': 'Investitionsmaßnahmen',
+    'CO2_costs': 'CO2-Kosten',
+    'subsidies': 'Förderungen',
+    'inspection_measure_costs': 'Inspektionskosten',
+    'C_rent': 'Kaltmiete',
+    'C_en': 'Energiekosten',
+    'C_mod': 'Modernisierungsumlage',
+    'C_mod_heat': 'Modernisierungsumlage Heizung',
+    'F_en': 'Energieverbrauch',
+    'total_investment_measures_building': 'Investitionsmaßnahmen je Gebäude',
+    'subsidies_building': 'Förderungen je Gebäude'
+}
+
 def get_column_translation(column_name):
     """Get German translation for a column name"""
     return COLUMN_TRANSLATIONS.get(column_name, column_name)
@@ -176,4 +219,12 @@ def get_technology_translation(tech_name):
     # Special case for None values - return just the dash character
     if tech_name is None or tech_name.lower() == 'none' or tech_name.strip() == '':
         return '—'  # Unicode em dash
-    return TECHNOLOGY_TRANSLATIONS.get(tech_name, tech_name)
\ No newline at end of file
+    return TECHNOLOGY_TRANSLATIONS.get(tech_name, tech_name)
+
+def get_timeseries_translation(series_name):
+    """Get German translation for a clustered time series name"""
+    return TIMESERIES_TRANSLATIONS.get(series_name, series_name)
+
+def get_metric_translation(metric_name):
+    """Get German translation for a result metric name"""
+    return METRIC_TRANSLATIONS.get(metric_name, metric_name)
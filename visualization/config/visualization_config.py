@@ -32,3 +32,42 @@ EXPORT_CONFIG = {
     "default_width": 1200,
     "default_height": 800
 }
+
+# Benders job phases (see core/benders_timings.py): labels and colors
+JOB_PHASE_LABELS = {
+    "model_load_time": "Modell laden",
+    "variable_fixing_time": "Variablen fixieren",
+    "optimization_time": "Optimierung",
+    "status_handling_time": "Status-Behandlung",
+    "dual_collection_time": "Duale sammeln"
+}
+
+JOB_PHASE_COLORS = {
+    "model_load_time": "#9B59B6",
+    "variable_fixing_time": "#F39C12",
+    "optimization_time": "#3498DB",
+    "status_handling_time": "#E74C3C",
+    "dual_collection_time": "#1ABC9C"
+}
+
+# Benders cuts from benders.log, keyed by "<solution> / <cut type>" (see BendersLog.get_cuts_per_iteration)
+CUT_KIND_LABELS = {
+    "integral / feasibility": "Zulässigkeitsschnitte (ganzzahlig)",
+    "integral / optimality": "Optimalitätsschnitte (ganzzahlig)",
+    "fractional / feasibility": "Zulässigkeitsschnitte (fraktional)",
+    "fractional / optimality": "Optimalitätsschnitte (fraktional)"
+}
+
+CUT_KIND_COLORS = {
+    "integral / feasibility": "#E74C3C",
+    "integral / optimality": "#3498DB",
+    "fractional / feasibility": "#F5B7B1",
+    "fractional / optimality": "#AED6F1"
+}
+
+# Subprocess timeline: above max_segments job phases are aggregated into time bins
+TIMELINE_CONFIG = {
+    "max_segments": 20000,
+    "bins": 500,
+    "lane_width": 14
+}
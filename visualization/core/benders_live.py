@@ -0,0 +1,85 @@
+"""
+Live view of running Benders jobs
+
+BendersRunMonitor follows logging/benders.log and logging/run.log of a run with LogTail
+(only the bytes appended since the last update are parsed) and reloads
+logging/iteration_timings.json when its stamp changes. The timing file starts with the
+summary and is written as a whole, so it cannot be continued from an offset; while it
+is incomplete the previous tables are kept.
+"""
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+import logging
+
+from .benders_log import LogTail, LOG_FILE, load_benders_log
+from .benders_timings import BendersTimings, TIMINGS_FILE, load_benders_timings
+
+logger = logging.getLogger(__name__)
+
+RUN_LOG_FILE = Path("logging") / "run.log"
+
+
+class BendersRunMonitor:
+    """Log tails and timing tables of one Benders run, shared by all sessions watching it"""
+
+    def __init__(self, run_path: Path):
+        self.run_path = Path(run_path)
+        self.benders = self._create_tail(self.run_path / LOG_FILE)
+        self.run = self._create_tail(self.run_path / RUN_LOG_FILE)
+        self.timings: Optional[BendersTimings] = None
+        self._timings_stamp: Optional[Tuple[int, int]] = None
+        self.last_update = 0.0  # time.monotonic() of the last update
+        self.last_change: Optional[float] = None  # time.time() of the last update that found new data
+        self._lock = threading.Lock()
+
+    def update(self, min_interval: float = 0.0) -> bool:
+        """Read what the run wrote since the last update, returns True if anything changed
+
+        Updates closer than `min_interval` seconds to the previous one are skipped, so
+        several sessions polling the same run do not read the files more often.
+        """
+        with self._lock:
+            if time.monotonic() - self.last_update < min_interval:
+                return False
+
+            changed = self.benders.update()
+            changed = self.run.update() or changed
+            changed = self._update_timings() or changed
+
+            self.last_update = time.monotonic()
+            if changed:
+                self.last_change = time.time()
+            return changed
+
+    def _update_timings(self) -> bool:
+        file_path = self.run_path / TIMINGS_FILE
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            return False
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self._timings_stamp:
+            return False
+        try:
+            self.timings = load_benders_timings(file_path)
+        except (OSError, ValueError) as e:
+            # Still being written, try again with the next update
+            logger.debug(f"Could not read {file_path} yet: {e}")
+            return False
+        self._timings_stamp = stamp
+        return True
+
+    @staticmethod
+    def _create_tail(log_path: Path) -> LogTail:
+        """Tail starting from the persisted index of the log (see load_benders_log)"""
+        if not log_path.exists():
+            return LogTail(log_path)
+        try:
+            return LogTail(log_path, load_benders_log(log_path))
+        except Exception as e:
+            # The tail reads the log from the start with its first update instead
+            logger.warning(f"Could not load {log_path}, following it from the start: {e}")
+            return LogTail(log_path)
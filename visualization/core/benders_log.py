@@ -0,0 +1,449 @@
+"""
+Indexed parser for the Benders log (results/<run>/logging/benders.log)
+
+The log interleaves our logger lines
+    2026-01-23 14:55:37 | INFO     | MainProcess     | benders_cut_manager            | Iteration 1 -- ...
+with the Gurobi output of the master problem (node log and final summary). The file is
+parsed in one streaming pass into flat tables:
+
+- cuts: one row per added Benders cut (fractional iterations only report counts,
+  they get one row per cut type with `count` set and building/SP/violation empty)
+- progress: the Gurobi node log rows with incumbent, best bound and gap
+- incumbents: new incumbents reported by the cut manager with their true objective
+- iterations: byte offset of the first log line of every Benders iteration
+
+The tables are persisted in SOLUTION_CACHE_DIRNAME/log_<name>/ next to the log together
+with the byte offset up to which the file was parsed and the parser state at that
+offset. Reloading an unchanged log only reads the stored tables, a grown log is parsed
+from the stored offset and the new rows are added as another segment. A log that was
+rotated or rewritten (shorter or with a different beginning) is parsed again.
+"""
+import hashlib
+import json
+import os
+import pickle
+import re
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+
+from config.app_config import SOLUTION_CACHE_DIRNAME
+
+logger = logging.getLogger(__name__)
+
+LOG_FILE = Path("logging") / "benders.log"
+
+INDEX_FILE = "index.json"
+
+# Increment when the parsed tables or the index layout change
+LOG_INDEX_VERSION = 1
+
+# Bytes at the beginning of the log used to recognize a rotated or rewritten file
+HEAD_SIZE = 4096
+
+# Segments are merged into one once there are more of them
+MAX_SEGMENTS = 32
+
+# Columns of the parsed tables, integer columns use -1 for "not given"
+TABLE_COLUMNS = {
+    "cuts": ["offset", "timestamp", "process", "module", "iteration", "solution", "cut_type",
+             "aggregated", "building", "sp_building", "sp_period", "violation", "count"],
+    "progress": ["offset", "timestamp", "iteration", "marker", "explored", "unexplored",
+                 "incumbent", "best_bound", "gap", "time"],
+    "incumbents": ["offset", "timestamp", "iteration", "objective"],
+    "iterations": ["iteration", "offset"],
+}
+
+LOG_LINE = re.compile(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) \| (\w+)\s*\| (\S+)\s*\| (\S+)\s*\| (.*)$")
+ITERATION_PREFIX = re.compile(r"^Iteration (\d+) -- ")
+CUT_MESSAGE = re.compile(
+    r"^(Integral|Fractional): Added Benders (feasibility|optimality) cut for building (\d+) "
+    r"\(SP \((\d+), (\d+)\)\), violation: (\S+)$"
+)
+AGGREGATED_CUT_MESSAGE = re.compile(
+    r"^(Integral|Fractional): Added single Benders (feasibility|optimality) cut as aggregated cut for SP \((\d+), (\d+)\)"
+)
+CUT_COUNT_MESSAGE = re.compile(r"^(Integral|Fractional): Feasibility cuts added: (\d+), optimality cuts added: (\d+)")
+INCUMBENT_MESSAGE = re.compile(r"^Found new incumbent with true objective (\S+)")
+
+# Gurobi node log: marker, explored, unexplored, ..., incumbent, best bound, gap, it/node, time
+NODE_LINE = re.compile(r"^([H*]?)\s*(\d+)\s+(\d+)\s+.*?(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\d+)s$")
+NODE_LOG_END = re.compile(r"^Explored (\d+) nodes .* in ([\d.]+) seconds")
+BEST_OBJECTIVE = re.compile(r"^Best objective (\S+), best bound (\S+), gap (\S+)%")
+
+
+@dataclass
+class BendersLog:
+    """Tables parsed from a benders.log up to `offset`"""
+    cuts: pd.DataFrame = field(default_factory=lambda: _empty_table("cuts"))
+    progress: pd.DataFrame = field(default_factory=lambda: _empty_table("progress"))
+    incumbents: pd.DataFrame = field(default_factory=lambda: _empty_table("incumbents"))
+    iterations: pd.DataFrame = field(default_factory=lambda: _empty_table("iterations"))
+    offset: int = 0
+    state: Dict[str, Any] = field(default_factory=dict)  # parser state at `offset`
+
+    @property
+    def num_iterations(self) -> int:
+        return len(self.iterations)
+
+    def get_cuts_per_iteration(self) -> pd.DataFrame:
+        """Number of added cuts per iteration (index) and solution/cut type (columns)"""
+        if self.cuts.empty:
+            return pd.DataFrame()
+        cuts = self.cuts.assign(kind=self.cuts["solution"] + " / " + self.cuts["cut_type"])
+        return cuts.pivot_table(index="iteration", columns="kind", values="count", aggfunc="sum", fill_value=0)
+
+    def extend(self, tables: Dict[str, pd.DataFrame], offset: int, state: Dict[str, Any]) -> "BendersLog":
+        """New BendersLog with the records parsed from `self.offset` to `offset` appended"""
+        combined = _concat_tables([self.get_tables(), tables])
+        return BendersLog(**combined, offset=offset, state=state)
+
+    def get_tables(self) -> Dict[str, pd.DataFrame]:
+        return {name: getattr(self, name) for name in TABLE_COLUMNS}
+
+    def get_iteration_span(self, iteration: int) -> Optional[Tuple[int, int]]:
+        """Byte range of the log lines of an iteration (up to the next iteration), None if unknown"""
+        offsets = self.iterations.set_index("iteration")["offset"]
+        if iteration not in offsets.index:
+            return None
+        later = offsets[offsets.index > iteration]
+        return int(offsets[iteration]), int(later.min()) if not later.empty else self.offset
+
+
+class BendersLogParser:
+    """Streaming parser of benders.log
+
+    The parser state (last timestamp, current iteration, inside a Gurobi node log)
+    is kept between calls, so a grown file can be continued from the last offset.
+    """
+
+    def __init__(self, state: Optional[Dict[str, Any]] = None):
+        state = state or {}
+        self.timestamp: Optional[str] = state.get("timestamp")
+        self.iteration: int = state.get("iteration", -1)
+        self.in_node_log: bool = state.get("in_node_log", False)
+        self.solve_time: Optional[float] = state.get("solve_time")
+        self.columns: Dict[str, Dict[str, list]] = {}
+        self._reset_columns()
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        return {
+            "timestamp": self.timestamp,
+            "iteration": self.iteration,
+            "in_node_log": self.in_node_log,
+            "solve_time": self.solve_time
+        }
+
+    def parse(self, f: BinaryIO, offset: int) -> Tuple[Dict[str, pd.DataFrame], int]:
+        """Parse the complete lines of a binary file from `offset`
+
+        Returns the tables of the new records and the offset after the last complete
+        line. A last line without newline is still being written and left for the
+        next call.
+        """
+        self._reset_columns()
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            self.parse_line(line.decode('utf-8', errors='replace').rstrip("\r\n"), offset)
+            offset += len(line)
+        return self.build(), offset
+
+    def parse_line(self, line: str, offset: int):
+        """Add the records of one log line (without line break) starting at byte `offset`"""
+        match = LOG_LINE.match(line)
+        if match:
+            self._parse_logger_line(match, offset)
+            return
+
+        if self.in_node_log:
+            node = NODE_LINE.match(line.strip())
+            if node:
+                marker, explored, unexplored, incumbent, best_bound, gap, _, time = node.groups()
+                self._add_progress(offset, marker, int(explored), int(unexplored),
+                                   incumbent, best_bound, gap.rstrip("%"), float(time))
+                return
+            end = NODE_LOG_END.match(line)
+            if end:
+                self.in_node_log = False
+                self.solve_time = float(end.group(2))
+        elif "Expl Unexpl" in line:
+            self.in_node_log = True
+            return
+
+        best = BEST_OBJECTIVE.match(line)
+        if best:
+            self._add_progress(offset, "final", -1, -1, *best.groups(), self.solve_time)
+
+    def build(self) -> Dict[str, pd.DataFrame]:
+        """Tables of the records parsed since the last call of parse"""
+        return {name: _build_table(name, columns) for name, columns in self.columns.items()}
+
+    def _reset_columns(self):
+        self.columns = {name: {column: [] for column in columns} for name, columns in TABLE_COLUMNS.items()}
+
+    def _parse_logger_line(self, match: re.Match, offset: int):
+        timestamp, _, process, module, message = match.groups()
+        self.timestamp = timestamp
+
+        prefix = ITERATION_PREFIX.match(message)
+        if not prefix:
+            return
+        iteration = int(prefix.group(1))
+        if iteration != self.iteration:
+            self.iteration = iteration
+            self._append("iterations", iteration=iteration, offset=offset)
+        message = message[prefix.end():]
+
+        common = dict(offset=offset, timestamp=timestamp, process=process, module=module, iteration=iteration)
+        cut = CUT_MESSAGE.match(message)
+        if cut:
+            solution, cut_type, building, sp_building, sp_period, violation = cut.groups()
+            self._append("cuts", **common, solution=solution.lower(), cut_type=cut_type, aggregated=False,
+                         building=int(building), sp_building=int(sp_building), sp_period=int(sp_period),
+                         violation=_to_float(violation), count=1)
+            return
+
+        cut = AGGREGATED_CUT_MESSAGE.match(message)
+        if cut:
+            solution, cut_type, sp_building, sp_period = cut.groups()
+            self._append("cuts", **common, solution=solution.lower(), cut_type=cut_type, aggregated=True,
+                         building=int(sp_building), sp_building=int(sp_building), sp_period=int(sp_period),
+                         violation=np.nan, count=1)
+            return
+
+        counts = CUT_COUNT_MESSAGE.match(message)
+        if counts:
+            solution, feasibility, optimality = counts.groups()
+            for cut_type, count in (("feasibility", feasibility), ("optimality", optimality)):
+                if int(count):
+                    self._append("cuts", **common, solution=solution.lower(), cut_type=cut_type, aggregated=False,
+                                 building=-1, sp_building=-1, sp_period=-1, violation=np.nan, count=int(count))
+            return
+
+        incumbent = INCUMBENT_MESSAGE.match(message)
+        if incumbent:
+            self._append("incumbents", offset=offset, timestamp=timestamp, iteration=iteration,
+                         objective=_to_float(incumbent.group(1)))
+
+    def _add_progress(self, offset: int, marker: str, explored: int, unexplored: int,
+                      incumbent: str, best_bound: str, gap: str, time: Optional[float]):
+        self._append("progress", offset=offset, timestamp=self.timestamp, iteration=self.iteration,
+                     marker=marker, explored=explored, unexplored=unexplored, incumbent=_to_float(incumbent),
+                     best_bound=_to_float(best_bound), gap=_to_float(gap),
+                     time=time if time is not None else np.nan)
+
+    def _append(self, table: str, **values):
+        for column, items in self.columns[table].items():
+            items.append(values[column])
+
+
+def get_log_index_path(log_path: Path) -> Path:
+    """Directory of the parsed tables and byte-offset index of a log file"""
+    log_path = Path(log_path)
+    return log_path.parent / SOLUTION_CACHE_DIRNAME / f"log_{log_path.stem}"
+
+
+def load_benders_log(log_path: Path) -> BendersLog:
+    """Tables of a benders.log, parsing only what was added since the last call"""
+    log_path = Path(log_path)
+    index_path = get_log_index_path(log_path)
+    try:
+        index = _read_index(log_path, index_path)
+        tables = [_read_segment(index_path / segment["file"]) for segment in index["segments"]] if index else []
+    except Exception as e:
+        # A damaged index or segment only costs a full parse
+        logger.warning(f"Could not read log index {index_path}, parsing {log_path} again: {e}")
+        index = None
+
+    if index is None:
+        index = {"offset": 0, "state": {}, "segments": []}
+        tables = []
+
+    start = index["offset"]
+    if log_path.stat().st_size > start:
+        parser = BendersLogParser(index["state"])
+        with open(log_path, 'rb') as f:
+            new_tables, offset = parser.parse(f, start)
+        if offset > start:
+            tables.append(new_tables)
+            index = _store_segment(log_path, index_path, index, new_tables, offset, parser.state, tables)
+            logger.info(f"Parsed {offset - start} bytes of {log_path} from offset {start} "
+                        f"({len(new_tables['cuts'])} cut records, {len(new_tables['progress'])} node log rows)")
+
+    return BendersLog(**_concat_tables(tables), offset=index["offset"], state=index["state"])
+
+
+class LogTail:
+    """Follows a growing log file for the live view of running jobs
+
+    Every update parses only the bytes appended since the last one and appends the
+    new records to the in-memory tables. A rotated or rewritten file is read again
+    from the start.
+    """
+
+    def __init__(self, log_path: Path, benders_log: Optional[BendersLog] = None):
+        self.log_path = Path(log_path)
+        self.log = benders_log or BendersLog()
+        self.bytes_read = 0  # bytes parsed by update(), without the initial load
+        self.head = _hash_head(self.log_path, self.log.offset) if self.log.offset else None
+
+    def update(self) -> bool:
+        """Parse the lines appended since the last call, returns True if the offset moved"""
+        try:
+            size = self.log_path.stat().st_size
+        except FileNotFoundError:
+            return False
+        if size == self.log.offset:
+            return False
+
+        if size < self.log.offset or (self.log.offset and _hash_head(self.log_path, self.log.offset) != self.head):
+            logger.info(f"{self.log_path} was rotated or rewritten, following it from the start")
+            self.log = BendersLog()
+
+        parser = BendersLogParser(self.log.state)
+        with open(self.log_path, 'rb') as f:
+            tables, offset = parser.parse(f, self.log.offset)
+        if offset == self.log.offset:
+            return False
+
+        self.bytes_read += offset - self.log.offset
+        self.log = self.log.extend(tables, offset, parser.state)
+        self.head = _hash_head(self.log_path, offset)
+        return True
+
+    def get_last_lines(self, count: int, max_bytes: int = 16384) -> List[str]:
+        """Last `count` complete lines before the parsed offset"""
+        start = max(self.log.offset - max_bytes, 0)
+        lines = read_log_lines(self.log_path, start, self.log.offset)
+        # The first line read from the middle of the file is usually cut off
+        return (lines[1:] if start else lines)[-count:]
+
+
+def read_log_lines(log_path: Path, start: int, end: int) -> List[str]:
+    """Lines of a log file between two byte offsets"""
+    with open(log_path, 'rb') as f:
+        f.seek(start)
+        data = f.read(max(end - start, 0))
+    return data.decode('utf-8', errors='replace').splitlines()
+
+
+def _read_index(log_path: Path, index_path: Path) -> Optional[Dict[str, Any]]:
+    """Stored index if it still belongs to the log (same beginning, not shorter), else None"""
+    try:
+        with open(index_path / INDEX_FILE, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read log index {index_path}: {e}")
+        return None
+
+    if index.get("version") != LOG_INDEX_VERSION or index.get("source") != str(log_path.resolve()):
+        return None
+    if log_path.stat().st_size < index["offset"] or _hash_head(log_path, index["offset"]) != index.get("head"):
+        logger.info(f"{log_path} was rotated or rewritten, parsing it again")
+        return None
+    if not all((index_path / segment["file"]).exists() for segment in index["segments"]):
+        return None
+    return index
+
+
+def _store_segment(log_path: Path, index_path: Path, index: Dict[str, Any], new_tables: Dict[str, pd.DataFrame],
+                   offset: int, state: Dict[str, Any], tables: List[Dict[str, pd.DataFrame]]) -> Dict[str, Any]:
+    """Persist the new records and the index, returns the new index (unchanged on write errors)"""
+    segments = list(index["segments"]) if index["offset"] else []
+    new_index = {
+        "version": LOG_INDEX_VERSION,
+        "source": str(log_path.resolve()),
+        "offset": offset,
+        "head": _hash_head(log_path, offset),
+        "state": state,
+        "segments": segments
+    }
+
+    try:
+        if not segments:
+            # First parse (or parsed again): start with a fresh directory
+            shutil.rmtree(index_path, ignore_errors=True)
+        index_path.mkdir(parents=True, exist_ok=True)
+
+        if len(segments) + 1 > MAX_SEGMENTS:
+            merged = _concat_tables(tables)
+            obsolete = [segment["file"] for segment in segments]
+            segments.clear()
+            segments.append(_write_segment(index_path, merged, 0, offset))
+        else:
+            obsolete = []
+            segments.append(_write_segment(index_path, new_tables, index["offset"], offset))
+
+        # Replace the index atomically, then remove merged segments
+        fd, tmp_path = tempfile.mkstemp(dir=index_path, prefix=f".{INDEX_FILE}-")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(new_index, f)
+        os.replace(tmp_path, index_path / INDEX_FILE)
+        for file_name in obsolete:
+            (index_path / file_name).unlink(missing_ok=True)
+
+    except OSError as e:
+        # A read-only results directory only costs the incremental reload
+        logger.warning(f"Could not store log index {index_path}: {e}")
+
+    return new_index
+
+
+def _write_segment(index_path: Path, tables: Dict[str, pd.DataFrame], start: int, end: int) -> Dict[str, Any]:
+    file_name = f"segment_{start}_{end}.pkl"
+    fd, tmp_path = tempfile.mkstemp(dir=index_path, prefix=f".{file_name}-")
+    with os.fdopen(fd, 'wb') as f:
+        pickle.dump(tables, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, index_path / file_name)
+    return {"file": file_name, "start": start, "end": end}
+
+
+def _read_segment(segment_path: Path) -> Dict[str, pd.DataFrame]:
+    with open(segment_path, 'rb') as f:
+        return pickle.load(f)
+
+
+def _concat_tables(tables: List[Dict[str, pd.DataFrame]]) -> Dict[str, pd.DataFrame]:
+    result = {}
+    for name in TABLE_COLUMNS:
+        parts = [part[name] for part in tables if not part[name].empty]
+        result[name] = pd.concat(parts, ignore_index=True) if parts else _empty_table(name)
+    return result
+
+
+def _hash_head(log_path: Path, offset: int) -> str:
+    with open(log_path, 'rb') as f:
+        return hashlib.sha1(f.read(min(offset, HEAD_SIZE))).hexdigest()
+
+
+def _build_table(name: str, columns: Dict[str, list]) -> pd.DataFrame:
+    table = pd.DataFrame(columns)
+    if name == "cuts":
+        table["aggregated"] = table["aggregated"].astype(bool)
+    for column in ("offset", "iteration", "explored", "unexplored", "building", "sp_building", "sp_period", "count"):
+        if column in table:
+            table[column] = table[column].astype(np.int64)
+    return table
+
+
+def _empty_table(name: str) -> pd.DataFrame:
+    return _build_table(name, {column: [] for column in TABLE_COLUMNS[name]})
+
+
+def _to_float(token: str) -> float:
+    """Numeric value of a log token, NaN for '-' and other placeholders"""
+    try:
+        return float(token)
+    except (TypeError, ValueError):
+        return np.nan
@@ -0,0 +1,262 @@
+"""
+Loader for the Benders timing log (results/<run>/logging/iteration_timings.json)
+
+The file holds a `summary`, one entry per Benders iteration in `iterations` (with
+the list of subproblem `jobs`), `slowest_subproblems_top_20` and `all_subproblems`.
+It is read in chunks with a small streaming JSON reader: the iterations are decoded
+one at a time and appended to flat columns, so runs with tens of thousands of
+iterations never exist as one nested Python structure.
+"""
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+import logging
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+TIMINGS_FILE = Path("logging") / "iteration_timings.json"
+
+READ_CHUNK_SIZE = 256 * 1024
+
+# Phases of a subproblem job in execution order
+JOB_PHASES = [
+    "model_load_time",
+    "variable_fixing_time",
+    "optimization_time",
+    "status_handling_time",
+    "dual_collection_time",
+]
+
+# Scalar fields of an iteration entry kept in the iteration table
+ITERATION_FIELDS = [
+    "iteration", "where", "num_subproblems", "wall_clock_time", "sum_job_times",
+    "max_job_time", "min_job_time", "avg_job_time", "median_job_time",
+    "parallelization_efficiency", "max_job_sp_idx", "max_job_subprocess_idx", "max_job_slowest_phase",
+]
+
+JOB_FIELDS = ["iteration", "job", "sp_idx", "subprocess_idx", "total_job_time"] + JOB_PHASES
+
+@dataclass
+class BendersTimings:
+    """Tables of an iteration_timings.json file"""
+    summary: Dict[str, Any] = field(default_factory=dict)
+    iterations: pd.DataFrame = field(default_factory=lambda: pd.DataFrame(columns=ITERATION_FIELDS))
+    jobs: pd.DataFrame = field(default_factory=lambda: pd.DataFrame(columns=JOB_FIELDS))
+    slowest_subproblems: pd.DataFrame = field(default_factory=pd.DataFrame)
+    subproblems: pd.DataFrame = field(default_factory=pd.DataFrame)
+
+    @property
+    def num_iterations(self) -> int:
+        return len(self.iterations)
+
+    def get_phase_totals_by_iteration(self) -> pd.DataFrame:
+        """Sum of each job phase per iteration (index: iteration, columns: JOB_PHASES)"""
+        if self.jobs.empty:
+            return pd.DataFrame(columns=JOB_PHASES)
+        return self.jobs.groupby("iteration")[JOB_PHASES].sum()
+
+    def get_job_schedule(self, first_iteration: int = None, last_iteration: int = None) -> pd.DataFrame:
+        """Phase segments of all jobs on a common time axis, one row per job and phase
+
+        The timing file has durations but no start times. Iterations are placed one
+        after another by their wall-clock time, the jobs of a subprocess run back to
+        back from the start of their iteration and the phases of a job in JOB_PHASES
+        order. Columns: iteration, subprocess_idx, sp_idx, phase, start, end.
+        """
+        columns = ["iteration", "subprocess_idx", "sp_idx", "phase", "start", "end"]
+        if self.jobs.empty:
+            return pd.DataFrame(columns=columns)
+
+        iteration_starts = self.iterations["wall_clock_time"].fillna(0).cumsum().shift(fill_value=0)
+        iteration_starts.index = self.iterations["iteration"]
+
+        jobs = self.jobs
+        if first_iteration is not None:
+            jobs = jobs[jobs["iteration"] >= first_iteration]
+        if last_iteration is not None:
+            jobs = jobs[jobs["iteration"] <= last_iteration]
+        jobs = jobs.sort_values(["iteration", "subprocess_idx", "job"])
+
+        # Start of each job: iteration start plus the jobs before it on the same subprocess
+        job_times = jobs["total_job_time"].fillna(0)
+        lane_offsets = job_times.groupby([jobs["iteration"], jobs["subprocess_idx"]]).cumsum() - job_times
+        job_starts = jobs["iteration"].map(iteration_starts).to_numpy() + lane_offsets.to_numpy()
+
+        segments = []
+        phase_offset = 0.0
+        for phase in JOB_PHASES:
+            durations = jobs[phase].fillna(0).to_numpy()
+            starts = job_starts + phase_offset
+            segments.append(pd.DataFrame({
+                "iteration": jobs["iteration"].to_numpy(),
+                "subprocess_idx": jobs["subprocess_idx"].to_numpy(),
+                "sp_idx": jobs["sp_idx"].to_numpy(),
+                "phase": phase,
+                "start": starts,
+                "end": starts + durations
+            })[durations > 0])
+            phase_offset = phase_offset + durations
+
+        schedule = pd.concat(segments, ignore_index=True)
+        return schedule.sort_values(["start", "subprocess_idx"], ignore_index=True)
+
+
+class TimingsTableBuilder:
+    """Collects streamed iteration entries as flat columns"""
+
+    def __init__(self):
+        self.summary: Dict[str, Any] = {}
+        self.iteration_columns: Dict[str, list] = {name: [] for name in ITERATION_FIELDS}
+        self.job_columns: Dict[str, list] = {name: [] for name in JOB_FIELDS}
+        self.slowest_subproblems: List[Dict[str, Any]] = []
+        self.subproblems: List[Dict[str, Any]] = []
+
+    def add(self, key: str, value: Any):
+        """Add one streamed item (see iter_timings_file)"""
+        if key == "iteration":
+            self.add_iteration(value)
+        elif key == "summary":
+            self.summary = value
+        elif key == "slowest_subproblems_top_20":
+            self.slowest_subproblems = value
+        elif key == "all_subproblems":
+            self.subproblems = value
+
+    def add_iteration(self, entry: Dict[str, Any]):
+        iteration = entry.get("iteration", len(self.iteration_columns["iteration"]) + 1)
+        for name in ITERATION_FIELDS:
+            self.iteration_columns[name].append(entry.get(name, iteration if name == "iteration" else None))
+
+        for number, job in enumerate(entry.get("jobs", [])):
+            self.job_columns["iteration"].append(iteration)
+            self.job_columns["job"].append(number)
+            for name in JOB_FIELDS[2:]:
+                self.job_columns[name].append(job.get(name, 0.0 if name in JOB_PHASES else None))
+
+    def build(self) -> BendersTimings:
+        return BendersTimings(
+            summary=self.summary,
+            iterations=pd.DataFrame(self.iteration_columns),
+            jobs=pd.DataFrame(self.job_columns),
+            slowest_subproblems=_flatten_subproblems(self.slowest_subproblems),
+            subproblems=_flatten_subproblems(self.subproblems)
+        )
+
+
+def load_benders_timings(file_path: Path) -> BendersTimings:
+    """Read an iteration_timings.json file into tables"""
+    builder = TimingsTableBuilder()
+    for key, value in iter_timings_file(file_path):
+        builder.add(key, value)
+    timings = builder.build()
+    logger.info(f"Loaded {timings.num_iterations} iterations and {len(timings.jobs)} jobs from {file_path}")
+    return timings
+
+
+def iter_timings_file(file_path: Path, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[Tuple[str, Any]]:
+    """Stream the top-level entries of the timing file
+
+    Yields ("iteration", entry) for every element of `iterations` and (key, value)
+    for all other top-level keys.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        stream = JsonStream(f, chunk_size)
+        stream.expect('{')
+        while not stream.consume('}'):
+            key = stream.decode_value()
+            stream.expect(':')
+            if key == "iterations" and stream.consume('['):
+                while not stream.consume(']'):
+                    yield "iteration", stream.decode_value()
+                    stream.consume(',')
+            else:
+                yield key, stream.decode_value()
+            stream.consume(',')
+
+
+class JsonStream:
+    """Minimal pull reader decoding one JSON value at a time from a text file
+
+    Only the current value is held in memory (plus one read chunk). Nested values
+    are decoded with json.JSONDecoder.raw_decode once they are completely buffered.
+    """
+
+    def __init__(self, f, chunk_size: int = READ_CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self, size: int) -> bool:
+        """Read more data, dropping the consumed part of the buffer"""
+        if self.eof:
+            return False
+        data = self.f.read(size)
+        if not data:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def _skip_whitespace(self):
+        while True:
+            length = len(self.buffer)
+            while self.pos < length and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < length or not self._fill(self.chunk_size):
+                return
+
+    def consume(self, char: str) -> bool:
+        """Skip whitespace and consume `char` if it is next"""
+        self._skip_whitespace()
+        if self.pos < len(self.buffer) and self.buffer[self.pos] == char:
+            self.pos += 1
+            return True
+        if self.pos >= len(self.buffer) and self.eof:
+            raise ValueError(f"Unexpected end of JSON, expected '{char}'")
+        return False
+
+    def expect(self, char: str):
+        if not self.consume(char):
+            found = self.buffer[self.pos:self.pos + 20]
+            raise ValueError(f"Expected '{char}' in JSON but found {found!r}")
+
+    def decode_value(self) -> Any:
+        """Decode the next value, reading until it is completely buffered"""
+        self._skip_whitespace()
+        read_size = self.chunk_size
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            # Large values: grow the reads so they are not re-decoded too often
+            self._fill(read_size)
+            read_size *= 2
+
+
+def _flatten_subproblems(entries: List[Dict[str, Any]]) -> pd.DataFrame:
+    """One row per subproblem, nested breakdown dicts as columns"""
+    rows = []
+    for entry in entries:
+        row = {}
+        for key, value in entry.items():
+            if isinstance(value, dict):
+                prefix = "avg_" if key == "avg_breakdown" else ""
+                row.update({f"{prefix}{name}": item for name, item in value.items()})
+            else:
+                row[key] = value
+        rows.append(row)
+    return pd.DataFrame(rows)
+
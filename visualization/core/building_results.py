@@ -0,0 +1,159 @@
+"""
+Per-building result series extracted from an optimization solution
+
+All building time series shown on the building pathway view (rent, energy costs,
+modernization levies, depreciation, capacities, envelope measures, ...) are
+extracted for all buildings in one go. Switching between buildings is then a
+dictionary lookup instead of another scan over the solution.
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List
+import logging
+
+import pandas as pd
+
+from .data_models import OptimizationSolution
+
+logger = logging.getLogger(__name__)
+
+# Building related variable families: prefix -> pattern capturing (building, period, [key])
+SERIES_PATTERNS = {
+    "C_rent": ("rent", re.compile(r'C_rent_(\d+)_(\d+)')),
+    "C_en": ("energy_cost", re.compile(r'C_en_(\d+)_(\d+)')),
+    "C_mod": ("cmod", re.compile(r'C_mod_(\d+)_(\d+)')),
+    "C_mod_heat": ("cmod_heat", re.compile(r'C_mod_heat_(\d+)_(\d+)')),
+    "F_en": ("energy_use", re.compile(r'F_en_(\d+)_(\d+)$')),
+    "total_investment_measures_building": ("investment_measures", re.compile(r'total_investment_measures_building_(\d+)_(\d+)')),
+    "subsidies_building": ("subsidies", re.compile(r'subsidies_building_(\d+)_(\d+)')),
+}
+# Time period series of BuildingSeries (dicts of period -> value)
+SERIES_NAMES = [name for name, _ in SERIES_PATTERNS.values()] + ["depreciation"]
+
+DEPRECIATION_PATTERNS = {
+    "C_dep_ex": re.compile(r'C_dep_ex_(\d+)_(\d+)_(.+)'),
+    "C_dep": re.compile(r'C_dep_(\d+)_(\d+)_(.+)'),
+}
+CAPACITY_PATTERN = re.compile(r'E_av_(\d+)_(\d+)_(.+)')
+ENVELOPE_PATTERN = re.compile(r'X_av_(\d+)_(\d+)_(roof|wall|win)_(\d+)')
+
+# Building ids are taken from the first of these patterns found in a variable name
+BUILDING_ID_PATTERNS = [
+    re.compile(r'X_(?:in|out)_(\d+)_'),  # X_in_1_2_tech or X_out_1_2_tech
+    re.compile(r'E_(\d+)_'),             # E_1_2_tech
+    re.compile(r'_(\d+)_\d+_'),          # Any pattern with building_timeperiod
+]
+
+@dataclass
+class BuildingSeries:
+    """All result series of one building, keyed by time period"""
+    building_id: int
+    rent: Dict[int, float] = field(default_factory=dict)
+    energy_cost: Dict[int, float] = field(default_factory=dict)
+    cmod: Dict[int, float] = field(default_factory=dict)
+    cmod_heat: Dict[int, float] = field(default_factory=dict)
+    energy_use: Dict[int, float] = field(default_factory=dict)  # F_en, basis of the CO2 costs
+    investment_measures: Dict[int, float] = field(default_factory=dict)
+    subsidies: Dict[int, float] = field(default_factory=dict)
+    depreciation: Dict[int, float] = field(default_factory=dict)  # only positive costs
+    depreciation_by_measure: Dict[int, Dict[str, float]] = field(default_factory=dict)
+    capacity: Dict[int, Dict[str, float]] = field(default_factory=dict)  # E_av > 0, raw model units
+    envelope: Dict[int, Dict[str, List[int]]] = field(default_factory=dict)  # selected roof/wall/win components
+
+    def get_co2_costs(self, co2_prices) -> Dict[int, float]:
+        """CO2 costs per time period from the energy use and the CO2 price per period"""
+        return {tp: value * co2_prices[tp] for tp, value in self.energy_use.items()}
+
+
+class BuildingResults:
+    """Result series of all buildings of a solution"""
+
+    def __init__(self, buildings: List[int], series: Dict[int, BuildingSeries]):
+        self.buildings = buildings
+        self._series = series
+
+    def get(self, building_id: int) -> BuildingSeries:
+        """Series of one building (empty series if the building has no results)"""
+        series = self._series.get(building_id)
+        if series is None:
+            series = BuildingSeries(building_id)
+        return series
+
+    def to_frame(self) -> pd.DataFrame:
+        """Tidy table with one row per building, series, time period and key"""
+        rows = []
+        for building_id, series in self._series.items():
+            for name in SERIES_NAMES:
+                for time_period, value in getattr(series, name).items():
+                    rows.append((building_id, name, time_period, None, value))
+            for time_period, measures in series.depreciation_by_measure.items():
+                for measure, value in measures.items():
+                    rows.append((building_id, "depreciation_by_measure", time_period, measure, value))
+            for time_period, technologies in series.capacity.items():
+                for technology, value in technologies.items():
+                    rows.append((building_id, "capacity", time_period, technology, value))
+            for time_period, components in series.envelope.items():
+                for component, numbers in components.items():
+                    for number in numbers:
+                        rows.append((building_id, "envelope", time_period, f"{component}_{number}", 1.0))
+
+        return pd.DataFrame(rows, columns=["building_id", "series", "time_period", "key", "value"])
+
+    @classmethod
+    def from_solution(cls, solution: OptimizationSolution) -> "BuildingResults":
+        """Extract the series of all buildings, touching only the relevant variable families"""
+        series: Dict[int, BuildingSeries] = {}
+
+        def get_series(building_id: str) -> BuildingSeries:
+            building_id = int(building_id)
+            if building_id not in series:
+                series[building_id] = BuildingSeries(building_id)
+            return series[building_id]
+
+        for prefix, (name, pattern) in SERIES_PATTERNS.items():
+            for var_name, value in solution.iter_values(prefix):
+                match = pattern.match(var_name)
+                if match:
+                    getattr(get_series(match.group(1)), name)[int(match.group(2))] = value
+
+        for var_name, value in solution.iter_values(*DEPRECIATION_PATTERNS):
+            match = DEPRECIATION_PATTERNS["C_dep_ex"].match(var_name) or DEPRECIATION_PATTERNS["C_dep"].match(var_name)
+            # Only include non-zero costs
+            if match and value > 0:
+                building = get_series(match.group(1))
+                time_period = int(match.group(2))
+                building.depreciation[time_period] = building.depreciation.get(time_period, 0) + value
+                building.depreciation_by_measure.setdefault(time_period, {})[match.group(3)] = value
+
+        for var_name, value in solution.iter_values("E_av"):
+            match = CAPACITY_PATTERN.match(var_name)
+            if match and value > 0:
+                get_series(match.group(1)).capacity.setdefault(int(match.group(2)), {})[match.group(3)] = value
+
+        for var_name, value in solution.iter_values("X_av"):
+            match = ENVELOPE_PATTERN.match(var_name)
+            # Only binary vars with value 1
+            if match and value == 1:
+                components = get_series(match.group(1)).envelope.setdefault(int(match.group(2)), {})
+                components.setdefault(match.group(3), []).append(int(match.group(4)))
+
+        buildings = _find_building_ids(solution)
+        logger.info(f"Extracted result series for {len(series)} buildings")
+        return cls(buildings, series)
+
+
+def get_building_results(solution: OptimizationSolution) -> BuildingResults:
+    """Building results of a solution, extracted on first use and kept with the solution"""
+    return solution.building_results
+
+
+def _find_building_ids(solution: OptimizationSolution) -> List[int]:
+    """Building ids referenced by any variable name"""
+    buildings = set()
+    for var_name in solution.variables:
+        for pattern in BUILDING_ID_PATTERNS:
+            match = pattern.search(var_name)
+            if match:
+                buildings.add(int(match.group(1)))
+                break
+    return sorted(buildings)
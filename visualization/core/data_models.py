@@ -1,11 +1,25 @@
 """
 Data models for the optimization results and instances
 """
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any, Union
+from array import array
+from collections.abc import ItemsView, Mapping, ValuesView
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Any, Sequence, Tuple, Union
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+
+if TYPE_CHECKING:
+    from .building_results import BuildingResults
+    from .results_source import SolutionResultsSource
+
+# Missing values in the columnar solution storage
+MISSING_INT = np.iinfo(np.int32).min  # time_period (time periods can be negative)
+PERIOD_MAX = np.iinfo(np.int32).max
+MISSING_CODE = -1  # categorical codes
+
 @dataclass
 class OptimizationVariable:
     """Represents a single optimization variable from the solution"""
@@ -18,21 +32,401 @@ class OptimizationVariable:
     technology: Optional[str] = None
     measure: Optional[str] = None
 
+class SolutionColumns:
+    """Columnar storage of solution variables, one row per variable
+    
+    Numeric fields are kept in typed arrays and string fields as categorical codes
+    into small lookup lists, which is far more compact than one OptimizationVariable
+    per variable and allows vectorized filtering and aggregation.
+    """
+
+    def __init__(self,
+                 names: List[str],
+                 values: np.ndarray,
+                 building_id_codes: np.ndarray,
+                 building_ids: List[str],
+                 time_period: np.ndarray,
+                 variable_type_codes: np.ndarray,
+                 variable_types: List[str],
+                 technology_codes: np.ndarray,
+                 technologies: List[str],
+                 category_codes: np.ndarray,
+                 categories: List[str],
+                 measure_codes: np.ndarray,
+                 measures: List[str]):
+        self.names = names
+        self.values = values  # float64
+        self.building_id_codes = building_id_codes  # int32 codes into building_ids, MISSING_CODE if not set
+        self.building_ids = building_ids  # as written in the variable names ("01" stays "01")
+        self.time_period = time_period  # int32, MISSING_INT if not set
+        self.variable_type_codes = variable_type_codes  # int32 codes into variable_types
+        self.variable_types = variable_types
+        self.technology_codes = technology_codes  # int32 codes into technologies, MISSING_CODE if not set
+        self.technologies = technologies
+        self.category_codes = category_codes  # int32 codes into categories, MISSING_CODE if not set
+        self.categories = categories
+        self.measure_codes = measure_codes  # int32 codes into measures, MISSING_CODE if not set
+        self.measures = measures
+        self._index: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def index(self) -> Dict[str, int]:
+        """Variable name -> row (built on first use)"""
+        if self._index is None:
+            self._index = {name: row for row, name in enumerate(self.names)}
+        return self._index
+
+    def get_variable(self, row: int) -> OptimizationVariable:
+        """Materialize the variable stored in a row"""
+        time_period = int(self.time_period[row])
+
+        return OptimizationVariable(
+            name=self.names[row],
+            value=float(self.values[row]),
+            variable_type=self.variable_types[self.variable_type_codes[row]],
+            category=self._decode(self.category_codes, self.categories, row),
+            building_id=self._decode(self.building_id_codes, self.building_ids, row),
+            time_period=time_period if time_period != MISSING_INT else None,
+            technology=self._decode(self.technology_codes, self.technologies, row),
+            measure=self._decode(self.measure_codes, self.measures, row)
+        )
+
+    def get_variables(self, rows: Sequence[int]) -> Dict[str, OptimizationVariable]:
+        """Materialize the variables stored in the given rows"""
+        return {self.names[row]: self.get_variable(row) for row in rows}
+
+    def rows_where(self, codes: np.ndarray, lookup: List[str], value: str) -> np.ndarray:
+        """Rows whose categorical column equals a value"""
+        if value not in lookup:
+            return np.empty(0, dtype=np.intp)
+        return np.flatnonzero(codes == lookup.index(value))
+
+    @staticmethod
+    def _decode(codes: np.ndarray, lookup: List[str], row: int) -> Optional[str]:
+        code = codes[row]
+        return lookup[code] if code != MISSING_CODE else None
+
+    @classmethod
+    def concatenate(cls, parts: Sequence["SolutionColumns"]) -> "SolutionColumns":
+        """Merge columns in order, a repeated name keeps its first row but takes the last values (like a dict)"""
+        names: List[str] = []
+        for part in parts:
+            names.extend(part.names)
+
+        merged = {
+            attr: np.concatenate([getattr(part, attr) for part in parts])
+            for attr in ("values", "time_period")
+        }
+
+        # Remap the categorical codes of every part onto one shared lookup list
+        for codes_field, lookup_field in (
+            ("building_id_codes", "building_ids"),
+            ("variable_type_codes", "variable_types"),
+            ("technology_codes", "technologies"),
+            ("category_codes", "categories"),
+            ("measure_codes", "measures")
+        ):
+            lookup: Dict[str, int] = {}
+            remapped = []
+            for part in parts:
+                # The extra trailing entry maps MISSING_CODE (-1) onto itself
+                mapping = np.array(
+                    [lookup.setdefault(value, len(lookup)) for value in getattr(part, lookup_field)] + [MISSING_CODE],
+                    dtype=np.int32
+                )
+                remapped.append(mapping[getattr(part, codes_field)])
+            merged[codes_field] = np.concatenate(remapped)
+            merged[lookup_field] = list(lookup)
+
+        index: Dict[str, int] = {}
+        for row, name in enumerate(names):
+            index[name] = row
+
+        if len(index) < len(names):
+            rows = np.fromiter(index.values(), dtype=np.intp, count=len(index))
+            names = list(index)
+            for attr, column in merged.items():
+                if isinstance(column, np.ndarray):
+                    merged[attr] = column[rows]
+            index = {name: row for row, name in enumerate(names)}
+
+        columns = cls(names=names, **merged)
+        columns._index = index
+        return columns
+
+
+class SolutionColumnsBuilder:
+    """Incrementally collects variables into a SolutionColumns"""
+
+    def __init__(self):
+        self._names: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._values = array('d')
+        self._building_id_codes = array('i')
+        self._time_period = array('i')
+        self._variable_type_codes = array('i')
+        self._technology_codes = array('i')
+        self._category_codes = array('i')
+        self._measure_codes = array('i')
+        self._building_ids: Dict[str, int] = {}
+        self._variable_types: Dict[str, int] = {}
+        self._technologies: Dict[str, int] = {}
+        self._categories: Dict[str, int] = {}
+        self._measures: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def append(self, var: OptimizationVariable):
+        """Add a variable, a repeated name replaces the earlier row (like a dict)"""
+        fields = (
+            var.value,
+            self._encode(self._building_ids, var.building_id),
+            self._encode_period(var.time_period),
+            self._encode(self._variable_types, var.variable_type),
+            self._encode(self._technologies, var.technology),
+            self._encode(self._categories, var.category),
+            self._encode(self._measures, var.measure)
+        )
+        columns = (
+            self._values, self._building_id_codes, self._time_period, self._variable_type_codes,
+            self._technology_codes, self._category_codes, self._measure_codes
+        )
+
+        row = self._index.get(var.name)
+        if row is None:
+            self._index[var.name] = len(self._names)
+            self._names.append(var.name)
+            for column, value in zip(columns, fields):
+                column.append(value)
+        else:
+            for column, value in zip(columns, fields):
+                column[row] = value
+
+    def build(self) -> SolutionColumns:
+        """Create the columnar storage from the collected variables"""
+        columns = SolutionColumns(
+            names=self._names,
+            values=np.frombuffer(self._values, dtype=np.float64),
+            building_id_codes=np.frombuffer(self._building_id_codes, dtype=np.int32),
+            building_ids=list(self._building_ids),
+            time_period=np.frombuffer(self._time_period, dtype=np.int32),
+            variable_type_codes=np.frombuffer(self._variable_type_codes, dtype=np.int32),
+            variable_types=list(self._variable_types),
+            technology_codes=np.frombuffer(self._technology_codes, dtype=np.int32),
+            technologies=list(self._technologies),
+            category_codes=np.frombuffer(self._category_codes, dtype=np.int32),
+            categories=list(self._categories),
+            measure_codes=np.frombuffer(self._measure_codes, dtype=np.int32),
+            measures=list(self._measures)
+        )
+        columns._index = self._index
+        return columns
+
+    @staticmethod
+    def _encode_period(time_period: Optional[int]) -> int:
+        # Generic variable names can carry any integer, periods outside int32 are left unset
+        if time_period is None or not MISSING_INT < time_period <= PERIOD_MAX:
+            return MISSING_INT
+        return time_period
+
+    @staticmethod
+    def _encode(lookup: Dict[str, int], value: Optional[str]) -> int:
+        if value is None:
+            return MISSING_CODE
+        code = lookup.get(value)
+        if code is None:
+            code = len(lookup)
+            lookup[value] = code
+        return code
+
+
+class _ColumnItemsView(ItemsView):
+    def __iter__(self):
+        columns = self._mapping.columns
+        for row, name in enumerate(columns.names):
+            yield name, columns.get_variable(row)
+
+
+class _ColumnValuesView(ValuesView):
+    def __iter__(self):
+        columns = self._mapping.columns
+        for row in range(len(columns)):
+            yield columns.get_variable(row)
+
+
+class SolutionVariables(Mapping):
+    """Read-only dict-style view of SolutionColumns
+    
+    OptimizationVariable objects are created on access only, so code using
+    solution.variables keeps working on top of the columnar storage.
+    """
+
+    def __init__(self, columns: SolutionColumns):
+        self.columns = columns
+
+    def __getitem__(self, name: str) -> OptimizationVariable:
+        return self.columns.get_variable(self.columns.index[name])
+
+    def __contains__(self, name) -> bool:
+        return name in self.columns.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns.names)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def items(self) -> ItemsView:
+        return _ColumnItemsView(self)
+
+    def values(self) -> ValuesView:
+        return _ColumnValuesView(self)
+
+
+def variable_name_prefix(name: str) -> str:
+    """Family prefix of a variable name, the tokens before the first index (C_mod_heat_0_3 -> C_mod_heat)"""
+    tokens = name.split('_')
+    for i, token in enumerate(tokens[1:], 1):
+        if not token or token[0] == '(' or token.lstrip('-').isdigit():
+            return '_'.join(tokens[:i])
+    return name
+
+
+class SolutionIndex:
+    """Hash indexes from lookup keys to variable names
+    
+    Built once per solution, so lookups by type, (type, building), (building, period)
+    or name prefix cost O(result) instead of a scan over all variables.
+    """
+
+    def __init__(self, solution: "OptimizationSolution"):
+        self.by_type: Dict[str, List[str]] = {}
+        self.by_type_building: Dict[Tuple[str, Optional[str]], List[str]] = {}
+        self.by_building_period: Dict[Tuple[Optional[str], Optional[int]], List[str]] = {}
+        self.by_prefix: Dict[str, List[str]] = {}
+        # Variable name -> position in the solution, to merge lookups in solution order
+        self.positions: Dict[str, int] = solution.columns.index if solution.columns is not None else {
+            name: position for position, name in enumerate(solution.variables)
+        }
+
+        for name, var_type, building_id, time_period in self._iter_keys(solution):
+            self.by_type.setdefault(var_type, []).append(name)
+            self.by_type_building.setdefault((var_type, building_id), []).append(name)
+            self.by_building_period.setdefault((building_id, time_period), []).append(name)
+            self.by_prefix.setdefault(variable_name_prefix(name), []).append(name)
+
+    @staticmethod
+    def _iter_keys(solution: "OptimizationSolution") -> Iterable[Tuple[str, str, Optional[str], Optional[int]]]:
+        columns = solution.columns
+        if columns is None:
+            return (
+                (name, var.variable_type, var.building_id, var.time_period)
+                for name, var in solution.variables.items()
+            )
+
+        # Read the columns directly, no OptimizationVariable per row
+        return zip(
+            columns.names,
+            [columns.variable_types[code] for code in columns.variable_type_codes.tolist()],
+            [columns.building_ids[code] if code != MISSING_CODE else None for code in columns.building_id_codes.tolist()],
+            [value if value != MISSING_INT else None for value in columns.time_period.tolist()]
+        )
+
+
 @dataclass 
 class OptimizationSolution:
     """Complete optimization solution data"""
     objective_value: float
-    variables: Dict[str, OptimizationVariable]
+    variables: Mapping[str, OptimizationVariable]
     solution_status: str
     solve_time: Optional[float] = None
     gap: Optional[float] = None
+    columns: Optional[SolutionColumns] = None
+    _index: Optional[SolutionIndex] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_columns(cls, objective_value: float, columns: SolutionColumns, solution_status: str, **kwargs) -> "OptimizationSolution":
+        """Create a solution backed by columnar storage"""
+        return cls(
+            objective_value=objective_value,
+            variables=SolutionVariables(columns),
+            solution_status=solution_status,
+            columns=columns,
+            **kwargs
+        )
     
+    @property
+    def index(self) -> SolutionIndex:
+        """Lookup indexes over the variables (built on first use)"""
+        if self._index is None:
+            self._index = SolutionIndex(self)
+        return self._index
+
+    @cached_property
+    def building_results(self) -> "BuildingResults":
+        """Result series per building (extracted on first use, see core.building_results)"""
+        from .building_results import BuildingResults
+        return BuildingResults.from_solution(self)
+
+    @cached_property
+    def results_source(self) -> "SolutionResultsSource":
+        """Result metrics derived from the variables (extracted per metric on first request, see core.results_source)"""
+        from .results_source import SolutionResultsSource
+        return SolutionResultsSource(self)
+
     def get_variables_by_type(self, var_type: str) -> Dict[str, OptimizationVariable]:
         """Get all variables of a specific type (X, E, P, Q, etc.)"""
-        return {k: v for k, v in self.variables.items() if v.variable_type == var_type}
+        return self._select(self.index.by_type.get(var_type, []))
+
+    def get_variables_by_building(self, var_type: str, building_id: Union[int, str]) -> Dict[str, OptimizationVariable]:
+        """Get all variables of a type for one building"""
+        return self._select(self.index.by_type_building.get((var_type, str(building_id)), []))
+
+    def get_variables_by_building_period(self, building_id: Union[int, str], time_period: int) -> Dict[str, OptimizationVariable]:
+        """Get all variables of one building in one time period"""
+        return self._select(self.index.by_building_period.get((str(building_id), time_period), []))
+
+    def get_variables_by_prefix(self, *prefixes: str) -> Dict[str, OptimizationVariable]:
+        """Get all variables of one or more name families, e.g. "C_rent" or "X_in" (see variable_name_prefix)"""
+        if len(prefixes) == 1:
+            return self._select(self.index.by_prefix.get(prefixes[0], []))
+
+        # Keep the solution order across families
+        names = [name for prefix in prefixes for name in self.index.by_prefix.get(prefix, [])]
+        names.sort(key=self.index.positions.__getitem__)
+        return self._select(names)
+
+    def iter_values(self, *prefixes: str) -> Iterator[Tuple[str, float]]:
+        """(name, value) of the variables of some name families, in solution order"""
+        if self.columns is None:
+            for var_name, var in self.get_variables_by_prefix(*prefixes).items():
+                if var.value is not None:
+                    yield var_name, var.value
+            return
+
+        # Read the values straight from the columns, no OptimizationVariable needed
+        names = [name for prefix in prefixes for name in self.index.by_prefix.get(prefix, [])]
+        if len(prefixes) > 1:
+            names.sort(key=self.index.positions.__getitem__)
+        for var_name in names:
+            yield var_name, float(self.columns.values[self.columns.index[var_name]])
+
+    def _select(self, names: List[str]) -> Dict[str, OptimizationVariable]:
+        """Materialize the variables with the given names"""
+        if self.columns is not None:
+            rows = self.columns.index
+            return self.columns.get_variables([rows[name] for name in names])
+        return {name: self.variables[name] for name in names}
     
     def get_variables_by_category(self, category: str) -> Dict[str, OptimizationVariable]:
         """Get all variables of a specific category"""
+        if self.columns is not None:
+            rows = self.columns.rows_where(self.columns.category_codes, self.columns.categories, category)
+            return self.columns.get_variables(rows)
         return {k: v for k, v in self.variables.items() if v.category == category}
     
     def get_installed_technologies(self) -> Dict[str, List[OptimizationVariable]]:
@@ -0,0 +1,326 @@
+"""
+Reader for IIS files (.ilp) written by Gurobi in LP format
+
+read_iis parses the file once, line by line, into an IisModel: one row per constraint
+with family name (the part before the brackets), index tuple, building, period,
+variables, coefficients, sense and right-hand side, the Bounds section as a table and
+an inverted index from variable name to the constraints it appears in. Names follow
+the Gurobi conventions of the files in results/, e.g.
+calculation_if_measure_available[0,0,rad_22] with the terms continued on indented lines
+and spaces in index tuples replaced by underscores.
+
+Which leading indices are building and period is read from IIS_INDEX_LAYOUT, the
+default is (building, period). Only linear constraints are read: the objective,
+indicator constraints ("b = 1 -> x + y <= 5"), the General Constraints, User Cuts,
+SOS and semi-continuous sections are skipped. Lazy constraints are read like the
+constraints of the Subject To section.
+"""
+import math
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+import logging
+
+import numpy as np
+import pandas as pd
+
+from .data_models import MISSING_INT
+from config.app_config import IIS_INDEX_LAYOUT
+
+logger = logging.getLogger(__name__)
+
+IIS_FILE_PATTERN = "*.ilp"
+
+DEFAULT_INDEX_LAYOUT = ("building", "period")
+
+CONSTRAINT_COLUMNS = ["name", "family", "index", "building", "period", "sense", "rhs", "num_terms", "variables", "coefficients"]
+
+BOUND_COLUMNS = ["variable", "lower", "upper"]
+
+# Section keywords of the LP format (lower case)
+SECTIONS = {
+    "maximize": "objective", "minimize": "objective", "maximum": "objective", "minimum": "objective",
+    "max": "objective", "min": "objective",
+    "subject to": "constraints", "such that": "constraints", "st": "constraints", "s.t.": "constraints",
+    "lazy constraints": "constraints",
+    "general constraints": "skip", "general constraint": "skip", "gen constraints": "skip",
+    "user cuts": "skip",
+    "bounds": "bounds", "bound": "bounds",
+    "generals": "integers", "general": "integers", "gen": "integers", "integers": "integers",
+    "binaries": "binaries", "binary": "binaries", "bin": "binaries",
+    "semi-continuous": "skip", "semis": "skip", "semi": "skip", "sos": "skip",
+    "end": "end",
+}
+
+SENSES = {"<=": "<=", "=<": "<=", "<": "<=", ">=": ">=", "=>": ">=", ">": ">=", "=": "="}
+
+# Separates the condition of an indicator constraint from its linear constraint
+INDICATOR = "->"
+
+NUMBER = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
+INFINITY = {"inf", "infinity", "+inf", "+infinity"}
+NAME = re.compile(r"^([^\[]+)\[(.*)\]$")
+INTEGER = re.compile(r"^-?\d+$")
+
+IndexValue = Union[int, str]
+
+
+@dataclass
+class IisModel:
+    """Constraints and bounds of an IIS with an inverted index from variable to constraints"""
+    constraints: pd.DataFrame  # CONSTRAINT_COLUMNS, building/period MISSING_INT where not indexed
+    bounds: pd.DataFrame  # BOUND_COLUMNS, LP defaults (0, inf) where a side is not given
+    integer_variables: FrozenSet[str]
+    variable_index: Dict[str, np.ndarray]  # variable -> row positions in constraints
+
+    @property
+    def families(self) -> List[str]:
+        return sorted(self.constraints["family"].unique())
+
+    @property
+    def num_variables(self) -> int:
+        return len(self.variable_index)
+
+    def filter_constraints(self,
+                           buildings: Optional[Iterable[int]] = None,
+                           periods: Optional[Iterable[int]] = None,
+                           families: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """Constraints matching all given filters (None = no filter)"""
+        mask = np.ones(len(self.constraints), dtype=bool)
+        if buildings is not None:
+            mask &= self.constraints["building"].isin(list(buildings)).to_numpy()
+        if periods is not None:
+            mask &= self.constraints["period"].isin(list(periods)).to_numpy()
+        if families is not None:
+            mask &= self.constraints["family"].isin(list(families)).to_numpy()
+        return self.constraints[mask]
+
+    def find_variables(self, text: str) -> List[str]:
+        """Variables of the constraints whose name contains `text`"""
+        return sorted(name for name in self.variable_index if text in name)
+
+    def get_constraints_of(self, variables: Iterable[str]) -> pd.DataFrame:
+        """Constraints containing any of the variables, looked up in the inverted index"""
+        positions = [self.variable_index[name] for name in variables if name in self.variable_index]
+        if not positions:
+            return self.constraints.iloc[0:0]
+        return self.constraints.iloc[np.unique(np.concatenate(positions))]
+
+    @staticmethod
+    def format_constraint(row) -> str:
+        """Constraint as LP text, e.g. "c[0]: - X_in_0 + X_av_0 = 0" """
+        terms = []
+        for variable, coefficient in zip(row["variables"], row["coefficients"]):
+            term = variable if abs(coefficient) == 1 else f"{abs(coefficient):g} {variable}"
+            terms.append(f"- {term}" if coefficient < 0 else f"+ {term}" if terms else term)
+        return f"{row['name']}: {' '.join(terms)} {row['sense']} {row['rhs']:g}"
+
+
+def read_iis(ilp_path: Path, index_layout: Mapping[str, Sequence[str]] = IIS_INDEX_LAYOUT) -> IisModel:
+    """Parse an IIS file in LP format (see module docstring)"""
+    parser = _LpParser()
+    with open(ilp_path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            parser.parse_line(line)
+    parser.finish()
+
+    if parser.skipped:
+        logger.info(f"Skipped {parser.skipped} incomplete or unsupported constraints in {ilp_path}")
+    return _build_model(parser, index_layout)
+
+
+def parse_constraint_name(name: str, index_layout: Mapping[str, Sequence[str]] = IIS_INDEX_LAYOUT) -> Tuple[str, Tuple[IndexValue, ...], int, int]:
+    """Family, index tuple, building and period of a constraint name
+
+    "energy_balance[0,0,dhw,0]" -> ("energy_balance", (0, 0, "dhw", 0), 0, 0). Entries of
+    the layout that are not integers (e.g. max_credits[0,rad_22]) are MISSING_INT.
+    """
+    match = NAME.match(name)
+    if not match:
+        return name, (), MISSING_INT, MISSING_INT
+
+    family = match.group(1)
+    index = tuple(_parse_index_value(value) for value in _split_index(match.group(2)))
+    position = {"building": MISSING_INT, "period": MISSING_INT}
+    for key, value in zip(index_layout.get(family, DEFAULT_INDEX_LAYOUT), index):
+        if key in position and isinstance(value, int):
+            position[key] = value
+    return family, index, position["building"], position["period"]
+
+
+class _LpParser:
+    """Line-by-line state of the LP reader; constraints may span several lines"""
+
+    def __init__(self):
+        self.section = None
+        self.constraints: List[tuple] = []  # (name, variables, coefficients, sense, rhs)
+        self.bounds: Dict[str, List[float]] = {}
+        self.integers: List[str] = []
+        self.skipped = 0
+        # Complete constraint held back until the next token shows it is no indicator condition
+        self._pending: Optional[tuple] = None
+        self._reset()
+
+    def _reset(self):
+        self._indicator = False
+        self._name = None
+        self._variables: List[str] = []
+        self._coefficients: List[float] = []
+        self._sign = 1.0
+        self._coefficient = None
+        self._sense = None
+
+    def parse_line(self, line: str):
+        if line.startswith("\\"):
+            return
+        tokens = line.split()
+        if not tokens:
+            return
+
+        if not line[:1].isspace():
+            section = SECTIONS.get(line.strip().lower())
+            if section is not None:
+                self.finish()
+                self.section = section
+                return
+
+        if self.section == "constraints":
+            for token in tokens:
+                self._parse_constraint_token(token)
+        elif self.section == "bounds":
+            self._parse_bound(tokens)
+        elif self.section in ("integers", "binaries"):
+            self.integers.extend(tokens)
+            if self.section == "binaries":
+                for name in tokens:
+                    self.bounds[name] = [0.0, 1.0]
+
+    def finish(self):
+        """End of a section, drops a constraint without right-hand side"""
+        self._commit()
+        if self._name is not None or self._variables:
+            self.skipped += 1
+        self._reset()
+
+    def _commit(self):
+        if self._pending is not None:
+            self.constraints.append(self._pending)
+            self._pending = None
+
+    def _parse_constraint_token(self, token: str):
+        if token == INDICATOR:
+            # "c1: b = 1 -> x + y <= 5": drop the condition, the rest is read and dropped as well
+            name = self._pending[0] if self._pending is not None else self._name
+            self._pending = None
+            self._reset()
+            self._name, self._indicator = name, True
+            return
+        self._commit()
+
+        if self._sense is not None:
+            # Right-hand side completes the constraint
+            if _is_number(token) and not self._indicator:
+                name = self._name if self._name is not None else f"R{len(self.constraints)}"
+                self._pending = (name, self._variables, self._coefficients, self._sense, float(token))
+            else:
+                self.skipped += 1
+            self._reset()
+            return
+
+        if token.endswith(":") and self._name is None and not self._variables and self._coefficient is None:
+            self._name = token[:-1]
+        elif token in SENSES:
+            self._sense = SENSES[token]
+        elif token == "+":
+            self._sign = 1.0
+        elif token == "-":
+            self._sign = -1.0
+        elif NUMBER.match(token):
+            self._coefficient = float(token)
+        else:
+            coefficient = 1.0 if self._coefficient is None else self._coefficient
+            self._variables.append(token)
+            self._coefficients.append(self._sign * coefficient)
+            self._sign = 1.0
+            self._coefficient = None
+
+    def _parse_bound(self, tokens: List[str]):
+        """ "X free", "-infinity <= X <= 1", "X >= 2", "X = 3" """
+        if len(tokens) == 2 and tokens[1].lower() == "free":
+            self.bounds[tokens[0]] = [-math.inf, math.inf]
+            return
+
+        variable_position = next((i for i, token in enumerate(tokens) if token not in SENSES and not _is_number(token)), None)
+        if variable_position is None:
+            return
+        variable = tokens[variable_position]
+        bound = self.bounds.setdefault(variable, [0.0, math.inf])
+
+        # "value op X": the value is a lower bound for <= and an upper bound for >=
+        if variable_position >= 2:
+            value, sense = float(tokens[variable_position - 2]), SENSES.get(tokens[variable_position - 1])
+            self._set_bound(bound, "<=" if sense == ">=" else ">=" if sense == "<=" else sense, value)
+        # "X op value"
+        if variable_position + 2 < len(tokens):
+            sense, value = SENSES.get(tokens[variable_position + 1]), float(tokens[variable_position + 2])
+            self._set_bound(bound, sense, value)
+
+    @staticmethod
+    def _set_bound(bound: List[float], sense: Optional[str], value: float):
+        if sense in (">=", "="):
+            bound[0] = value
+        if sense in ("<=", "="):
+            bound[1] = value
+
+
+def _build_model(parser: _LpParser, index_layout: Mapping[str, Sequence[str]]) -> IisModel:
+    rows = []
+    variable_rows: Dict[str, List[int]] = {}
+    for position, (name, variables, coefficients, sense, rhs) in enumerate(parser.constraints):
+        family, index, building, period = parse_constraint_name(name, index_layout)
+        rows.append((name, family, index, building, period, sense, rhs, len(variables), tuple(variables), tuple(coefficients)))
+        for variable in variables:
+            variable_rows.setdefault(variable, []).append(position)
+
+    constraints = pd.DataFrame(rows, columns=CONSTRAINT_COLUMNS)
+    for column in ("building", "period", "num_terms"):
+        constraints[column] = constraints[column].astype(np.int64)
+    constraints["rhs"] = constraints["rhs"].astype(np.float64)
+
+    bounds = pd.DataFrame(
+        [(variable, lower, upper) for variable, (lower, upper) in parser.bounds.items()],
+        columns=BOUND_COLUMNS
+    )
+    return IisModel(
+        constraints=constraints,
+        bounds=bounds,
+        integer_variables=frozenset(parser.integers),
+        variable_index={name: np.unique(np.array(positions, dtype=np.int64)) for name, positions in variable_rows.items()}
+    )
+
+
+def _split_index(text: str) -> List[str]:
+    """Split an index on the commas outside of parentheses"""
+    values, depth, start = [], 0, 0
+    for i, char in enumerate(text):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            values.append(text[start:i])
+            start = i + 1
+    values.append(text[start:])
+    return values
+
+
+def _parse_index_value(value: str) -> IndexValue:
+    if INTEGER.match(value):
+        return int(value)
+    # The LP writer replaces spaces by underscores: ('roof_2',_'wall_1') -> ('roof_2', 'wall_1')
+    return value.replace(",_'", ", '")
+
+
+def _is_number(token: str) -> bool:
+    return bool(NUMBER.match(token)) or token.lower().lstrip("+-") in INFINITY
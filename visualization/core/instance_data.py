@@ -0,0 +1,180 @@
+"""
+Lazy access to instance pickles (<use case>/<use case>.pkl)
+
+The instance pickle holds the model input as nested dicts (params/sets -> name ->
+data) and can only be unpickled as a whole. On first load it is split into one small
+pickle per parameter or set in the cache directory next to the file
+(SOLUTION_CACHE_DIRNAME/instance_<name>/). Later loads return an InstanceData view
+that unpickles an entry only when it is accessed, so a page reading a single price
+series does not materialize the whole model input.
+"""
+import itertools
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+import logging
+
+from config.app_config import SOLUTION_CACHE_DIRNAME
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.json"
+
+# Increment when the layout of the split cache changes
+INSTANCE_CACHE_VERSION = 1
+
+class InstanceData(Mapping):
+    """Read-only mapping over a split instance pickle, entries are loaded on first access
+
+    Top-level dicts (e.g. params, sets) are InstanceData views themselves, all
+    other values are stored and loaded as a whole.
+    """
+
+    def __init__(self, entry_path: Path, files: Dict[str, Any]):
+        self._entry_path = entry_path
+        # key -> file name of the value or nested {key: file name} of a group
+        self._files = files
+        self._values: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        target = self._files[key]  # KeyError for unknown keys, like a dict
+
+        with self._lock:
+            if key not in self._values:
+                if isinstance(target, dict):
+                    self._values[key] = InstanceData(self._entry_path, target)
+                else:
+                    with open(self._entry_path / target, 'rb') as f:
+                        self._values[key] = pickle.load(f)
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._files)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __contains__(self, key) -> bool:
+        return key in self._files
+
+    @property
+    def loaded_keys(self):
+        """Keys that have been materialized so far"""
+        return list(self._values)
+
+
+class InstanceDataCache:
+    """Loads instance pickles through the split cache and (re)builds stale entries"""
+
+    def load(self, file_path: Path) -> Mapping:
+        """Load an instance, unpickling the whole file only if the cache is missing or stale
+
+        Returns a lazy InstanceData whenever the split cache exists or could be written,
+        the unpickled data itself only if the cache directory is not writable.
+        """
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"Instance file not found: {file_path}")
+
+        instance_data = self.read(file_path)
+        if instance_data is not None:
+            logger.info(f"Loaded instance from cache: {file_path}")
+            return instance_data
+
+        with open(file_path, "rb") as f:
+            instance_data = pickle.load(f)
+        if isinstance(instance_data, dict) and self.write(file_path, instance_data):
+            # Same type for every caller, the unpickled dict is released
+            return self.read(file_path) or instance_data
+        return instance_data
+
+    def get_entry_path(self, file_path: Path) -> Path:
+        """Cache directory of an instance pickle"""
+        return Path(file_path).parent / SOLUTION_CACHE_DIRNAME / f"instance_{Path(file_path).stem}"
+
+    def read(self, file_path: Path) -> Optional[InstanceData]:
+        """Lazy view on a cached instance, None if there is no valid entry"""
+        entry_path = self.get_entry_path(file_path)
+        index_path = entry_path / INDEX_FILE
+        if not index_path.exists():
+            return None
+
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+
+            stamp = self._get_source_stamp(file_path)
+            if any(index.get(key) != value for key, value in stamp.items()):
+                logger.debug(f"Instance cache is stale: {file_path}")
+                return None
+
+            return InstanceData(entry_path, index["files"])
+
+        except Exception as e:
+            logger.warning(f"Could not read instance cache {entry_path}: {e}")
+            return None
+
+    def write(self, file_path: Path, instance_data: Dict[str, Any]) -> bool:
+        """Split an instance into one pickle per entry, returns False if that was not possible"""
+        entry_path = self.get_entry_path(file_path)
+        tmp_path = None
+
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write into a temporary directory first so readers never see a partial entry
+            tmp_path = Path(tempfile.mkdtemp(dir=entry_path.parent, prefix=f".{entry_path.name}-"))
+            os.chmod(tmp_path, 0o755)
+            counter = itertools.count()
+
+            def dump(value: Any) -> str:
+                file_name = f"{next(counter)}.pkl"
+                with open(tmp_path / file_name, 'wb') as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                return file_name
+
+            files = {}
+            for key, value in instance_data.items():
+                if isinstance(value, dict) and all(isinstance(name, str) for name in value):
+                    files[key] = {name: dump(entry) for name, entry in value.items()}
+                else:
+                    files[key] = dump(value)
+
+            with open(tmp_path / INDEX_FILE, 'w', encoding='utf-8') as f:
+                json.dump({**self._get_source_stamp(file_path), "files": files}, f)
+
+            if entry_path.exists():
+                shutil.rmtree(entry_path, ignore_errors=True)
+            os.replace(tmp_path, entry_path)
+            tmp_path = None
+
+            logger.info(f"Stored instance cache for {file_path} in {entry_path}")
+            return True
+
+        except Exception as e:
+            # A read-only use case directory must not break loading the instance
+            logger.warning(f"Could not write instance cache for {file_path}: {e}")
+            return False
+
+        finally:
+            if tmp_path is not None:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+
+    @staticmethod
+    def _get_source_stamp(file_path: Path) -> Dict[str, Any]:
+        """Fields that decide whether a cache entry still matches its source"""
+        stat = Path(file_path).stat()
+        return {
+            "version": INSTANCE_CACHE_VERSION,
+            "source": str(Path(file_path).resolve()),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns
+        }
@@ -1,29 +1,89 @@
 """
 Instance management for discovering and loading optimization instances
 """
+import fnmatch
 import json
-import pickle
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Set, Tuple
 from datetime import datetime
 import logging
 
+import pandas as pd
+
 from .data_models import InstanceMetadata, OptimizationSolution
 from .solution_parser import SolutionParser
-from config.app_config import USE_CASES_PATH, INSTANCES_PATH, INSTANCE_CONFIG_FILES, SOLUTION_FILE_PATTERN
+from .solution_cache import SolutionCache
+from .memory_cache import FileMemoryCache
+from .instance_watcher import InstanceWatcher
+from .instance_data import InstanceDataCache
+from .preprocessed_data import PreprocessedStore, load_preprocessed
+from .benders_timings import BendersTimings, TIMINGS_FILE, load_benders_timings
+from .benders_log import BendersLog, LOG_FILE, load_benders_log
+from .benders_live import BendersRunMonitor
+from .subproblem_artifacts import TEMP_DIR, load_artifact_index
+from .mps_stats import load_mps_stats
+from .iis_reader import IisModel, IIS_FILE_PATTERN, read_iis
+from .processed_results import ProcessedResults, PROCESSED_RESULTS_DIR, load_processed_results
+from .instance_manifest import read_manifest, write_manifest, hash_file
+from utils.file_utils import count_csv_records
+from config.app_config import USE_CASES_PATH, INSTANCES_PATH, INSTANCE_CONFIG_FILES, INSTANCE_CONFIG_DIRS, SOLUTION_FILE_PATTERN, SOLUTION_PARSER_WORKERS, MPS_STATS_WORKERS, PROCESSED_RESULTS_WORKERS, SOLUTION_MEMORY_CACHE_SIZE, INSTANCE_DATA_CACHE_SIZE, PREPROCESSED_DATA_CACHE_SIZE, BENDERS_DATA_CACHE_SIZE, IIS_DATA_CACHE_SIZE, SOLUTION_CACHE_DIRNAME, INSTANCE_WATCHER_POLL_INTERVAL, INSTANCE_SCAN_WORKERS, INSTANCE_SCAN_TIMEOUT, RUN_MONITOR_CACHE_SIZE
 
 logger = logging.getLogger(__name__)
 
+# Poll interval while waiting for queued directory scans to start (seconds)
+SCAN_START_POLL_INTERVAL = 0.05
+
 class InstanceManager:
     """Manages optimization instances and their metadata"""
     
     def __init__(self, use_case_name: str = None):
-        self.solution_parser = SolutionParser()
+        self.solution_parser = SolutionParser(workers=SOLUTION_PARSER_WORKERS)
+        self.solution_cache = SolutionCache(self.solution_parser)
+        self.solution_memory_cache = FileMemoryCache(SOLUTION_MEMORY_CACHE_SIZE)
+        # Instance pickles, split on disk and shared in memory like the solutions
+        self.instance_data_cache = InstanceDataCache()
+        self.instance_data_memory_cache = FileMemoryCache(INSTANCE_DATA_CACHE_SIZE)
+        self.preprocessed_memory_cache = FileMemoryCache(PREPROCESSED_DATA_CACHE_SIZE)
+        self.benders_memory_cache = FileMemoryCache(BENDERS_DATA_CACHE_SIZE)
+        self.iis_memory_cache = FileMemoryCache(IIS_DATA_CACHE_SIZE)
+        # Benders run directory -> monitor of the live view, shared by all sessions (LRU)
+        self._run_monitors: "OrderedDict[Path, BendersRunMonitor]" = OrderedDict()
+        self._run_monitors_lock = threading.Lock()
+        # instance directory -> (file stamps, metadata), see _get_instance_files
+        self._metadata_cache: Dict[Path, Tuple[Dict[str, Any], InstanceMetadata]] = {}
+        self._metadata_lock = threading.Lock()
+        # CSV path -> (mtime_ns, size, record count)
+        self._record_count_cache: Dict[Path, Tuple[int, int, int]] = {}
+        # Instance catalog maintained by the file system watcher (None while not watching)
+        self.watcher: Optional[InstanceWatcher] = None
+        self._catalog: Optional[Dict[Path, InstanceMetadata]] = None
+        self.catalog_version = 0  # incremented on every change reported by the watcher
         self.use_cases_path = USE_CASES_PATH
         self.instances_path = INSTANCES_PATH
+        self.scan_workers = INSTANCE_SCAN_WORKERS
+        self.scan_timeout = INSTANCE_SCAN_TIMEOUT
+        # Long-lived scan threads; a directory whose scan hangs keeps its future and is not submitted again.
+        # Daemon threads, since a hung scan cannot be joined and must not keep the process from exiting
+        self._scan_queue: "queue.Queue[Tuple[Future, Path, str]]" = queue.Queue()
+        self._scan_threads: List[threading.Thread] = []
+        self._scan_futures: Dict[Path, Future] = {}
+        self._scan_started: Dict[Path, float] = {}  # directory -> monotonic start of its running scan
+        self._scan_lock = threading.Lock()
 
     def discover_instances(self) -> List[InstanceMetadata]:
         """Discover all available instances in use_cases and data/instances"""
+        # The watcher keeps the catalog up to date, no need to scan again
+        if self.watcher is not None and self.watcher.is_running:
+            with self._metadata_lock:
+                if self._catalog is not None:
+                    return list(self._catalog.values())
+        
         instances = []
         
         # Check use_cases directory
@@ -33,26 +93,263 @@ class InstanceManager:
         # Check data/instances directory  
         if self.instances_path.exists():
             instances.extend(self._scan_directory(self.instances_path, "data_instance"))
+        
+        # Forget instances whose directories are gone
+        current_paths = {instance.path for instance in instances}
+        with self._metadata_lock:
+            for path in [path for path in self._metadata_cache if path not in current_paths]:
+                del self._metadata_cache[path]
+            if self.watcher is not None and self.watcher.is_running:
+                self._catalog = {instance.path: instance for instance in instances}
             
         logger.info(f"Discovered {len(instances)} instances")
         return instances
     
+    def start_watcher(self, poll_interval: float = INSTANCE_WATCHER_POLL_INTERVAL):
+        """Watch the instance directories in the background and update the catalog on changes"""
+        if self.watcher is not None and self.watcher.is_running:
+            return
+        
+        self.watcher = InstanceWatcher(
+            [self.use_cases_path, self.instances_path],
+            self.handle_file_changes,
+            poll_interval=poll_interval
+        )
+        self.watcher.start()
+    
+    def stop_watcher(self):
+        """Stop the background watcher, discovery scans the directories again"""
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+        with self._metadata_lock:
+            self._catalog = None
+    
+    def handle_file_changes(self, changed_paths: Set[Path]):
+        """Update the catalog and caches for changed files (called by the watcher)"""
+        affected_instances = {}
+        
+        for path in changed_paths:
+            # Parsed solutions of changed .sol files are outdated
+            if path.suffix == SOLUTION_FILE_PATTERN.lstrip('*'):
+                self.solution_memory_cache.invalidate(path)
+            
+            for root, instance_type in ((self.use_cases_path, "use_case"), (self.instances_path, "data_instance")):
+                try:
+                    relative = path.relative_to(root)
+                except ValueError:
+                    continue
+                # Changes of the root directory itself are covered by the changed children
+                if relative.parts:
+                    affected_instances[root / relative.parts[0]] = instance_type
+                break
+        
+        for instance_path, instance_type in affected_instances.items():
+            with self._metadata_lock:
+                self._metadata_cache.pop(instance_path, None)
+            
+            instance = None
+            if instance_path.is_dir() and not instance_path.name.startswith('.'):
+                instance = self._create_instance_metadata(instance_path, instance_type)
+            
+            with self._metadata_lock:
+                if self._catalog is not None:
+                    if instance:
+                        self._catalog[instance_path] = instance
+                    else:
+                        self._catalog.pop(instance_path, None)
+        
+        if affected_instances:
+            self.catalog_version += 1
+            logger.info(f"Updated {len(affected_instances)} instances after file changes")
+    
     def _scan_directory(self, directory: Path, instance_type: str) -> List[InstanceMetadata]:
-        """Scan a directory for instances"""
-        instances = []
+        """Scan a directory for instances, sorted by name
         
+        The instance directories are read by up to `scan_workers` threads, slow
+        directories (e.g. on network shares) no longer add up. A directory whose scan
+        has been running for longer than `scan_timeout` keeps its last known metadata,
+        if any; its scan goes on in the background and is not started again meanwhile.
+        """
         try:
-            for item in directory.iterdir():
-                if item.is_dir() and not item.name.startswith('.'):
-                    instance = self._create_instance_metadata(item, instance_type)
-                    if instance:
-                        instances.append(instance)
+            instance_paths = sorted(
+                (item for item in directory.iterdir() if item.is_dir() and not item.name.startswith('.')),
+                key=lambda item: item.name
+            )
         except Exception as e:
             logger.error(f"Error scanning directory {directory}: {e}")
-            
+            return []
+        
+        if self.scan_workers <= 1 or len(instance_paths) <= 1:
+            results = [self._create_instance_metadata(item, instance_type) for item in instance_paths]
+            return [instance for instance in results if instance]
+        
+        futures = {item: self._submit_scan(item, instance_type) for item in instance_paths}
+        pending = self._wait_for_scans(futures)
+        
+        # Collect in directory order so the result does not depend on thread timing
+        instances = []
+        for item, future in futures.items():
+            if future in pending:
+                logger.warning(f"Scan of {item} did not finish within {self.scan_timeout}s, using cached metadata")
+                with self._metadata_lock:
+                    cached = self._metadata_cache.get(item)
+                instance = cached[1] if cached else None
+            else:
+                try:
+                    instance = future.result()
+                except Exception as e:
+                    logger.error(f"Error creating metadata for {item}: {e}")
+                    instance = None
+            if instance:
+                instances.append(instance)
+        
         return instances
     
+    def _submit_scan(self, instance_path: Path, instance_type: str) -> Future:
+        """Future of the metadata scan of a directory, reusing a scan that is still running"""
+        with self._scan_lock:
+            future = self._scan_futures.get(instance_path)
+            if future is not None and not future.done():
+                return future
+            future = Future()
+            self._scan_futures[instance_path] = future
+            if len(self._scan_threads) < self.scan_workers:
+                thread = threading.Thread(
+                    target=self._scan_worker, name=f"instance-scan_{len(self._scan_threads)}", daemon=True
+                )
+                self._scan_threads.append(thread)
+                thread.start()
+        self._scan_queue.put((future, instance_path, instance_type))
+        return future
+    
+    def _scan_worker(self):
+        """Run queued directory scans and complete their futures"""
+        while True:
+            future, instance_path, instance_type = self._scan_queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            with self._scan_lock:
+                self._scan_started[instance_path] = time.monotonic()
+            try:
+                future.set_result(self._create_instance_metadata(instance_path, instance_type))
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                with self._scan_lock:
+                    self._scan_started.pop(instance_path, None)
+                    if self._scan_futures.get(instance_path) is future:
+                        del self._scan_futures[instance_path]
+    
+    def _wait_for_scans(self, futures: Dict[Path, Future]) -> Set[Future]:
+        """Wait until every scan finished or ran out of time, returns the unfinished ones
+        
+        The timeout of a scan counts from its start. Scans still queued are waited for
+        as long as a scan thread can pick them up, i.e. not all threads are stuck in
+        scans that are over time.
+        """
+        pending = set(futures.values())
+        while pending:
+            now = time.monotonic()
+            with self._scan_lock:
+                started = dict(self._scan_started)
+            overdue = sum(1 for start in started.values() if now - start >= self.scan_timeout)
+            deadlines = [
+                started[item] + self.scan_timeout for item, future in futures.items()
+                if future in pending and item in started and now - started[item] < self.scan_timeout
+            ]
+            queued = any(future in pending and item not in started for item, future in futures.items())
+            
+            if deadlines:
+                timeout = min(deadlines) - now
+            elif queued and overdue < self.scan_workers:
+                # Queued scans are about to be picked up by a free thread
+                timeout = SCAN_START_POLL_INTERVAL
+            else:
+                break
+            _, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        return pending
+    
     def _create_instance_metadata(self, instance_path: Path, instance_type: str) -> Optional[InstanceMetadata]:
+        """Get instance metadata from the cache or the instance manifest, rebuilding it only if the directory changed"""
+        try:
+            files = self._get_instance_files(instance_path)
+        except OSError as e:
+            logger.error(f"Error creating metadata for {instance_path}: {e}")
+            return None
+        
+        with self._metadata_lock:
+            cached = self._metadata_cache.get(instance_path)
+        if cached is not None and cached[0] == files:
+            return cached[1]
+        
+        manifest = read_manifest(instance_path)
+        if manifest is not None and manifest.get("files") == files:
+            instance = self._metadata_from_manifest(instance_path, manifest)
+        else:
+            instance = self._build_instance_metadata(instance_path, instance_type, files)
+            if instance:
+                write_manifest(instance_path, self._create_manifest(instance, files, manifest))
+        
+        if instance:
+            with self._metadata_lock:
+                self._metadata_cache[instance_path] = (files, instance)
+        return instance
+    
+    def _get_instance_files(self, instance_path: Path) -> Dict[str, Any]:
+        """Stamps of everything the instance metadata is derived from
+        
+        Solution files (results directory first), results subfolders and the
+        path, mtime and size of the config files. Only lists and plain values, so the
+        stamps compare equal to the copy stored in the instance manifest.
+        """
+        solutions = []
+        results_subfolders = []
+        
+        results_dir = instance_path / "results"
+        for directory in (results_dir, instance_path):
+            if not directory.is_dir():
+                continue
+            with os.scandir(directory) as entries:
+                for entry in sorted(entries, key=lambda entry: entry.name):
+                    if entry.is_file() and fnmatch.fnmatch(entry.name, SOLUTION_FILE_PATTERN):
+                        stat = entry.stat()
+                        solutions.append({
+                            "path": str(Path(entry.path).relative_to(instance_path)),
+                            "size": stat.st_size,
+                            "mtime_ns": stat.st_mtime_ns
+                        })
+                    elif directory == results_dir and entry.is_dir() and not entry.name.startswith('.'):
+                        results_subfolders.append(entry.name)
+        
+        return {
+            "solutions": solutions,
+            "results_subfolders": results_subfolders,
+            "config_files": self._get_config_file_stamps(instance_path)
+        }
+    
+    def _get_config_file_stamps(self, instance_path: Path) -> Dict[str, Dict[str, Any]]:
+        """Path (relative to the instance), mtime and size of the existing config files
+        
+        Each file is looked up in INSTANCE_CONFIG_DIRS, the first directory containing it wins.
+        """
+        stamps = {}
+        for config_file in INSTANCE_CONFIG_FILES:
+            for config_dir in INSTANCE_CONFIG_DIRS:
+                relative_path = Path(config_dir) / config_file
+                try:
+                    stat = (instance_path / relative_path).stat()
+                except (FileNotFoundError, NotADirectoryError):
+                    continue
+                stamps[config_file] = {
+                    "path": relative_path.as_posix(),
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns
+                }
+                break
+        return stamps
+    
+    def _build_instance_metadata(self, instance_path: Path, instance_type: str, files: Dict[str, Any]) -> Optional[InstanceMetadata]:
         """Create instance metadata from a directory"""
         try:
             # Get basic info
@@ -60,31 +357,12 @@ class InstanceManager:
             created_date = datetime.fromtimestamp(stat.st_ctime)
             modified_date = datetime.fromtimestamp(stat.st_mtime)
             
-            # Check for config files
-            config_files = {}
-            for config_file in INSTANCE_CONFIG_FILES:
-                file_path = instance_path / config_file
-                if file_path.exists():
-                    config_files[config_file] = file_path
-            
-            # Look for solution file
-            solution_path = None
-            has_solution = False
-            
-            # Check in results subdirectory first
-            results_dir = instance_path / "results"
-            if results_dir.exists():
-                for sol_file in results_dir.glob(SOLUTION_FILE_PATTERN):
-                    solution_path = sol_file
-                    has_solution = True
-                    break
+            # Config files and solution files as found by _get_instance_files
+            config_files = {config_file: instance_path / stamp["path"] for config_file, stamp in files["config_files"].items()}
             
-            # Check in main directory if not found in results
-            if not has_solution:
-                for sol_file in instance_path.glob(SOLUTION_FILE_PATTERN):
-                    solution_path = sol_file
-                    has_solution = True
-                    break
+            # Solutions in the results subdirectory come first
+            solution_path = instance_path / files["solutions"][0]["path"] if files["solutions"] else None
+            has_solution = solution_path is not None
             
             # Try to extract additional metadata from config files
             num_buildings = None
@@ -114,12 +392,86 @@ class InstanceManager:
             logger.error(f"Error creating metadata for {instance_path}: {e}")
             return None
     
+    def _create_manifest(self, instance: InstanceMetadata, files: Dict[str, Any],
+                         previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Manifest content for an instance, keeping the validation status if the config files are unchanged"""
+        config_hashes = {}
+        for config_file, file_path in instance.config_files.items():
+            try:
+                config_hashes[config_file] = hash_file(file_path)
+            except OSError as e:
+                logger.warning(f"Could not hash {file_path}: {e}")
+        
+        validation = None
+        if previous is not None and previous.get("config_hashes") == config_hashes:
+            validation = previous.get("validation")
+        
+        return {
+            "files": files,
+            "description": instance.description,
+            "num_buildings": instance.num_buildings,
+            "num_time_periods": instance.num_time_periods,
+            "config_hashes": config_hashes,
+            "validation": validation
+        }
+    
+    def _metadata_from_manifest(self, instance_path: Path, manifest: Dict[str, Any]) -> Optional[InstanceMetadata]:
+        """Create instance metadata from an up-to-date manifest, without reading the config files"""
+        try:
+            stat = instance_path.stat()
+            solutions = manifest["files"]["solutions"]
+            solution_path = instance_path / solutions[0]["path"] if solutions else None
+            
+            return InstanceMetadata(
+                name=instance_path.name,
+                path=instance_path,
+                description=manifest["description"],
+                created_date=datetime.fromtimestamp(stat.st_ctime),
+                modified_date=datetime.fromtimestamp(stat.st_mtime),
+                num_buildings=manifest["num_buildings"],
+                num_time_periods=manifest["num_time_periods"],
+                has_solution=solution_path is not None,
+                solution_path=solution_path,
+                config_files={config_file: instance_path / stamp["path"] for config_file, stamp in manifest["files"]["config_files"].items()}
+            )
+            
+        except Exception as e:
+            logger.error(f"Error creating metadata for {instance_path}: {e}")
+            return None
+    
+    def get_instance_manifest(self, instance: InstanceMetadata) -> Optional[Dict[str, Any]]:
+        """Manifest of an instance (results subfolders, solution sizes, config hashes, ...)"""
+        return read_manifest(instance.path)
+    
+    def get_validation_status(self, instance: InstanceMetadata) -> Optional[Dict[str, str]]:
+        """Last validation status stored in the manifest, None if the config files changed since"""
+        manifest = read_manifest(instance.path)
+        if manifest is None or not manifest.get("validation"):
+            return None
+        if manifest["files"]["config_files"] != self._get_config_file_stamps(instance.path):
+            return None
+        return manifest["validation"]
+    
+    def store_validation_status(self, instance: InstanceMetadata, status: Dict[str, str]):
+        """Remember the validation status in the manifest of the instance"""
+        manifest = read_manifest(instance.path)
+        # Outdated manifests are rebuilt by the next discovery, the status is stored after that
+        if manifest is None or manifest["files"]["config_files"] != self._get_config_file_stamps(instance.path):
+            return
+        manifest["validation"] = status
+        write_manifest(instance.path, manifest)
+    
     def _count_buildings_from_csv(self, csv_path: Path) -> Optional[int]:
-        """Count buildings from stock properties CSV"""
+        """Count buildings from stock properties CSV (one record per building)"""
         try:
-            import pandas as pd
-            df = pd.read_csv(csv_path)
-            return len(df)
+            stat = csv_path.stat()
+            cached = self._record_count_cache.get(csv_path)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return cached[2]
+            
+            num_buildings = count_csv_records(csv_path)
+            self._record_count_cache[csv_path] = (stat.st_mtime_ns, stat.st_size, num_buildings)
+            return num_buildings
         except Exception as e:
             logger.warning(f"Could not count buildings from {csv_path}: {e}")
             return None
@@ -154,11 +506,148 @@ class InstanceManager:
             return None
             
         try:
-            return self.solution_parser.parse_solution_file(instance.solution_path)
+            return self.solution_memory_cache.get_or_load(instance.solution_path, self.solution_cache.load_solution)
         except Exception as e:
             logger.error(f"Error loading solution for {instance.name}: {e}")
             return None
     
+    def get_clustered_timeseries_files(self, instance: InstanceMetadata) -> Dict[int, Path]:
+        """clustered_ts_<n>.pkl files of an instance by their number (one file per building)"""
+        files = {}
+        for path in (instance.path / "data" / "preprocessed" / "clustered_ts").glob("clustered_ts_*.pkl"):
+            number = path.stem.rsplit("_", 1)[-1]
+            if number.isdigit():
+                files[int(number)] = path
+        return dict(sorted(files.items()))
+    
+    def load_preprocessed_data(self, pkl_path: Path) -> Optional[PreprocessedStore]:
+        """Columnar view of a preprocessed pickle, converted on first use and shared by all sessions"""
+        try:
+            return self.preprocessed_memory_cache.get_or_load(pkl_path, load_preprocessed)
+        except Exception as e:
+            logger.error(f"Error loading preprocessed data {pkl_path}: {e}")
+            return None
+    
+    def get_benders_runs(self, instance: InstanceMetadata) -> Dict[str, Path]:
+        """Benders run directories of an instance (results subfolders with a logging directory)"""
+        results_dir = instance.path / "results"
+        if not results_dir.is_dir():
+            return {}
+        return {
+            path.name: path for path in sorted(results_dir.iterdir())
+            if path.is_dir() and (path / TIMINGS_FILE.parent).is_dir()
+        }
+    
+    def load_benders_timings(self, run_path: Path) -> Optional[BendersTimings]:
+        """Timing tables of a Benders run, None if the run has no iteration_timings.json"""
+        file_path = run_path / TIMINGS_FILE
+        if not file_path.exists():
+            return None
+        try:
+            return self.benders_memory_cache.get_or_load(file_path, load_benders_timings)
+        except Exception as e:
+            logger.error(f"Error loading Benders timings {file_path}: {e}")
+            return None
+    
+    def load_benders_log(self, run_path: Path) -> Optional[BendersLog]:
+        """Cut and convergence tables of a Benders run, None if the run has no benders.log"""
+        file_path = run_path / LOG_FILE
+        if not file_path.exists():
+            return None
+        try:
+            return self.benders_memory_cache.get_or_load(file_path, load_benders_log)
+        except Exception as e:
+            logger.error(f"Error loading Benders log {file_path}: {e}")
+            return None
+    
+    def load_subproblem_artifacts(self, run_path: Path) -> Optional[pd.DataFrame]:
+        """Catalog of the subproblem files in the temp directory of a Benders run, None if there is none"""
+        temp_dir = run_path / TEMP_DIR
+        if not temp_dir.is_dir():
+            return None
+        try:
+            return load_artifact_index(temp_dir)
+        except Exception as e:
+            logger.error(f"Error indexing Benders temp directory {temp_dir}: {e}")
+            return None
+    
+    def load_mps_stats(self, run_path: Path) -> Optional[pd.DataFrame]:
+        """Model statistics of the subproblem MPS files of a Benders run, None without temp directory"""
+        temp_dir = run_path / TEMP_DIR
+        if not temp_dir.is_dir():
+            return None
+        try:
+            return load_mps_stats(temp_dir, MPS_STATS_WORKERS)
+        except Exception as e:
+            logger.error(f"Error reading MPS statistics in {temp_dir}: {e}")
+            return None
+    
+    def get_processed_results_runs(self, instance: InstanceMetadata) -> Dict[str, Path]:
+        """Results subfolders of an instance with a processed_results directory"""
+        results_dir = instance.path / "results"
+        if not results_dir.is_dir():
+            return {}
+        return {
+            path.name: path for path in sorted(results_dir.iterdir())
+            if path.is_dir() and (path / PROCESSED_RESULTS_DIR).is_dir()
+        }
+    
+    def load_processed_results(self, run_path: Path) -> Optional[ProcessedResults]:
+        """Long-format table of the processed_results JSON files of a run, None if there are none"""
+        results_dir = run_path / PROCESSED_RESULTS_DIR
+        if not results_dir.is_dir():
+            return None
+        try:
+            return load_processed_results(results_dir, PROCESSED_RESULTS_WORKERS)
+        except Exception as e:
+            logger.error(f"Error loading processed results {results_dir}: {e}")
+            return None
+    
+    def get_iis_files(self, instance: InstanceMetadata) -> Dict[str, Path]:
+        """IIS files (.ilp) in the results directory of an instance by their path relative to it"""
+        results_dir = instance.path / "results"
+        if not results_dir.is_dir():
+            return {}
+        return {
+            str(path.relative_to(results_dir)): path for path in sorted(results_dir.rglob(IIS_FILE_PATTERN))
+            if SOLUTION_CACHE_DIRNAME not in path.parts
+        }
+    
+    def load_iis(self, ilp_path: Path) -> Optional[IisModel]:
+        """Constraint table and variable index of an IIS file, parsed once and shared by all sessions"""
+        try:
+            return self.iis_memory_cache.get_or_load(ilp_path, read_iis)
+        except Exception as e:
+            logger.error(f"Error reading IIS file {ilp_path}: {e}")
+            return None
+    
+    def get_run_monitor(self, run_path: Path) -> Optional[BendersRunMonitor]:
+        """Live monitor of a (running) Benders run, created on first use"""
+        with self._run_monitors_lock:
+            monitor = self._run_monitors.get(run_path)
+            if monitor is not None:
+                self._run_monitors.move_to_end(run_path)
+                return monitor
+        
+        # Loading the logs can take a while, the lock is not held meanwhile so other runs stay live
+        try:
+            monitor = BendersRunMonitor(run_path)
+        except Exception as e:
+            logger.error(f"Error creating live monitor for {run_path}: {e}")
+            return None
+        
+        with self._run_monitors_lock:
+            # Keep the monitor of a session that was faster, so all sessions share one
+            monitor = self._run_monitors.setdefault(run_path, monitor)
+            self._run_monitors.move_to_end(run_path)
+            while len(self._run_monitors) > RUN_MONITOR_CACHE_SIZE:
+                self._run_monitors.popitem(last=False)
+        return monitor
+    
+    def get_solution_cache_stats(self) -> Dict[str, int]:
+        """Hit/miss statistics of the in-memory solution cache"""
+        return self.solution_memory_cache.get_stats()
+
     def get_instance_by_name(self, name: str) -> Optional[InstanceMetadata]:
         """Get a specific instance by name"""
         instances = self.discover_instances()
@@ -190,10 +679,12 @@ class InstanceManager:
         return validation
 
     def load_instance_from_pickle(self, use_case_name: str):
-        """Load an instance from a pickle file in USE_CASES_PATH"""
+        """Load an instance from a pickle file in USE_CASES_PATH
+        
+        Loaded once per file version and shared by all sessions. Parameters and sets
+        are unpickled on first access (see InstanceDataCache).
+        """
         pkl_path = USE_CASES_PATH / use_case_name / f"{use_case_name}.pkl"
         if not pkl_path.exists():
             raise FileNotFoundError(f"Instance file not found: {pkl_path}")
-        with open(pkl_path, "rb") as f:
-            instance_data = pickle.load(f)
-        return instance_data
+        return self.instance_data_memory_cache.get_or_load(pkl_path, self.instance_data_cache.load)
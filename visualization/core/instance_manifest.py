@@ -0,0 +1,82 @@
+"""
+Per-instance manifest file with the discovery metadata and validation status
+
+The manifest stores everything instance discovery and the overview traffic lights
+need (building count, time periods, solution files, results subfolders, config file
+hashes, last validation status). As long as the file stamps recorded in it match the
+instance directory, discovery reads this one small file instead of the inputs.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+import logging
+
+from config.app_config import INSTANCE_MANIFEST_FILE
+
+logger = logging.getLogger(__name__)
+
+# Increment when the manifest layout changes, older manifests are rebuilt
+MANIFEST_VERSION = 2
+
+HASH_BUFFER_SIZE = 1024 * 1024
+
+
+def get_manifest_path(instance_path: Path) -> Path:
+    return instance_path / INSTANCE_MANIFEST_FILE
+
+
+def read_manifest(instance_path: Path) -> Optional[Dict[str, Any]]:
+    """Manifest of an instance, None if it is missing, unreadable or outdated"""
+    manifest_path = get_manifest_path(instance_path)
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read instance manifest {manifest_path}: {e}")
+        return None
+
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def write_manifest(instance_path: Path, manifest: Dict[str, Any]) -> bool:
+    """Write the manifest atomically, returns False if that was not possible"""
+    manifest_path = get_manifest_path(instance_path)
+    tmp_path = None
+
+    try:
+        # Write a temporary file first so readers never see a partial manifest
+        fd, tmp_path = tempfile.mkstemp(dir=instance_path, prefix=f".{manifest_path.name}-")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({**manifest, "version": MANIFEST_VERSION}, f, indent=2)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, manifest_path)
+        tmp_path = None
+        return True
+
+    except OSError as e:
+        # A read-only instance directory must not break discovery
+        logger.warning(f"Could not write instance manifest {manifest_path}: {e}")
+        return False
+
+    finally:
+        if tmp_path is not None:
+            Path(tmp_path).unlink(missing_ok=True)
+
+
+def hash_file(file_path: Path) -> str:
+    """SHA-1 of a file's content"""
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(HASH_BUFFER_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,166 @@
+"""
+Background file system watcher for instance and result directories
+
+Uses watchdog (inotify on Linux) when it is installed and falls back to polling
+the directory trees otherwise. Changed paths are reported in batches to a
+callback, which lets the InstanceManager update only the affected instances.
+"""
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+import logging
+
+from config.app_config import SOLUTION_CACHE_DIRNAME, INSTANCE_MANIFEST_FILE
+
+logger = logging.getLogger(__name__)
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    # watchdog not installed - use polling
+    WATCHDOG_AVAILABLE = False
+
+ChangeCallback = Callable[[Set[Path]], None]
+
+# watchdog event types that change the file system (opened/closed_no_write are reads)
+CHANGE_EVENT_TYPES = {"created", "deleted", "modified", "moved", "closed"}
+
+
+def is_ignored(name: str) -> bool:
+    """Files written by the app itself: parse caches and instance manifests (incl. their temp files)"""
+    return name == SOLUTION_CACHE_DIRNAME or name.lstrip('.').startswith(INSTANCE_MANIFEST_FILE)
+
+
+class InstanceWatcher:
+    """Watches directory trees and reports changed paths to a callback"""
+
+    def __init__(self, roots: Iterable[Path], on_change: ChangeCallback, poll_interval: float = 2.0,
+                 use_watchdog: bool = True):
+        self.roots = [Path(root) for root in roots]
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.use_watchdog = use_watchdog and WATCHDOG_AVAILABLE
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._observer = None
+        # Paths reported by watchdog since the last batch
+        self._pending: Set[Path] = set()
+        self._pending_lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def mode(self) -> str:
+        return "inotify" if self.use_watchdog else "polling"
+
+    def start(self):
+        """Start watching in a daemon thread"""
+        if self.is_running:
+            return
+
+        self._stop_event.clear()
+        roots = [root for root in self.roots if root.exists()]
+
+        if self.use_watchdog:
+            self._observer = Observer()
+            handler = _ChangeHandler(self._add_pending)
+            for root in roots:
+                self._observer.schedule(handler, str(root), recursive=True)
+            self._observer.start()
+            target, args = self._run_batches, ()
+        else:
+            # Reference snapshot taken before returning, changes right after start() are not missed
+            target, args = self._run_polling, (self._take_snapshot(),)
+
+        self._thread = threading.Thread(target=target, args=args, name="instance-watcher", daemon=True)
+        self._thread.start()
+        logger.info(f"Instance watcher started ({self.mode}) for {', '.join(str(root) for root in roots)}")
+
+    def stop(self):
+        """Stop watching"""
+        self._stop_event.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _add_pending(self, path: str):
+        with self._pending_lock:
+            self._pending.add(Path(path))
+
+    def _run_batches(self):
+        """Forward watchdog events in batches, bursts of writes cause a single update"""
+        while not self._stop_event.wait(self.poll_interval):
+            with self._pending_lock:
+                changed, self._pending = self._pending, set()
+            if changed:
+                self._notify(changed)
+
+    def _run_polling(self, snapshot: Dict[Path, Tuple[int, int]]):
+        """Compare snapshots of the watched trees in a fixed interval"""
+        while not self._stop_event.wait(self.poll_interval):
+            new_snapshot = self._take_snapshot()
+            changed = {
+                path for path in snapshot.keys() | new_snapshot.keys()
+                if snapshot.get(path) != new_snapshot.get(path)
+            }
+            snapshot = new_snapshot
+            if changed:
+                self._notify(changed)
+
+    def _take_snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        """(mtime, size) of every file and directory below the roots"""
+        snapshot = {}
+        stack: List[str] = [str(root) for root in self.roots if root.exists()]
+
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        # Skip parse caches and manifests, they change whenever an instance is loaded
+                        if is_ignored(entry.name):
+                            continue
+                        stat = entry.stat(follow_symlinks=False)
+                        snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+            except OSError:
+                # Directory removed while scanning, the next snapshot catches up
+                continue
+
+        return snapshot
+
+    def _notify(self, changed: Set[Path]):
+        try:
+            self.on_change(changed)
+        except Exception as e:
+            logger.error(f"Error handling file changes: {e}")
+
+
+if WATCHDOG_AVAILABLE:
+    class _ChangeHandler(FileSystemEventHandler):
+        """Collects the paths of all watchdog events"""
+
+        def __init__(self, add_path: Callable[[str], None]):
+            super().__init__()
+            self.add_path = add_path
+
+        def on_any_event(self, event):
+            # Reading files (e.g. parsing a solution) must not count as a change
+            if event.event_type not in CHANGE_EVENT_TYPES:
+                return
+            if any(is_ignored(part) for part in Path(event.src_path).parts):
+                return
+            self.add_path(event.src_path)
+            dest_path = getattr(event, "dest_path", None)
+            if dest_path:
+                self.add_path(dest_path)
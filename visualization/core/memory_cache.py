@@ -0,0 +1,103 @@
+"""
+In-memory LRU cache of objects loaded from files
+
+FileMemoryCache is shared by all Streamlit sessions of the app process and holds
+parsed solutions, instance pickles, preprocessed data, Benders timings/logs and IIS
+files. Entries are keyed by path, mtime and size, so a changed file is loaded again.
+Loading runs outside the cache lock: a slow cold load only blocks the sessions
+waiting for the same file, other lookups are answered meanwhile.
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable, Dict, Generic, Tuple, TypeVar
+
+T = TypeVar("T")
+
+CacheKey = Tuple[str, int, int]
+
+
+class FileMemoryCache(Generic[T]):
+    """Thread-safe LRU cache of loaded files keyed by path, mtime and size
+
+    A changed file gets a new key, so stale objects are never returned and age
+    out of the cache. Concurrent requests for a file that is being loaded wait for
+    that load instead of starting their own. Hits and misses are counted for
+    display in the app.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[CacheKey, T]" = OrderedDict()
+        self._loading: Dict[CacheKey, Future] = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(self, file_path: Path, loader: Callable[[Path], T]) -> T:
+        """Return the cached object of a file or load and cache it"""
+        key = self._get_key(file_path)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+            pending = self._loading.get(key)
+            if pending is None:
+                self.misses += 1
+                future = self._loading[key] = Future()
+            else:
+                self.hits += 1
+
+        if pending is not None:
+            # Another session is loading the same file version
+            return pending.result()
+
+        try:
+            value = loader(file_path)
+        except BaseException as e:
+            with self._lock:
+                del self._loading[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._loading[key]
+            # Drop outdated versions of the same file right away
+            for old_key in [k for k in self._entries if k[0] == key[0]]:
+                del self._entries[old_key]
+            self._entries[key] = value
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        future.set_result(value)
+        return value
+
+    def get_stats(self) -> Dict[str, int]:
+        """Hit/miss counters and fill level"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries
+            }
+
+    def invalidate(self, file_path: Path):
+        """Remove all cached versions of a file"""
+        path = str(Path(file_path).resolve())
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == path]:
+                del self._entries[key]
+
+    def clear(self):
+        """Remove all cached objects (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _get_key(file_path: Path) -> CacheKey:
+        stat = Path(file_path).stat()
+        return str(Path(file_path).resolve()), stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,191 @@
+"""
+Model statistics of the subproblem MPS files in the Benders temp directory
+
+read_mps_stats scans an MPS file once, line by line, and only keeps counters and
+min/max values (constant memory): rows by sense, columns, integer columns (between
+INTORG/INTEND markers), nonzeros of the matrix and the objective, bound types and
+the ranges of matrix, objective, right-hand side and bound coefficients (absolute
+nonzero values, like the coefficient statistics of the solver log).
+
+load_mps_stats runs it for all sp_*.mps files of a temp directory in worker processes
+and keeps the results as a CSV table next to the artifact index, keyed by file size and
+mtime, so only new or changed files are read again.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List
+import logging
+
+import numpy as np
+import pandas as pd
+
+from .subproblem_artifacts import ARTIFACT_NAME, read_cached_table, write_cached_table
+from config.app_config import SOLUTION_CACHE_DIRNAME
+
+logger = logging.getLogger(__name__)
+
+STATS_FILE = "mps_stats.csv"
+
+# Increment when the statistics or their columns change
+MPS_STATS_VERSION = 1
+
+BOUND_TYPES = ["UP", "LO", "FX", "FR", "MI", "PL", "BV", "LI", "UI", "SC"]
+
+# Bound types whose line carries a value
+VALUE_BOUND_TYPES = {b"UP", b"LO", b"FX", b"LI", b"UI", b"SC"}
+
+RANGE_NAMES = ["matrix", "objective", "rhs", "bound"]
+
+STATS_COLUMNS = (
+    ["file", "size", "mtime_ns", "rows", "equality_rows", "less_rows", "greater_rows",
+     "columns", "integer_columns", "nonzeros", "objective_nonzeros", "ranges"]
+    + [f"{name}_{end}" for name in RANGE_NAMES for end in ("min", "max")]
+    + [f"bounds_{bound_type.lower()}" for bound_type in BOUND_TYPES]
+    + ["version"]
+)
+
+
+def read_mps_stats(mps_path: Path) -> Dict[str, Any]:
+    """Statistics of one MPS file in a single pass (see module docstring)"""
+    counts = {"rows": 0, "equality_rows": 0, "less_rows": 0, "greater_rows": 0, "columns": 0,
+              "integer_columns": 0, "nonzeros": 0, "objective_nonzeros": 0, "ranges": 0}
+    bounds = {bound_type.encode(): 0 for bound_type in BOUND_TYPES}
+    # [min, max] of the absolute nonzero values
+    ranges = {name: [math.inf, 0.0] for name in RANGE_NAMES}
+    objective_rows = set()  # names of the N rows, usually one
+    section = None
+    previous = None
+    integer = False
+
+    with open(mps_path, 'rb') as f:
+        for line in f:
+            fields = line.split()
+            if not fields or fields[0].startswith(b"*"):
+                continue
+            if not line[:1].isspace():
+                section = fields[0]
+                continue
+
+            if section == b"COLUMNS":
+                if len(fields) >= 3 and fields[1] == b"'MARKER'":
+                    integer = fields[2] == b"'INTORG'"
+                    continue
+                if fields[0] != previous:
+                    previous = fields[0]
+                    counts["columns"] += 1
+                    if integer:
+                        counts["integer_columns"] += 1
+                for row, value in _pairs(fields):
+                    if row in objective_rows:
+                        counts["objective_nonzeros"] += 1
+                        _update_range(ranges["objective"], value)
+                    else:
+                        counts["nonzeros"] += 1
+                        _update_range(ranges["matrix"], value)
+
+            elif section == b"ROWS":
+                sense = fields[0]
+                if sense == b"N":
+                    objective_rows.add(fields[1])
+                    continue
+                counts["rows"] += 1
+                if sense == b"E":
+                    counts["equality_rows"] += 1
+                elif sense == b"L":
+                    counts["less_rows"] += 1
+                elif sense == b"G":
+                    counts["greater_rows"] += 1
+
+            elif section == b"RHS":
+                for row, value in _pairs(fields):
+                    # A right-hand side of the objective row is the negated objective constant
+                    if row not in objective_rows:
+                        _update_range(ranges["rhs"], value)
+
+            elif section == b"RANGES":
+                counts["ranges"] += len(_pairs(fields))
+
+            elif section == b"BOUNDS":
+                bound_type = fields[0]
+                bounds[bound_type] = bounds.get(bound_type, 0) + 1
+                if bound_type in VALUE_BOUND_TYPES and len(fields) >= 4:
+                    _update_range(ranges["bound"], fields[-1])
+
+            elif section == b"ENDATA":
+                break
+
+    stats = dict(counts)
+    for name, (low, high) in ranges.items():
+        stats[f"{name}_min"] = low if low != math.inf else np.nan
+        stats[f"{name}_max"] = high if low != math.inf else np.nan
+    for bound_type in BOUND_TYPES:
+        stats[f"bounds_{bound_type.lower()}"] = bounds[bound_type.encode()]
+    return stats
+
+
+def load_mps_stats(temp_dir: Path, workers: int = 1) -> pd.DataFrame:
+    """Statistics of all sp_*.mps files of a temp directory, one row per file
+
+    Files whose size and mtime match the stored table are not read again, the others
+    are scanned in `workers` processes (1 = in the app process).
+    """
+    temp_dir = Path(temp_dir)
+    stats_path = temp_dir / SOLUTION_CACHE_DIRNAME / STATS_FILE
+    stored = read_cached_table(stats_path, STATS_COLUMNS, MPS_STATS_VERSION)
+    known = {row.file: row._asdict() for row in stored.itertuples(index=False)}
+
+    rows, pending = [], []
+    with os.scandir(temp_dir) as entries:
+        for entry in entries:
+            match = ARTIFACT_NAME.match(entry.name)
+            if not match or match.group(1) or match.group(5) != "mps":
+                continue
+            stat = entry.stat()
+            previous = known.pop(entry.name, None)
+            if previous is not None and previous["size"] == stat.st_size and previous["mtime_ns"] == stat.st_mtime_ns:
+                rows.append(previous)
+            else:
+                pending.append((entry.path, stat.st_size, stat.st_mtime_ns))
+
+    if pending:
+        logger.info(f"Reading statistics of {len(pending)} MPS files in {temp_dir} with {workers} workers")
+        rows.extend(_read_stats_parallel(pending, workers))
+
+    table = pd.DataFrame(rows, columns=STATS_COLUMNS).sort_values("file", ignore_index=True)
+    if pending or known:
+        write_cached_table(stats_path, table)
+    return table
+
+
+def _read_stats_parallel(files: List[tuple], workers: int) -> List[Dict[str, Any]]:
+    paths = [path for path, _, _ in files]
+    if workers > 1 and len(files) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(files))) as executor:
+            results = list(executor.map(read_mps_stats, paths, chunksize=max(len(paths) // (workers * 4), 1)))
+    else:
+        results = [read_mps_stats(path) for path in paths]
+
+    return [
+        {"file": Path(path).name, "size": size, "mtime_ns": mtime_ns, **stats, "version": MPS_STATS_VERSION}
+        for (path, size, mtime_ns), stats in zip(files, results)
+    ]
+
+
+def _pairs(fields: List[bytes]) -> List[tuple]:
+    """(row, value) pairs of a COLUMNS/RHS/RANGES line (name, row, value[, row, value])"""
+    return list(zip(fields[1::2], fields[2::2]))
+
+
+def _update_range(bounds: List[float], value: bytes):
+    try:
+        value = abs(float(value))
+    except ValueError:
+        return
+    if value == 0.0 or value == math.inf:
+        return
+    if value < bounds[0]:
+        bounds[0] = value
+    if value > bounds[1]:
+        bounds[1] = value
@@ -0,0 +1,389 @@
+"""
+Columnar, memory-mappable copies of the preprocessed instance pickles
+
+data/preprocessed/portfolio_data/portfolio_data.pkl and clustered_ts/clustered_ts_<n>.pkl
+are nested dicts whose leaves are mostly sparse numeric tables ({(building, day, step): value}).
+convert_preprocessed_pickle stores every such table as .npy columns (one per key position
+plus the values) with a small JSON index. Rows are grouped by the first integer key
+column (usually the building), so a single building can be sliced from the memory-mapped
+arrays without reading the rest. Leaves that are no numeric tables (sets, lists, scalars)
+are kept as one small pickle each.
+
+The converted data lives in SOLUTION_CACHE_DIRNAME/columnar_<name>/ next to the pickle
+and is rebuilt automatically when the pickle changes. If that directory cannot be
+written (e.g. a read-only results share), load_preprocessed keeps the same tables in
+memory instead.
+"""
+import itertools
+import json
+import numbers
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+
+from config.app_config import SOLUTION_CACHE_DIRNAME
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.json"
+
+# Increment when the layout of the converted data changes
+COLUMNAR_VERSION = 1
+
+class ColumnarTable:
+    """Sparse numeric table {key tuple: value} stored as one array per key position
+
+    Integer key positions are stored as int64, all others as int32 codes into a lookup
+    list. The arrays are memory-mapped, slicing a partition reads only its rows.
+    """
+
+    def __init__(self, name: str, key_columns: List[np.ndarray], values: np.ndarray,
+                 lookups: List[Optional[list]], scalar_key: bool = False,
+                 partition_column: Optional[int] = None, partitions: Optional[Dict[int, Tuple[int, int]]] = None):
+        self.name = name
+        self.key_columns = key_columns
+        self.values = values
+        self.lookups = lookups  # None for integer key positions
+        self.scalar_key = scalar_key  # the source dict had plain (non-tuple) keys
+        self.partition_column = partition_column
+        self.partitions = partitions or {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def slice(self, partition: int) -> "ColumnarTable":
+        """Rows whose partition column (usually the building) equals `partition`"""
+        if self.partition_column is None:
+            raise ValueError(f"Table {self.name} has no integer key column to slice by")
+        start, end = self.partitions.get(partition, (0, 0))
+        return ColumnarTable(
+            self.name,
+            [column[start:end] for column in self.key_columns],
+            self.values[start:end],
+            self.lookups,
+            self.scalar_key,
+            self.partition_column,
+            {partition: (0, end - start)} if end > start else {}
+        )
+
+    def decode_column(self, position: int) -> list:
+        """Key values of one key position as Python objects"""
+        column = self.key_columns[position]
+        lookup = self.lookups[position]
+        if lookup is None:
+            return column.tolist()
+        return [lookup[code] for code in column.tolist()]
+
+    def to_dict(self) -> Dict[Any, Any]:
+        """Rebuild the {key: value} dict of the source pickle"""
+        columns = [self.decode_column(position) for position in range(len(self.key_columns))]
+        values = self.values.tolist()
+        if self.scalar_key:
+            return dict(zip(columns[0], values))
+        return dict(zip(zip(*columns), values))
+
+    def to_frame(self) -> pd.DataFrame:
+        """Long-format table with one column per key position and a value column"""
+        data = {f"key_{position}": self.decode_column(position) for position in range(len(self.key_columns))}
+        data["value"] = np.asarray(self.values)
+        return pd.DataFrame(data)
+
+
+class PreprocessedStore:
+    """Converted preprocessed pickle: numeric tables as ColumnarTable, other leaves unpickled on demand"""
+
+    def __init__(self, entry_path: Optional[Path], index: Dict[str, Any]):
+        self.entry_path = entry_path  # None for data kept in memory (see from_data)
+        self._tables_meta: Dict[str, Dict[str, Any]] = {entry["name"]: entry for entry in index["tables"]}
+        self._objects_meta: Dict[str, Dict[str, Any]] = {entry["name"]: entry for entry in index["objects"]}
+        self._loaded: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_data(cls, data: Any) -> "PreprocessedStore":
+        """Store holding the converted tables of an unpickled object in memory"""
+        tables, objects, loaded = [], [], {}
+        for number, (path, value) in enumerate(_iter_leaves(data, [])):
+            name = "/".join(str(part) for part in path)
+            table = _build_table(name, value)
+            (tables if table is not None else objects).append({"name": name, "path": path, "order": number})
+            loaded[name] = table if table is not None else value
+
+        store = cls(None, {"tables": tables, "objects": objects})
+        store._loaded = loaded
+        return store
+
+    @property
+    def table_names(self) -> List[str]:
+        return list(self._tables_meta)
+
+    @property
+    def object_names(self) -> List[str]:
+        return list(self._objects_meta)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._tables_meta or name in self._objects_meta
+
+    def get_table(self, name: str, partition: Optional[int] = None) -> ColumnarTable:
+        """Numeric table by its path (e.g. "timeseries/p_el"), optionally sliced to one building"""
+        meta = self._tables_meta[name]
+        with self._lock:
+            table = self._loaded.get(name)
+            if table is None:
+                table = ColumnarTable(
+                    name,
+                    [np.load(self.entry_path / file_name, mmap_mode='r') for file_name in meta["key_files"]],
+                    np.load(self.entry_path / meta["value_file"], mmap_mode='r'),
+                    [_restore_tuples(lookup) if lookup is not None else None for lookup in meta["lookups"]],
+                    meta["scalar_key"],
+                    meta["partition_column"],
+                    {int(key): tuple(bounds) for key, bounds in meta["partitions"].items()}
+                )
+                self._loaded[name] = table
+        return table if partition is None else table.slice(partition)
+
+    def get_object(self, name: str) -> Any:
+        """Non-tabular leaf (set, list, scalar, ...) by its path"""
+        meta = self._objects_meta[name]
+        with self._lock:
+            if name not in self._loaded:
+                with open(self.entry_path / meta["file"], 'rb') as f:
+                    self._loaded[name] = pickle.load(f)
+            return self._loaded[name]
+
+    def get(self, name: str, partition: Optional[int] = None) -> Any:
+        """Leaf as in the source pickle (tables as dicts), tables optionally sliced to one building"""
+        if name in self._tables_meta:
+            return self.get_table(name, partition).to_dict()
+        return self.get_object(name)
+
+    def to_dict(self) -> Any:
+        """Rebuild the complete source object (loads everything)"""
+        result: Dict[Any, Any] = {}
+        leaves = itertools.chain(self._tables_meta.values(), self._objects_meta.values())
+        for meta in sorted(leaves, key=lambda meta: meta["order"]):
+            if not meta["path"]:
+                return self.get(meta["name"])
+            parent = result
+            for part in meta["path"][:-1]:
+                parent = parent.setdefault(part, {})
+            parent[meta["path"][-1]] = self.get(meta["name"])
+        return result
+
+
+def get_columnar_path(pkl_path: Path) -> Path:
+    """Directory of the converted data of a pickle"""
+    pkl_path = Path(pkl_path)
+    return pkl_path.parent / SOLUTION_CACHE_DIRNAME / f"columnar_{pkl_path.stem}"
+
+
+def load_preprocessed(pkl_path: Path) -> PreprocessedStore:
+    """Open the converted data of a preprocessed pickle, converting it first if missing or stale
+
+    Falls back to the converted tables in memory if the conversion cannot be stored.
+    """
+    pkl_path = Path(pkl_path)
+    if not pkl_path.exists():
+        raise FileNotFoundError(f"Preprocessed file not found: {pkl_path}")
+
+    store = read_preprocessed(pkl_path)
+    if store is not None:
+        return store
+
+    with open(pkl_path, 'rb') as f:
+        data = pickle.load(f)
+    try:
+        convert_preprocessed_pickle(pkl_path, data)
+        store = read_preprocessed(pkl_path)
+    except Exception as e:
+        # A read-only results share must not break loading the data
+        logger.warning(f"Could not store columnar data for {pkl_path}: {e}")
+    if store is None:
+        logger.info(f"Using columnar data of {pkl_path} in memory")
+        store = PreprocessedStore.from_data(data)
+    return store
+
+
+def read_preprocessed(pkl_path: Path) -> Optional[PreprocessedStore]:
+    """Converted data of a pickle, None if there is no up-to-date conversion"""
+    entry_path = get_columnar_path(pkl_path)
+    index_path = entry_path / INDEX_FILE
+    if not index_path.exists():
+        return None
+
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+
+        stamp = _get_source_stamp(pkl_path)
+        if any(index.get(key) != value for key, value in stamp.items()):
+            logger.debug(f"Columnar data is stale: {pkl_path}")
+            return None
+
+        return PreprocessedStore(entry_path, index)
+
+    except Exception as e:
+        logger.warning(f"Could not read columnar data {entry_path}: {e}")
+        return None
+
+
+def convert_preprocessed_pickle(pkl_path: Path, data: Any = None) -> Path:
+    """Convert a preprocessed pickle into .npy columns plus JSON index, returns the target directory
+
+    `data` is the already unpickled content of the file, read from it if not given.
+    """
+    pkl_path = Path(pkl_path)
+    entry_path = get_columnar_path(pkl_path)
+
+    if data is None:
+        with open(pkl_path, 'rb') as f:
+            data = pickle.load(f)
+
+    entry_path.parent.mkdir(parents=True, exist_ok=True)
+    # Write into a temporary directory first so readers never see a partial conversion
+    tmp_path = Path(tempfile.mkdtemp(dir=entry_path.parent, prefix=f".{entry_path.name}-"))
+    try:
+        os.chmod(tmp_path, 0o755)
+        counter = itertools.count()
+        tables, objects = [], []
+
+        for path, value in _iter_leaves(data, []):
+            number = next(counter)
+            name = "/".join(str(part) for part in path)
+            table = _build_table(name, value)
+            if table is not None:
+                tables.append({"name": name, "path": path, "order": number, **_write_table(tmp_path, number, table)})
+            else:
+                file_name = f"{number}.pkl"
+                with open(tmp_path / file_name, 'wb') as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                objects.append({"name": name, "path": path, "order": number, "file": file_name})
+
+        with open(tmp_path / INDEX_FILE, 'w', encoding='utf-8') as f:
+            json.dump({**_get_source_stamp(pkl_path), "tables": tables, "objects": objects}, f)
+
+        if entry_path.exists():
+            shutil.rmtree(entry_path, ignore_errors=True)
+        os.replace(tmp_path, entry_path)
+        tmp_path = None
+
+    finally:
+        if tmp_path is not None:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+    logger.info(f"Converted {pkl_path} into {len(tables)} columnar tables and {len(objects)} objects")
+    return entry_path
+
+
+def _iter_leaves(value: Any, path: List[str]):
+    """(path, leaf) pairs, descending into dicts with string keys"""
+    if isinstance(value, dict) and value and all(isinstance(key, str) for key in value):
+        for key, child in value.items():
+            yield from _iter_leaves(child, path + [key])
+    else:
+        yield path, value
+
+
+def _build_table(name: str, value: Any) -> Optional[ColumnarTable]:
+    """Numeric {key: value} dict as ColumnarTable, None if the value is no such table"""
+    if not isinstance(value, dict) or not value:
+        return None
+    if not all(_is_number(item) for item in value.values()):
+        return None
+
+    keys = list(value)
+    scalar_key = not isinstance(keys[0], tuple)
+    rows = [(key,) for key in keys] if scalar_key else keys
+    width = len(rows[0])
+    if any(not isinstance(row, tuple) or len(row) != width for row in rows):
+        return None
+
+    key_arrays, lookups = [], []
+    for position in range(width):
+        column = [row[position] for row in rows]
+        if all(_is_integer(item) for item in column):
+            key_arrays.append(np.array(column, dtype=np.int64))
+            lookups.append(None)
+            continue
+        lookup = list(dict.fromkeys(column))
+        if not all(_is_json_key(item) for item in lookup):
+            return None
+        codes = {item: code for code, item in enumerate(lookup)}
+        key_arrays.append(np.array([codes[item] for item in column], dtype=np.int32))
+        lookups.append(lookup)
+
+    values = list(value.values())
+    value_array = np.array(values, dtype=np.int64 if all(_is_integer(item) for item in values) else np.float64)
+
+    # Group the rows by the first integer key column (usually the building)
+    partition_column = next((position for position, lookup in enumerate(lookups) if lookup is None), None)
+    partitions = {}
+    if partition_column is not None:
+        order = np.argsort(key_arrays[partition_column], kind='stable')
+        key_arrays = [array[order] for array in key_arrays]
+        value_array = value_array[order]
+        partition_values, starts = np.unique(key_arrays[partition_column], return_index=True)
+        ends = list(starts[1:]) + [len(value_array)]
+        partitions = {int(key): (int(start), int(end)) for key, start, end in zip(partition_values, starts, ends)}
+
+    return ColumnarTable(name, key_arrays, value_array, lookups, scalar_key, partition_column, partitions)
+
+
+def _write_table(target: Path, number: int, table: ColumnarTable) -> Dict[str, Any]:
+    """Store a table as .npy columns, returns its index entry"""
+    key_files = []
+    for position, array in enumerate(table.key_columns):
+        file_name = f"{number}_key{position}.npy"
+        np.save(target / file_name, array)
+        key_files.append(file_name)
+    value_file = f"{number}_values.npy"
+    np.save(target / value_file, table.values)
+
+    return {
+        "rows": len(table),
+        "key_files": key_files,
+        "value_file": value_file,
+        "lookups": table.lookups,
+        "scalar_key": table.scalar_key,
+        "partition_column": table.partition_column,
+        "partitions": {str(key): list(bounds) for key, bounds in table.partitions.items()}
+    }
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, numbers.Real) and not isinstance(value, (bool, np.bool_))
+
+
+def _is_integer(value: Any) -> bool:
+    return isinstance(value, numbers.Integral) and not isinstance(value, (bool, np.bool_))
+
+
+def _is_json_key(value: Any) -> bool:
+    """Key values that survive the JSON index (tuples come back via _restore_tuples)"""
+    if isinstance(value, tuple):
+        return all(_is_json_key(item) for item in value)
+    return isinstance(value, str) or (_is_number(value) and not isinstance(value, np.generic))
+
+
+def _restore_tuples(lookup: list) -> list:
+    """JSON turns tuples into lists, turn them back (keys must stay hashable)"""
+    return [tuple(_restore_tuples(item)) if isinstance(item, list) else item for item in lookup]
+
+
+def _get_source_stamp(pkl_path: Path) -> Dict[str, Any]:
+    """Fields that decide whether converted data still matches its source"""
+    stat = Path(pkl_path).stat()
+    return {
+        "version": COLUMNAR_VERSION,
+        "source": str(Path(pkl_path).resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns
+    }
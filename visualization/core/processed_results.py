@@ -0,0 +1,336 @@
+"""
+Columnar table of the processed results of a Benders run (results/<run>/processed_results)
+
+The run writes portfolio_results.json and one building_<id>_results.json per building
+with nested dicts of metrics, e.g. {"costs_investment": {"t0": ..., "t2": ...}} or
+{"measure_adoption_count": {"boi_pel_t0": ...}}. load_processed_results reads them in a
+thread pool and flattens all numeric leaves into one long table (building, metric, key,
+period, value): a trailing t<period> of a dict key becomes the period, the rest of the
+key path the key. Portfolio rows and values without period have MISSING_INT there.
+
+The table is stored as an uncompressed Feather file (SOLUTION_CACHE_DIRNAME/results_table.feather
+of the processed_results directory, the lookups and file list in its schema metadata) and
+memory-mapped on later loads; only new or changed files are parsed again. Files that were cut off while being written are read up to the
+last complete value and marked as truncated.
+"""
+import json
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from .data_models import MISSING_INT
+from config.app_config import SOLUTION_CACHE_DIRNAME
+
+logger = logging.getLogger(__name__)
+
+PROCESSED_RESULTS_DIR = Path("processed_results")
+PORTFOLIO_FILE = "portfolio_results.json"
+BUILDING_FILE = re.compile(r"^building_(\d+)_results\.json$")
+
+TABLE_FILE = "results_table.feather"
+META_KEY = b"processed_results"  # schema metadata entry holding the JSON meta
+
+# Increment when the flattening or the stored columns change
+PROCESSED_RESULTS_VERSION = 2
+
+# Dict keys ending in a time period: "t0", "boi_pel_t14"
+PERIOD_KEY = re.compile(r"^(?:(.+)_)?t(-?\d+)$")
+
+# Top-level fields identifying the file rather than holding a result
+IDENTITY_FIELDS = {"building_id"}
+
+RESULTS_COLUMNS = ["building", "metric", "key", "period", "value"]
+FILE_COLUMNS = ["file", "building", "size", "mtime_ns", "truncated", "rows"]
+
+# Stored columns: name -> dtype
+ARRAY_FIELDS = {
+    "building": np.int32, "metric_codes": np.int32, "key_codes": np.int32,
+    "period": np.int32, "value": np.float64, "file_codes": np.int32
+}
+
+_DECODER = json.JSONDecoder()
+
+
+@dataclass
+class ProcessedResults:
+    """Long-format processed results of a run and the files they were read from"""
+    table: pd.DataFrame  # RESULTS_COLUMNS, metric and key categorical
+    files: pd.DataFrame  # FILE_COLUMNS, one row per JSON file
+
+    @property
+    def metrics(self) -> List[str]:
+        return sorted(self.table["metric"].unique())
+
+    @property
+    def buildings(self) -> List[int]:
+        return sorted(b for b in self.files["building"].tolist() if b != MISSING_INT)
+
+    @property
+    def truncated_files(self) -> List[str]:
+        return self.files.loc[self.files["truncated"], "file"].tolist()
+
+    def get_metric(self, metric: str, buildings: Optional[Iterable[int]] = None) -> pd.DataFrame:
+        """Rows of one metric, of the given buildings or all (portfolio rows have building MISSING_INT)"""
+        rows = self.table[self.table["metric"] == metric]
+        if buildings is not None:
+            rows = rows[rows["building"].isin(list(buildings))]
+        return rows
+
+    def get_building_matrix(self, metric: str, key: str = "") -> pd.DataFrame:
+        """Values of a metric as buildings x periods (without the portfolio rows)"""
+        rows = self.get_metric(metric)
+        rows = rows[(rows["key"] == key) & (rows["building"] != MISSING_INT)]
+        return rows.pivot_table(index="building", columns="period", values="value", aggfunc="sum")
+
+
+def load_processed_results(results_dir: Path, workers: int = 1) -> ProcessedResults:
+    """Processed results of a run directory's processed_results/ (see module docstring)"""
+    results_dir = Path(results_dir)
+    table_path = results_dir / SOLUTION_CACHE_DIRNAME / TABLE_FILE
+    stored = _read_table(table_path)
+
+    current = {}
+    with os.scandir(results_dir) as entries:
+        for entry in entries:
+            match = BUILDING_FILE.match(entry.name)
+            if match or entry.name == PORTFOLIO_FILE:
+                stat = entry.stat()
+                building = int(match.group(1)) if match else MISSING_INT
+                current[entry.name] = (building, stat.st_size, stat.st_mtime_ns)
+
+    known = {} if stored is None else {item["file"]: item for item in stored[0]["files"]}
+    unchanged = [
+        name for name, (_, size, mtime_ns) in current.items()
+        if name in known and known[name]["size"] == size and known[name]["mtime_ns"] == mtime_ns
+    ]
+    pending = sorted(set(current) - set(unchanged))
+
+    if stored is not None and not pending and len(unchanged) == len(known):
+        return _to_results(*stored)
+
+    if pending:
+        logger.info(f"Reading {len(pending)} processed result files in {results_dir} with {workers} workers")
+    parsed = _read_files_parallel([results_dir / name for name in pending], workers)
+
+    meta, arrays = _merge(stored, unchanged, parsed, current)
+    _write_table(table_path, meta, arrays)
+    return _to_results(meta, arrays)
+
+
+def flatten_results(data: Dict[str, Any]) -> List[Tuple[str, str, int, float]]:
+    """(metric, key, period, value) rows of the numeric leaves of a results dict"""
+    rows = []
+    for metric, value in data.items():
+        if metric not in IDENTITY_FIELDS:
+            _flatten(metric, value, [], MISSING_INT, rows)
+    return rows
+
+
+def load_json_prefix(text: str) -> Tuple[Dict[str, Any], bool]:
+    """Top-level object of a JSON text and whether it was complete
+
+    A truncated text yields the members up to the last complete value (nested objects
+    keep their complete members). A value at the very end without a following "," or
+    "}" is dropped, since a cut-off number would otherwise be read as a shorter one.
+    """
+    try:
+        value = json.loads(text)
+        return (value if isinstance(value, dict) else {}), True
+    except json.JSONDecodeError:
+        pass
+
+    data: Dict[str, Any] = {}
+    start = text.find("{")
+    if start >= 0:
+        _decode_object_prefix(text, start, data)
+    return data, False
+
+
+def read_results_file(file_path: Path) -> Tuple[List[Tuple[str, str, int, float]], bool]:
+    """Flattened rows of one results file and whether it was truncated"""
+    with open(file_path, 'rb') as f:
+        text = f.read().decode('utf-8', errors='replace')
+    data, complete = load_json_prefix(text)
+    if not complete:
+        logger.warning(f"Results file is incomplete, using {len(data)} complete fields: {file_path}")
+    return flatten_results(data), not complete
+
+
+def _flatten(metric: str, value: Any, keys: List[str], period: int, rows: list):
+    if isinstance(value, bool) or value is None:
+        return
+    if isinstance(value, (int, float)):
+        rows.append((metric, "/".join(keys), period, float(value)))
+    elif isinstance(value, dict):
+        for name, item in value.items():
+            match = PERIOD_KEY.match(name) if period == MISSING_INT else None
+            if match:
+                _flatten(metric, item, keys + [match.group(1)] if match.group(1) else keys, int(match.group(2)), rows)
+            else:
+                _flatten(metric, item, keys + [name], period, rows)
+
+
+def _decode_object_prefix(text: str, pos: int, target: Dict[str, Any]):
+    """Complete members of the object starting at text[pos] == "{" into target"""
+    pos = _skip_whitespace(text, pos + 1)
+    while pos < len(text) and text[pos] != "}":
+        if text[pos] == ",":
+            pos = _skip_whitespace(text, pos + 1)
+        try:
+            key, pos = _DECODER.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            return
+        pos = _skip_whitespace(text, pos)
+        if not isinstance(key, str) or pos >= len(text) or text[pos] != ":":
+            return
+        pos = _skip_whitespace(text, pos + 1)
+
+        try:
+            value, end = _DECODER.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            if pos < len(text) and text[pos] == "{":
+                target[key] = {}
+                _decode_object_prefix(text, pos, target[key])
+            return
+
+        end = _skip_whitespace(text, end)
+        if end >= len(text):
+            return
+        target[key] = value
+        pos = end
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    while pos < len(text) and text[pos] in " \t\r\n":
+        pos += 1
+    return pos
+
+
+def _read_files_parallel(paths: List[Path], workers: int) -> Dict[str, Tuple[list, bool]]:
+    if workers > 1 and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+            results = list(executor.map(_read_file_safe, paths))
+    else:
+        results = [_read_file_safe(path) for path in paths]
+    return {path.name: result for path, result in zip(paths, results)}
+
+
+def _read_file_safe(file_path: Path) -> Tuple[list, bool]:
+    try:
+        return read_results_file(file_path)
+    except OSError as e:
+        logger.warning(f"Could not read results file {file_path}: {e}")
+        return [], True
+
+
+def _merge(stored: Optional[Tuple[Dict[str, Any], Dict[str, np.ndarray]]], unchanged: List[str],
+           parsed: Dict[str, Tuple[list, bool]], current: Dict[str, Tuple[int, int, int]]):
+    """Rows of the unchanged files from the stored table plus the parsed files, re-encoded"""
+    metrics: Dict[str, int] = {}
+    keys: Dict[str, int] = {}
+    files, columns = [], {name: [] for name in ARRAY_FIELDS}
+
+    if stored is not None and unchanged:
+        meta, arrays = stored
+        old_files = {item["file"]: code for code, item in enumerate(meta["files"])}
+        mask = np.isin(arrays["file_codes"], [old_files[name] for name in unchanged])
+        # Codes of the kept rows are translated into the new lookups
+        metric_map = np.array([metrics.setdefault(name, len(metrics)) for name in meta["metrics"]], dtype=np.int32)
+        key_map = np.array([keys.setdefault(name, len(keys)) for name in meta["keys"]], dtype=np.int32)
+        file_map = np.full(len(meta["files"]), -1, dtype=np.int32)
+        for name in unchanged:
+            file_map[old_files[name]] = len(files)
+            files.append(dict(meta["files"][old_files[name]]))
+
+        columns["building"].append(arrays["building"][mask])
+        columns["metric_codes"].append(metric_map[arrays["metric_codes"][mask]])
+        columns["key_codes"].append(key_map[arrays["key_codes"][mask]])
+        columns["period"].append(arrays["period"][mask])
+        columns["value"].append(arrays["value"][mask])
+        columns["file_codes"].append(file_map[arrays["file_codes"][mask]])
+
+    for name, (rows, truncated) in parsed.items():
+        building, size, mtime_ns = current[name]
+        code = len(files)
+        files.append({"file": name, "building": building, "size": size, "mtime_ns": mtime_ns,
+                      "truncated": truncated, "rows": len(rows)})
+        columns["building"].append(np.full(len(rows), building))
+        columns["metric_codes"].append(np.array([metrics.setdefault(row[0], len(metrics)) for row in rows]))
+        columns["key_codes"].append(np.array([keys.setdefault(row[1], len(keys)) for row in rows]))
+        columns["period"].append(np.array([row[2] for row in rows]))
+        columns["value"].append(np.array([row[3] for row in rows]))
+        columns["file_codes"].append(np.full(len(rows), code))
+
+    arrays = {
+        name: np.concatenate(parts).astype(dtype, copy=False) if parts else np.empty(0, dtype=dtype)
+        for (name, dtype), parts in zip(ARRAY_FIELDS.items(), columns.values())
+    }
+    meta = {"version": PROCESSED_RESULTS_VERSION, "metrics": list(metrics), "keys": list(keys), "files": files}
+    return meta, arrays
+
+
+def _to_results(meta: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> ProcessedResults:
+    table = pd.DataFrame({
+        "building": arrays["building"],
+        "metric": pd.Categorical.from_codes(arrays["metric_codes"], categories=meta["metrics"]),
+        "key": pd.Categorical.from_codes(arrays["key_codes"], categories=meta["keys"]),
+        "period": arrays["period"],
+        "value": arrays["value"]
+    })
+    files = pd.DataFrame(meta["files"], columns=FILE_COLUMNS)
+    return ProcessedResults(table=table, files=files)
+
+
+def _read_table(table_path: Path) -> Optional[Tuple[Dict[str, Any], Dict[str, np.ndarray]]]:
+    """Stored table (meta, memory-mapped columns), None if missing, outdated or inconsistent"""
+    if not table_path.exists():
+        return None
+    try:
+        stored = feather.read_table(table_path, memory_map=True)
+        meta = json.loads((stored.schema.metadata or {}).get(META_KEY, b"{}"))
+        if meta.get("version") != PROCESSED_RESULTS_VERSION:
+            return None
+        arrays = {
+            name: stored.column(name).to_numpy().astype(dtype, copy=False)
+            for name, dtype in ARRAY_FIELDS.items()
+        }
+        return meta, arrays
+    except Exception as e:
+        logger.warning(f"Could not read processed results table {table_path}: {e}")
+        return None
+
+
+def _write_table(table_path: Path, meta: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> bool:
+    """Store the table atomically, False if the directory is not writable"""
+    tmp_path = None
+    try:
+        table_path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.table({name: np.ascontiguousarray(array) for name, array in arrays.items()})
+        table = table.replace_schema_metadata({META_KEY: json.dumps(meta).encode("utf-8")})
+
+        fd, tmp_path = tempfile.mkstemp(dir=table_path.parent, prefix=f".{table_path.name}-")
+        os.close(fd)
+        # Uncompressed, so later loads can map the columns without copying
+        feather.write_feather(table, tmp_path, compression="uncompressed")
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, table_path)
+        tmp_path = None
+        return True
+
+    except (OSError, pa.ArrowException) as e:
+        logger.warning(f"Could not write processed results table {table_path}: {e}")
+        return False
+
+    finally:
+        if tmp_path is not None:
+            Path(tmp_path).unlink(missing_ok=True)
@@ -0,0 +1,229 @@
+"""
+Result metrics by name from interchangeable sources
+
+A ResultsSource answers metrics as long tables (building, key, period, value) with
+MISSING_INT for portfolio rows and values without period, like the processed results
+table. Two sources exist:
+
+- ProcessedResultsSource: the pre-aggregated processed_results/*.json of a Benders run
+  (see core/processed_results.py), a lookup in an already loaded table
+- SolutionResultsSource: metrics derived from the variables of a .sol file, extracted on
+  first request and kept with the solution
+
+ResultsSources asks its sources in order of priority (the cheapest first), so pages
+request a metric by name and get it from the fastest source that has it.
+"""
+import re
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+
+from .data_models import MISSING_INT, OptimizationSolution
+from .processed_results import ProcessedResults, RESULTS_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# Variables with one portfolio value per time period (<name>_<period>), answered under their name
+PORTFOLIO_PERIOD_VARIABLES = [
+    "yearly_rental_income", "credit_repayment", "credit_interest", "credit_payment", "pre_credit_payment",
+    "bonus_costs", "total_investment_measures", "CO2_costs", "subsidies", "inspection_measure_costs"
+]
+
+# Variables with one value per building and time period (<name>_<building>_<period>)
+BUILDING_PERIOD_VARIABLES = [
+    "C_rent", "C_en", "C_mod", "C_mod_heat", "F_en", "total_investment_measures_building", "subsidies_building"
+]
+
+# Metrics of the processed results derived from technology variables (<prefix>_<building>_<period>_<tech>):
+# name -> (variable prefix, count buildings instead of summing values)
+TECHNOLOGY_METRICS = {
+    "capacity_installed_total": ("E_in", False),
+    "capacity_available_total": ("E_av", False),
+    "capacity_installed_count": ("E_in", True),
+    "capacity_available_count": ("E_av", True),
+    "measure_adoption_count": ("X_in", True),
+}
+
+# Values at or below this count as not installed for the count metrics
+INSTALLED_THRESHOLD = 1e-6
+
+PERIOD_SUFFIX = re.compile(r"_(-?\d+)$")
+BUILDING_PERIOD_SUFFIX = re.compile(r"_(\d+)_(-?\d+)$")
+TECHNOLOGY_SUFFIX = re.compile(r"_(\d+)_(-?\d+)_(.+)$")
+
+
+class ResultsSource(ABC):
+    """Source of result metrics, see module docstring"""
+
+    name: str = ""
+    priority: int = 0  # sources with lower priority are asked first
+
+    @abstractmethod
+    def get_metrics(self) -> List[str]:
+        """Names of the metrics this source can answer"""
+
+    @abstractmethod
+    def get_metric(self, metric: str) -> Optional[pd.DataFrame]:
+        """Rows (RESULTS_COLUMNS) of a metric, None if the source does not have it"""
+
+    def has_metric(self, metric: str) -> bool:
+        return metric in self.get_metrics()
+
+
+class ProcessedResultsSource(ResultsSource):
+    """Metrics of the processed_results table of a Benders run"""
+
+    name = "processed_results"
+    priority = 0
+
+    def __init__(self, results: ProcessedResults):
+        self.results = results
+        self._metrics = set(results.metrics)
+
+    def get_metrics(self) -> List[str]:
+        return sorted(self._metrics)
+
+    def has_metric(self, metric: str) -> bool:
+        return metric in self._metrics
+
+    def get_metric(self, metric: str) -> Optional[pd.DataFrame]:
+        if metric not in self._metrics:
+            return None
+        rows = self.results.get_metric(metric)
+        return pd.DataFrame({
+            "building": rows["building"].to_numpy(),
+            "metric": metric,
+            "key": rows["key"].astype(str).to_numpy(),
+            "period": rows["period"].to_numpy(),
+            "value": rows["value"].to_numpy()
+        })
+
+
+class SolutionResultsSource(ResultsSource):
+    """Metrics derived from the variables of a solution"""
+
+    name = "solution"
+    priority = 1
+
+    def __init__(self, solution: OptimizationSolution):
+        self.solution = solution
+        self._extractors: Dict[str, Callable[[], List[Tuple[int, str, int, float]]]] = {}
+        for name in PORTFOLIO_PERIOD_VARIABLES:
+            self._register(name, lambda name=name: self._extract_portfolio_periods(name))
+        for name in BUILDING_PERIOD_VARIABLES:
+            self._register(name, lambda name=name: self._extract_building_periods(name))
+        for name, (prefix, count) in TECHNOLOGY_METRICS.items():
+            self._register(name, lambda prefix=prefix, count=count: self._extract_technologies(prefix, count), prefix)
+        # Shared by all sessions with the solution, the lock keeps a metric from being extracted twice
+        self._tables: Dict[str, pd.DataFrame] = {}
+        self._tables_lock = threading.Lock()
+
+    def get_metrics(self) -> List[str]:
+        return sorted(self._extractors)
+
+    def has_metric(self, metric: str) -> bool:
+        return metric in self._extractors
+
+    def get_metric(self, metric: str) -> Optional[pd.DataFrame]:
+        extractor = self._extractors.get(metric)
+        if extractor is None:
+            return None
+        with self._tables_lock:
+            table = self._tables.get(metric)
+            if table is None:
+                rows = extractor()
+                table = pd.DataFrame(rows, columns=["building", "key", "period", "value"])
+                table.insert(1, "metric", metric)
+                table = table[RESULTS_COLUMNS].astype({"building": np.int64, "period": np.int64, "value": np.float64})
+                self._tables[metric] = table
+        return table
+
+    def _register(self, metric: str, extractor: Callable, prefix: Optional[str] = None):
+        """Offer a metric if the solution has variables of its family"""
+        if self.solution.index.by_prefix.get(prefix or metric):
+            self._extractors[metric] = extractor
+
+    def _extract_portfolio_periods(self, name: str):
+        rows = []
+        for var_name, value in self.solution.iter_values(name):
+            match = PERIOD_SUFFIX.search(var_name)
+            if match:
+                rows.append((MISSING_INT, "", int(match.group(1)), value))
+        return rows
+
+    def _extract_building_periods(self, name: str):
+        rows = []
+        for var_name, value in self.solution.iter_values(name):
+            match = BUILDING_PERIOD_SUFFIX.search(var_name)
+            if match:
+                rows.append((int(match.group(1)), "", int(match.group(2)), value))
+        return rows
+
+    def _extract_technologies(self, prefix: str, count: bool):
+        rows = []
+        for var_name, value in self.solution.iter_values(prefix):
+            match = TECHNOLOGY_SUFFIX.match(var_name, len(prefix))
+            if not match:
+                continue
+            if count:
+                if value <= INSTALLED_THRESHOLD:
+                    continue
+                value = 1.0
+            rows.append((int(match.group(1)), match.group(3), int(match.group(2)), value))
+        return rows
+
+
+class ResultsSources:
+    """Sources of one result set, asked in order of priority"""
+
+    def __init__(self, sources: Iterable[ResultsSource]):
+        self.sources = sorted(sources, key=lambda source: source.priority)
+
+    def __bool__(self) -> bool:
+        return bool(self.sources)
+
+    def get_metrics(self) -> Dict[str, str]:
+        """Available metrics and the name of the source that answers each"""
+        metrics: Dict[str, str] = {}
+        for source in self.sources:
+            for metric in source.get_metrics():
+                metrics.setdefault(metric, source.name)
+        return dict(sorted(metrics.items()))
+
+    def get_metric(self, metric: str) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+        """Rows of a metric from the first source that has it, and that source's name"""
+        for source in self.sources:
+            if source.has_metric(metric):
+                return source.get_metric(metric), source.name
+        return None, None
+
+    def get_portfolio_table(self, metric: str) -> pd.DataFrame:
+        """Portfolio values of a metric as periods x keys
+
+        Portfolio rows are used as they are; without them the building rows are summed.
+        Values without period are left out.
+        """
+        rows, _ = self.get_metric(metric)
+        if rows is None or rows.empty:
+            return pd.DataFrame()
+        rows = rows[rows["period"] != MISSING_INT]
+        portfolio = rows[rows["building"] == MISSING_INT]
+        if not portfolio.empty:
+            rows = portfolio
+        return rows.pivot_table(index="period", columns="key", values="value", aggfunc="sum").sort_index()
+
+    def get_portfolio_series(self, metric: str, key: str = "") -> Dict[int, float]:
+        """Portfolio value of a metric per period, e.g. {0: 1.2e6, 2: 1.3e6}"""
+        table = self.get_portfolio_table(metric)
+        if key not in table.columns:
+            return {}
+        return {int(period): float(value) for period, value in table[key].dropna().items()}
+
+
+def get_solution_source(solution: OptimizationSolution) -> SolutionResultsSource:
+    """Results source of a solution, created on first use and kept with the solution"""
+    return solution.results_source
@@ -0,0 +1,161 @@
+"""
+On-disk cache for parsed solution files
+
+SolutionCache stores the parsed columns of a .sol file as .npy arrays in
+a cache directory next to the solution (SOLUTION_CACHE_DIRNAME/<hash>/). Entries are validated by
+file size, mtime and parser version and loaded via memory mapping, so reopening a
+known solution skips the text parsing entirely.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+import logging
+
+import numpy as np
+
+from .data_models import OptimizationSolution, SolutionColumns
+from .solution_parser import PARSER_VERSION, SolutionParser
+from config.app_config import SOLUTION_CACHE_DIRNAME
+
+logger = logging.getLogger(__name__)
+
+META_FILE = "meta.json"
+NAMES_FILE = "names.txt"
+
+# Numeric columns of SolutionColumns, stored as one .npy file each
+ARRAY_FIELDS = (
+    "values", "building_id_codes", "time_period", "variable_type_codes",
+    "technology_codes", "category_codes", "measure_codes"
+)
+
+# Lookup lists of the categorical columns, stored in the meta file
+LOOKUP_FIELDS = ("building_ids", "variable_types", "technologies", "categories", "measures")
+
+class SolutionCache:
+    """Loads solutions from the binary cache and (re)builds stale entries"""
+
+    def __init__(self, parser: Optional[SolutionParser] = None):
+        self.parser = parser or SolutionParser()
+
+    def load_solution(self, file_path: Path) -> OptimizationSolution:
+        """Load a solution, parsing the .sol file only if the cache is missing or stale"""
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"Solution file not found: {file_path}")
+
+        solution = self.read(file_path)
+        if solution is not None:
+            logger.info(f"Loaded solution from cache: {file_path}")
+            return solution
+
+        solution = self.parser.parse_solution_file(file_path)
+        self.write(file_path, solution)
+        return solution
+
+    def get_entry_path(self, file_path: Path) -> Path:
+        """Cache directory of a solution file"""
+        key = hashlib.sha1(str(Path(file_path).resolve()).encode("utf-8")).hexdigest()[:16]
+        return Path(file_path).parent / SOLUTION_CACHE_DIRNAME / key
+
+    def read(self, file_path: Path) -> Optional[OptimizationSolution]:
+        """Read a cached solution, None if there is no valid entry"""
+        entry_path = self.get_entry_path(file_path)
+        meta_path = entry_path / META_FILE
+        if not meta_path.exists():
+            return None
+
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+
+            stamp = self._get_source_stamp(file_path)
+            if any(meta.get(key) != value for key, value in stamp.items()):
+                logger.debug(f"Solution cache is stale: {file_path}")
+                return None
+
+            with open(entry_path / NAMES_FILE, 'r', encoding='utf-8') as f:
+                content = f.read()
+            names = content.split("\n") if content else []
+
+            arrays = {field: np.load(entry_path / f"{field}.npy", mmap_mode='r') for field in ARRAY_FIELDS}
+            if any(len(array) != len(names) for array in arrays.values()):
+                logger.warning(f"Solution cache is inconsistent, ignoring it: {entry_path}")
+                return None
+
+            columns = SolutionColumns(names=names, **arrays, **{field: meta[field] for field in LOOKUP_FIELDS})
+
+            return OptimizationSolution.from_columns(
+                objective_value=meta["objective_value"],
+                columns=columns,
+                solution_status=meta["solution_status"]
+            )
+
+        except Exception as e:
+            logger.warning(f"Could not read solution cache {entry_path}: {e}")
+            return None
+
+    def write(self, file_path: Path, solution: OptimizationSolution) -> bool:
+        """Store a parsed solution in the cache, returns False if that was not possible"""
+        columns = solution.columns
+        if columns is None:
+            return False
+
+        entry_path = self.get_entry_path(file_path)
+        tmp_path = None
+
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write into a temporary directory first so readers never see a partial entry
+            tmp_path = Path(tempfile.mkdtemp(dir=entry_path.parent, prefix=f".{entry_path.name}-"))
+            os.chmod(tmp_path, 0o755)
+
+            for field in ARRAY_FIELDS:
+                np.save(tmp_path / f"{field}.npy", np.ascontiguousarray(getattr(columns, field)))
+
+            with open(tmp_path / NAMES_FILE, 'w', encoding='utf-8') as f:
+                f.write("\n".join(columns.names))
+
+            meta: Dict[str, Any] = {
+                **self._get_source_stamp(file_path),
+                "objective_value": solution.objective_value,
+                "solution_status": solution.solution_status,
+                **{field: list(getattr(columns, field)) for field in LOOKUP_FIELDS}
+            }
+            with open(tmp_path / META_FILE, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+
+            if entry_path.exists():
+                shutil.rmtree(entry_path, ignore_errors=True)
+            os.replace(tmp_path, entry_path)
+            tmp_path = None
+
+            logger.info(f"Stored solution cache for {file_path} in {entry_path}")
+            return True
+
+        except Exception as e:
+            # A read-only results directory must not break loading the solution
+            logger.warning(f"Could not write solution cache for {file_path}: {e}")
+            return False
+
+        finally:
+            if tmp_path is not None:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+
+    def invalidate(self, file_path: Path):
+        """Remove the cache entry of a solution file"""
+        shutil.rmtree(self.get_entry_path(file_path), ignore_errors=True)
+
+    @staticmethod
+    def _get_source_stamp(file_path: Path) -> Dict[str, Any]:
+        """Fields that decide whether a cache entry still matches its source"""
+        stat = Path(file_path).stat()
+        return {
+            "parser_version": PARSER_VERSION,
+            "source": str(Path(file_path).resolve()),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns
+        }
@@ -2,314 +2,439 @@
 Parser for MILP solution files (.sol format)
 """
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 import logging
 
-from .data_models import OptimizationSolution, OptimizationVariable
+from .data_models import OptimizationSolution, OptimizationVariable, SolutionColumns, SolutionColumnsBuilder
 from config.app_config import VARIABLE_CATEGORIES, TECHNOLOGY_CATEGORIES
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the parse result changes, invalidates the on-disk solution cache
+PARSER_VERSION = 2
+
+# Read buffer for streaming large solution files
+READ_BUFFER_SIZE = 1024 * 1024
+
+# Files below this size are always parsed in-process, starting workers costs more than it saves
+PARALLEL_PARSE_MIN_BYTES = 16 * 1024 * 1024
+
+# Header comment written by the solver in front of the model name
+SOLUTION_MODEL_PREFIX = "# Solution for model"
+
+# Variable line patterns, compiled once. Each one belongs to a variable family and is
+# only tried for lines of that family (see SolutionParser._build_family_matchers).
+VALUE = r'([-\d\.-e\+]+)'
+STANDARD_PATTERN = re.compile(r'^([A-Z]+)_([a-z]+)_(\d+)_(\d+)_([a-zA-Z0-9_]+)\s+' + VALUE + '$')
+R_COMPLEX_PATTERN = re.compile(r'^(R)_(\d+)_(\d+)_(.+?)_th_(\d+)_(\d+)\s+' + VALUE + '$')
+C_DEP_PATTERN = re.compile(r'^(C_dep)_(\d+)_(\d+)_(.+?)\s+' + VALUE + '$')
+TUPLE_PATTERN = re.compile(r'^([A-Z]+)_(\d+)_(\d+)_\([^)]+\)_([a-zA-Z0-9_]+)\s+' + VALUE + '$')
+DELTA_PATTERN = re.compile(r'^(delta)_(\d+)_(\d+)_(\d+)\s+' + VALUE + '$')
+C_RENT_PATTERN = re.compile(r'^(C_rent)_(\d+)_(-?\d+)\s+' + VALUE + '$')
+SINGLE_LETTER_PATTERN = re.compile(r'^([A-Z])\s+' + VALUE + '$')
+FINANCIAL_PATTERN = re.compile(r'^([QDL])_(\d+)\s+' + VALUE + '$')
+GENERIC_PATTERN = re.compile(r'^([A-Za-z][a-zA-Z0-9_]*?)_(.+?)\s+' + VALUE + '$')
+
+# Name tokens used to decide which patterns a family can match
+UPPER_TOKEN_PATTERN = re.compile(r'[A-Z]+')
+LOWER_TOKEN_PATTERN = re.compile(r'[a-z]+')
+GENERIC_HEAD_PATTERN = re.compile(r'[A-Za-z][a-zA-Z0-9]*')
+
 class SolutionParser:
     """Parser for .sol files from MILP optimization"""
     
-    def __init__(self):
-        self.variable_pattern = re.compile(r'^([A-Z]+)_([a-z]+)_(\d+)_(\d+)_([a-zA-Z0-9_]+)\s+([-\d\.-e\+]+)$')
+    def __init__(self, workers: int = 1):
+        self.workers = workers  # processes used by parse_solution_file, 1 parses in-process
+        self.variable_pattern = STANDARD_PATTERN
         self.objective_pattern = re.compile(r'# Objective value = ([\d\.-e\+]+)')
         self.comment_pattern = re.compile(r'^#')
+        # (head, second token) -> ordered matchers for that variable family
+        self._family_matchers: Dict[Tuple[str, Optional[str]], Tuple[Tuple[re.Pattern, Callable], ...]] = {}
+        # technology -> category, technologies repeat across buildings and periods
+        self._category_cache: Dict[str, Optional[str]] = {}
+        
+    def parse_solution_file(self, file_path: Path, workers: Optional[int] = None) -> OptimizationSolution:
+        """Parse a .sol file and return OptimizationSolution object
         
-    def parse_solution_file(self, file_path: Path) -> OptimizationSolution:
-        """Parse a .sol file and return OptimizationSolution object"""
+        With workers > 1, files of at least PARALLEL_PARSE_MIN_BYTES are split into
+        line-aligned byte ranges that are parsed in separate processes.
+        """
         if not file_path.exists():
             raise FileNotFoundError(f"Solution file not found: {file_path}")
             
         logger.info(f"Parsing solution file: {file_path}")
         
         objective_value = 0.0
-        variables = {}
         solution_status = "UNKNOWN"
+        workers = self.workers if workers is None else workers
         
         try:
-            with open(file_path, 'r') as f:
-                lines = f.readlines()
-                
-            for line_num, line in enumerate(lines, 1):
-                line = line.strip()
-                
-                if not line:
-                    continue
-                    
-                # Parse objective value
-                obj_match = self.objective_pattern.match(line)
-                if obj_match:
-                    objective_value = float(obj_match.group(1))
-                    continue
-                    
-                # Skip comments
-                if self.comment_pattern.match(line):
-                    continue
-                    
-                # Parse variable
-                var = self._parse_variable_line(line, line_num)
-                if var:
-                    variables[var.name] = var
+            header = self.read_solution_header(file_path)
+            if header["objective_value"] is not None:
+                objective_value = header["objective_value"]
+
+            if workers > 1 and file_path.stat().st_size >= PARALLEL_PARSE_MIN_BYTES:
+                columns = self._parse_parallel(file_path, workers)
+            else:
+                variables = SolutionColumnsBuilder()
+                for var in self.iter_solution_records(file_path):
+                    variables.append(var)
+                columns = variables.build()
                     
         except Exception as e:
             logger.error(f"Error parsing solution file {file_path}: {e}")
             raise
             
         # Determine solution status based on objective value and variables
-        if variables and objective_value > 0:
+        if len(columns) and objective_value > 0:
             solution_status = "OPTIMAL"
-        elif variables:
+        elif len(columns):
             solution_status = "FEASIBLE"
         else:
             solution_status = "INFEASIBLE"
             
-        logger.info(f"Parsed {len(variables)} variables with objective value {objective_value}")
+        logger.info(f"Parsed {len(columns)} variables with objective value {objective_value}")
         
-        sol = OptimizationSolution(
+        sol = OptimizationSolution.from_columns(
             objective_value=objective_value,
-            variables=variables,
+            columns=columns,
             solution_status=solution_status
         )
 
         return sol
 
-    def _parse_variable_line(self, line: str, line_num: int) -> Optional[OptimizationVariable]:
+    def read_solution_header(self, file_path: Path) -> Dict[str, Any]:
+        """Read the comment header of a .sol file (model name and objective value)"""
+        header = {"model_name": None, "objective_value": None}
 
-        """Parse a single variable line from the solution file"""
+        with open(file_path, 'r') as f:
+            for line in f:
+                line = line.strip()
+
+                if not line:
+                    continue
+
+                # The header ends with the first variable line
+                if not self.comment_pattern.match(line):
+                    break
+
+                obj_match = self.objective_pattern.match(line)
+                if obj_match:
+                    header["objective_value"] = float(obj_match.group(1))
+                elif line.startswith(SOLUTION_MODEL_PREFIX):
+                    header["model_name"] = line[len(SOLUTION_MODEL_PREFIX):].strip()
+
+        return header
+
+    def iter_solution_records(self, file_path: Path) -> Iterator[OptimizationVariable]:
+        """Stream the variables of a .sol file one line at a time
+        
+        Lines are read through a buffered reader and parsed as they arrive, so the
+        file content is never held in memory as a whole. Comment lines (including
+        the objective header, see read_solution_header) are skipped.
+        """
+        with open(file_path, 'r', buffering=READ_BUFFER_SIZE) as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+
+                if not line:
+                    continue
 
-        # Try the standard pattern first
-        match = self.variable_pattern.match(line)
-        if match:
-            var_type = match.group(1)
-            state = match.group(2)
-            building_id = match.group(3)
-            time_period = int(match.group(4))
-            technology = match.group(5)
-            value = float(match.group(6))
-
-            var_name = f"{var_type}_{state}_{building_id}_{time_period}_{technology}"
-
-            return OptimizationVariable(
-                name=var_name,
-                value=value,
-                variable_type=var_type,
-                category=self._categorize_technology(technology),
-                building_id=building_id,
-                time_period=time_period,
-                technology=technology,
-                measure=state
-            )
-
-        # Enhanced pattern for R variables with complex technology names: R_building_timeperiod_technology_th_param1_param2
-        r_complex_pattern = r"^(R)_(\d+)_(\d+)_(.+?)_th_(\d+)_(\d+)\s+([-\d\.-e\+]+)$"
-        match = re.match(r_complex_pattern, line)
-        if match:
-            var_type = match.group(1)
-            building_id = match.group(2)
-            time_period = int(match.group(3))
-            technology = match.group(4)
-            value = float(match.group(7))
-
-            var_name = f"{var_type}_{building_id}_{time_period}_{technology}_th_{match.group(5)}_{match.group(6)}"
-
-            return OptimizationVariable(
-                name=var_name,
-                value=value,
-                variable_type=var_type,
-                category=self._categorize_technology(technology),
-                building_id=building_id,
-                time_period=time_period,
-                technology=technology
-            )
-
-        # Enhanced pattern for C_dep variables with complex technology names: C_dep_building_timeperiod_technology
-        c_dep_enhanced_pattern = r"^(C_dep)_(\d+)_(\d+)_(.+?)\s+([-\d\.-e\+]+)$"
-        match = re.match(c_dep_enhanced_pattern, line)
-        if match:
-            var_type = match.group(1)
-            building_id = match.group(2)
-            time_period = int(match.group(3))
-            technology = match.group(4)
-            value = float(match.group(5))
-
-            var_name = f"{var_type}_{building_id}_{time_period}_{technology}"
-
-            return OptimizationVariable(
-                name=var_name,
-                value=value,
-                variable_type=var_type,
-                category=self._categorize_technology(technology),
-                building_id=building_id,
-                time_period=time_period,
-                technology=technology
-            )
-
-        # Try pattern for complex variables with tuples (like Y variables)
-        complex_pattern = r"^([A-Z]+)_(\d+)_(\d+)_\([^)]+\)_([a-zA-Z0-9_]+)\s+([-\d\.-e\+]+)$"
-        match = re.match(complex_pattern, line)
-        if match:
-            var_type = match.group(1)
-            building_id = match.group(2)
-            time_period = int(match.group(3))
-            technology = match.group(4)
-            value = float(match.group(5))
-
-            # Extract the tuple part for the variable name
-            tuple_start = line.find('(')
-            tuple_end = line.find(')', tuple_start)
-            tuple_part = line[tuple_start:tuple_end+1]
-
-            var_name = f"{var_type}_{building_id}_{time_period}_{tuple_part}_{technology}"
-
-            return OptimizationVariable(
-                name=var_name,
-                value=value,
-                variable_type=var_type,
-                category=self._categorize_technology(technology),
-                building_id=building_id,
-                time_period=time_period,
-                technology=technology
-            )
-
-        # Alternative R pattern for simpler format: R_building_timeperiod_technology_th_param1_param2
-        r_simple_pattern = r"^(R)_(\d+)_(\d+)_([a-zA-Z]+)_th_(\d+)_(\d+)\s+([-\d\.-e\+]+)$"
-        match = re.match(r_simple_pattern, line)
-        if match:
-            var_type = match.group(1)
-            building_id = match.group(2)
-            time_period = int(match.group(3))
-            technology = match.group(4)
-            value = float(match.group(7))
-
-            var_name = f"{var_type}_{building_id}_{time_period}_{technology}_th_{match.group(5)}_{match.group(6)}"
-
-            return OptimizationVariable(
-                name=var_name,
-                value=value,
-                variable_type=var_type,
-                category=self._categorize_technology(technology),
-                building_id=building_id,
-                time_period=time_period,
-                technology=technology
-            )
-
-        # Pattern for delta variables: delta_building_timeperiod_param
-        delta_pattern = r"^(delta)_(\d+)_(\d+)_(\d+)\s+([-\d\.-e\+]+)$"
-        match = re.match(delta_pattern, line)
-        if match:
-            var_type = match.group(1)
-            building_id = match.group(2)
-            time_period = int(match.group(3))
-            param = match.group(4)
-            value = float(match.group(5))
-
-            var_name = f"{var_type}_{building_id}_{time_period}_{param}"
-
-            return OptimizationVariable(
-                name=var_name,
-                value=value,
-                variable_type=var_type,
-                building_id=building_id,
-                time_period=time_period
-            )
-
-        # Pattern for C_rent variables: C_rent_building_timeperiod
-        c_rent_pattern = r"^(C_rent)_(\d+)_(-?\d+)\s+([-\d\.-e\+]+)$"
-        match = re.match(c_rent_pattern, line)
-        if match:
-            var_type = match.group(1)
-            building_id = match.group(2)
-            time_period = int(match.group(3))
-            value = float(match.group(4))
-
-            var_name = f"{var_type}_{building_id}_{time_period}"
-
-            return OptimizationVariable(
-                name=var_name,
-                value=value,
-                variable_type=var_type,
-                building_id=building_id,
-                time_period=time_period
-            )
-
-        # Pattern for single letter variables: F value
-        single_letter_pattern = r"^([A-Z])\s+([-\d\.-e\+]+)$"
-        match = re.match(single_letter_pattern, line)
-        if match:
-            var_type = match.group(1)
-            value = float(match.group(2))
-
-            return OptimizationVariable(
-                name=var_type,
-                value=value,
-                variable_type=var_type
-            )
-
-        # Financial pattern for Q, D, L variables
-        financial_pattern = r'^([QDL])_(\d+)\s+([-\d\.-e\+]+)$'
-        match = re.match(financial_pattern, line)
-        if match:
-            var_type = match.group(1)
-            time_period = int(match.group(2))
-            value = float(match.group(3))
-            var_name = f"{var_type}_{time_period}"
-
-            return OptimizationVariable(
-                name=var_name,
-                value=value,
-                variable_type=var_type,
-                time_period=time_period
-            )
-
-        # Generic pattern for most other variables: VAR_components_separated_by_underscore value
-        generic_pattern = r'^([A-Za-z][a-zA-Z0-9_]*?)_(.+?)\s+([-\d\.-e\+]+)$'
-        match = re.match(generic_pattern, line)
-        if match:
-            var_type = match.group(1)
-            var_suffix = match.group(2)
-            value = float(match.group(3))
-            var_name = f"{var_type}_{var_suffix}"
-
-            # Try to extract building_id and time_period from suffix
-            suffix_parts = var_suffix.split('_')
-            building_id = None
-            time_period = None
-            technology = None
-
-            # Look for numeric parts that could be building_id and time_period
-            for i, part in enumerate(suffix_parts):
-                if part.isdigit() or (part.startswith('-') and part[1:].isdigit()):
-                    if building_id is None:
-                        building_id = part
-                    elif time_period is None:
-                        time_period = int(part)
-                        break
-
-            # Extract technology (usually the last non-numeric part before time indicators)
-            tech_parts = [part for part in suffix_parts if not (part.isdigit() or (part.startswith('-') and part[1:].isdigit()))]
-            if tech_parts:
-                technology = '_'.join(tech_parts)
-
-            return OptimizationVariable(
-                name=var_name,
-                value=value,
-                variable_type=var_type,
-                category=self._categorize_technology(technology) if technology else None,
-                building_id=building_id,
-                time_period=time_period,
-                technology=technology
-            )
+                # Skip comments
+                if line[0] == '#':
+                    continue
+
+                var = self._parse_variable_line(line, line_num)
+                if var:
+                    yield var
+
+    def _parse_parallel(self, file_path: Path, workers: int) -> SolutionColumns:
+        """Parse byte ranges of a solution file in worker processes and merge the columns"""
+        byte_ranges = split_byte_ranges(file_path, workers)
+        logger.info(f"Parsing {file_path} in {len(byte_ranges)} chunks with {workers} workers")
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                _parse_solution_chunk,
+                [str(file_path)] * len(byte_ranges),
+                [start for start, _ in byte_ranges],
+                [end for _, end in byte_ranges]
+            ))
+
+        # Workers only know their chunk-local line numbers
+        line_offset = 0
+        for _, line_count, unparsed in results:
+            for line_num, line in unparsed:
+                logger.warning(f"Could not parse line {line_offset + line_num}: {line}")
+            line_offset += line_count
+
+        if not results:
+            return SolutionColumnsBuilder().build()
+        return SolutionColumns.concatenate([columns for columns, _, _ in results])
+
+    def _parse_variable_line(self, line: str, line_num: int) -> Optional[OptimizationVariable]:
+        """Parse a single variable line from the solution file"""
+        var = self._match_variable_line(line)
 
         # If no pattern matches, log warning but don't fail
-        logger.warning(f"Could not parse line {line_num}: {line}")
+        if var is None:
+            logger.warning(f"Could not parse line {line_num}: {line}")
+        return var
+
+    def _match_variable_line(self, line: str) -> Optional[OptimizationVariable]:
+        """Build the variable of a line, None if no pattern matches"""
+
+        # Dispatch on the variable family and only try the matchers that can apply to it
+        for pattern, build in self._get_family_matchers(line):
+            match = pattern.match(line)
+            if match:
+                return build(match, line)
         return None
 
+    def _get_family_matchers(self, line: str) -> Tuple[Tuple[re.Pattern, Callable], ...]:
+        """Get the ordered matchers for the variable family of a line (cached per family)"""
+        name = line.split(None, 1)[0]
+        head, _, rest = name.partition('_')
+        if not rest:
+            second = None
+        else:
+            second = rest.split('_', 1)[0]
+            if second.isdigit():
+                # Numeric indices do not change the family, keep the cache small
+                second = '#'
+
+        family = (head, second)
+        matchers = self._family_matchers.get(family)
+        if matchers is None:
+            matchers = self._build_family_matchers(head, second)
+            self._family_matchers[family] = matchers
+        return matchers
+
+    def _build_family_matchers(self, head: str, second: Optional[str]) -> Tuple[Tuple[re.Pattern, Callable], ...]:
+        """Select the matchers that can match a family, keeping the original precedence order"""
+        if second is None:
+            # Variables without any underscore (e.g. "F")
+            return ((SINGLE_LETTER_PATTERN, self._build_single_letter),)
+
+        is_upper = UPPER_TOKEN_PATTERN.fullmatch(head) is not None
+        is_numeric = second == '#'
+        matchers = []
+
+        if is_upper and LOWER_TOKEN_PATTERN.fullmatch(second):
+            matchers.append((STANDARD_PATTERN, self._build_standard))
+        if head == 'R' and is_numeric:
+            matchers.append((R_COMPLEX_PATTERN, self._build_r_complex))
+        if head == 'C' and second == 'dep':
+            matchers.append((C_DEP_PATTERN, self._build_c_dep))
+        if is_upper and is_numeric:
+            matchers.append((TUPLE_PATTERN, self._build_tuple))
+        if head == 'delta' and is_numeric:
+            matchers.append((DELTA_PATTERN, self._build_delta))
+        if head == 'C' and second == 'rent':
+            matchers.append((C_RENT_PATTERN, self._build_c_rent))
+        if head in ('Q', 'D', 'L') and is_numeric:
+            matchers.append((FINANCIAL_PATTERN, self._build_financial))
+        if GENERIC_HEAD_PATTERN.fullmatch(head):
+            matchers.append((GENERIC_PATTERN, self._build_generic))
+
+        return tuple(matchers)
+
+    def _build_standard(self, match: re.Match, line: str) -> OptimizationVariable:
+        """Standard pattern: TYPE_state_building_timeperiod_technology"""
+        var_type = match.group(1)
+        state = match.group(2)
+        building_id = match.group(3)
+        time_period = int(match.group(4))
+        technology = match.group(5)
+        value = float(match.group(6))
+
+        var_name = f"{var_type}_{state}_{building_id}_{time_period}_{technology}"
+
+        return OptimizationVariable(
+            name=var_name,
+            value=value,
+            variable_type=var_type,
+            category=self._categorize_technology(technology),
+            building_id=building_id,
+            time_period=time_period,
+            technology=technology,
+            measure=state
+        )
+
+    def _build_r_complex(self, match: re.Match, line: str) -> OptimizationVariable:
+        """R variables with complex technology names: R_building_timeperiod_technology_th_param1_param2"""
+        var_type = match.group(1)
+        building_id = match.group(2)
+        time_period = int(match.group(3))
+        technology = match.group(4)
+        value = float(match.group(7))
+
+        var_name = f"{var_type}_{building_id}_{time_period}_{technology}_th_{match.group(5)}_{match.group(6)}"
+
+        return OptimizationVariable(
+            name=var_name,
+            value=value,
+            variable_type=var_type,
+            category=self._categorize_technology(technology),
+            building_id=building_id,
+            time_period=time_period,
+            technology=technology
+        )
+
+    def _build_c_dep(self, match: re.Match, line: str) -> OptimizationVariable:
+        """C_dep variables with complex technology names: C_dep_building_timeperiod_technology"""
+        var_type = match.group(1)
+        building_id = match.group(2)
+        time_period = int(match.group(3))
+        technology = match.group(4)
+        value = float(match.group(5))
+
+        var_name = f"{var_type}_{building_id}_{time_period}_{technology}"
+
+        return OptimizationVariable(
+            name=var_name,
+            value=value,
+            variable_type=var_type,
+            category=self._categorize_technology(technology),
+            building_id=building_id,
+            time_period=time_period,
+            technology=technology
+        )
+
+    def _build_tuple(self, match: re.Match, line: str) -> OptimizationVariable:
+        """Complex variables with tuples (like Y variables)"""
+        var_type = match.group(1)
+        building_id = match.group(2)
+        time_period = int(match.group(3))
+        technology = match.group(4)
+        value = float(match.group(5))
+
+        # Extract the tuple part for the variable name
+        tuple_start = line.find('(')
+        tuple_end = line.find(')', tuple_start)
+        tuple_part = line[tuple_start:tuple_end+1]
+
+        var_name = f"{var_type}_{building_id}_{time_period}_{tuple_part}_{technology}"
+
+        return OptimizationVariable(
+            name=var_name,
+            value=value,
+            variable_type=var_type,
+            category=self._categorize_technology(technology),
+            building_id=building_id,
+            time_period=time_period,
+            technology=technology
+        )
+
+    def _build_delta(self, match: re.Match, line: str) -> OptimizationVariable:
+        """Delta variables: delta_building_timeperiod_param"""
+        var_type = match.group(1)
+        building_id = match.group(2)
+        time_period = int(match.group(3))
+        param = match.group(4)
+        value = float(match.group(5))
+
+        var_name = f"{var_type}_{building_id}_{time_period}_{param}"
+
+        return OptimizationVariable(
+            name=var_name,
+            value=value,
+            variable_type=var_type,
+            building_id=building_id,
+            time_period=time_period
+        )
+
+    def _build_c_rent(self, match: re.Match, line: str) -> OptimizationVariable:
+        """C_rent variables: C_rent_building_timeperiod"""
+        var_type = match.group(1)
+        building_id = match.group(2)
+        time_period = int(match.group(3))
+        value = float(match.group(4))
+
+        var_name = f"{var_type}_{building_id}_{time_period}"
+
+        return OptimizationVariable(
+            name=var_name,
+            value=value,
+            variable_type=var_type,
+            building_id=building_id,
+            time_period=time_period
+        )
+
+    def _build_single_letter(self, match: re.Match, line: str) -> OptimizationVariable:
+        """Single letter variables: F value"""
+        var_type = match.group(1)
+        value = float(match.group(2))
+
+        return OptimizationVariable(
+            name=var_type,
+            value=value,
+            variable_type=var_type
+        )
+
+    def _build_financial(self, match: re.Match, line: str) -> OptimizationVariable:
+        """Financial variables: Q, D, L per time period"""
+        var_type = match.group(1)
+        time_period = int(match.group(2))
+        value = float(match.group(3))
+        var_name = f"{var_type}_{time_period}"
+
+        return OptimizationVariable(
+            name=var_name,
+            value=value,
+            variable_type=var_type,
+            time_period=time_period
+        )
+
+    def _build_generic(self, match: re.Match, line: str) -> OptimizationVariable:
+        """Generic variables: VAR_components_separated_by_underscore value"""
+        var_type = match.group(1)
+        var_suffix = match.group(2)
+        value = float(match.group(3))
+        var_name = f"{var_type}_{var_suffix}"
+
+        # Try to extract building_id and time_period from suffix
+        suffix_parts = var_suffix.split('_')
+        building_id = None
+        time_period = None
+        technology = None
+
+        # Look for numeric parts that could be building_id and time_period
+        for i, part in enumerate(suffix_parts):
+            if part.isdigit() or (part.startswith('-') and part[1:].isdigit()):
+                if building_id is None:
+                    building_id = part
+                elif time_period is None:
+                    time_period = int(part)
+                    break
+
+        # Extract technology (usually the last non-numeric part before time indicators)
+        tech_parts = [part for part in suffix_parts if not (part.isdigit() or (part.startswith('-') and part[1:].isdigit()))]
+        if tech_parts:
+            technology = '_'.join(tech_parts)
+
+        return OptimizationVariable(
+            name=var_name,
+            value=value,
+            variable_type=var_type,
+            category=self._categorize_technology(technology) if technology else None,
+            building_id=building_id,
+            time_period=time_period,
+            technology=technology
+        )
+
     def _categorize_technology(self, technology: str) -> Optional[str]:
         """Categorize a technology based on its name"""
+        category = self._category_cache.get(technology)
+        if category is None:
+            category = self._lookup_technology_category(technology)
+            self._category_cache[technology] = category
+        return category
+
+    def _lookup_technology_category(self, technology: str) -> Optional[str]:
+        """Look up the category of a technology in TECHNOLOGY_CATEGORIES"""
         technology = technology.lower()
         
         for category, tech_list in TECHNOLOGY_CATEGORIES.items():
@@ -358,3 +483,55 @@ class SolutionParser:
         summary["time_periods"] = sorted(list(summary["time_periods"]))
         
         return summary
+
+
+def split_byte_ranges(file_path: Path, chunks: int) -> List[Tuple[int, int]]:
+    """Split a file into up to `chunks` byte ranges that start and end on line boundaries"""
+    size = Path(file_path).stat().st_size
+    bounds = [0]
+
+    with open(file_path, 'rb') as f:
+        for i in range(1, chunks):
+            f.seek(max(size * i // chunks, bounds[-1]))
+            # Move on to the start of the next line
+            f.readline()
+            bounds.append(min(f.tell(), size))
+
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def _parse_solution_chunk(file_path: str, start: int, end: int) -> Tuple[SolutionColumns, int, List[Tuple[int, str]]]:
+    """Parse the variable lines in a byte range of a solution file (runs in a worker process)
+    
+    Returns the parsed columns, the number of lines in the range and the unparsed
+    lines with their line numbers relative to the range start.
+    """
+    parser = SolutionParser()
+    variables = SolutionColumnsBuilder()
+    unparsed = []
+    line_count = 0
+    position = start
+
+    with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+        f.seek(start)
+        for raw_line in f:
+            if position >= end:
+                break
+            position += len(raw_line)
+            line_count += 1
+
+            line = raw_line.decode().strip()
+            if not line or line[0] == '#':
+                continue
+
+            var = parser._match_variable_line(line)
+            if var is None:
+                unparsed.append((line_count, line))
+            else:
+                variables.append(var)
+
+    columns = variables.build()
+    # The name index is rebuilt when merging, do not send it back to the parent
+    columns._index = None
+    return columns, line_count, unparsed
@@ -0,0 +1,171 @@
+"""
+Catalog of the subproblem files in the Benders temp directory (results/<run>/temp)
+
+The directory holds one sp_(<building>, <period>)_d<depth>.mps model and one
+pre_calc_sp_(<building>, <period>)_d<depth>.pkl per subproblem and depth, plus shared
+pickles (constr_names_map.pkl, cont_vars_map.pkl, bin_vars_map.pkl, decomp_props.pkl,
+dominance_sets.pkl). load_artifact_index lists them with size and mtime and, for the
+MPS files, the number of rows and columns. It is stored as a small CSV table in
+SOLUTION_CACHE_DIRNAME/ of the temp directory; on later loads only new or changed
+files are read.
+"""
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Tuple
+import logging
+
+import numpy as np
+import pandas as pd
+
+from config.app_config import SOLUTION_CACHE_DIRNAME
+
+logger = logging.getLogger(__name__)
+
+TEMP_DIR = Path("temp")
+
+INDEX_FILE = "artifact_index.csv"
+
+# Increment when the columns or their meaning change
+ARTIFACT_INDEX_VERSION = 1
+
+ARTIFACT_NAME = re.compile(r"^(pre_calc_)?sp_\((\d+), ?(\d+)\)_d(\d+)\.(mps|pkl)$")
+
+INDEX_COLUMNS = ["file", "kind", "building", "period", "depth", "size", "mtime_ns", "rows", "columns", "version"]
+
+
+def load_artifact_index(temp_dir: Path) -> pd.DataFrame:
+    """Catalog of the files in a Benders temp directory, one row per file
+
+    kind is "model" (sp_*.mps), "pre_calc" (pre_calc_sp_*.pkl) or "shared" (other
+    files). building, period and depth are -1 and rows/columns NaN where they do
+    not apply.
+    """
+    temp_dir = Path(temp_dir)
+    index_path = temp_dir / SOLUTION_CACHE_DIRNAME / INDEX_FILE
+    stored = read_cached_table(index_path, INDEX_COLUMNS, ARTIFACT_INDEX_VERSION)
+    known = {row.file: row for row in stored.itertuples(index=False)}
+
+    rows, changed = [], False
+    with os.scandir(temp_dir) as entries:
+        for entry in entries:
+            if not entry.is_file() or entry.name.startswith('.'):
+                continue
+            stat = entry.stat()
+            previous = known.pop(entry.name, None)
+            if previous is not None and previous.size == stat.st_size and previous.mtime_ns == stat.st_mtime_ns:
+                rows.append(previous._asdict())
+                continue
+            rows.append(_describe_file(Path(entry.path), stat.st_size, stat.st_mtime_ns))
+            changed = True
+
+    # Removed files also require a new table
+    changed = changed or bool(known)
+    index = pd.DataFrame(rows, columns=INDEX_COLUMNS).sort_values(["kind", "building", "period", "depth", "file"], ignore_index=True)
+    for column in ("building", "period", "depth", "size", "mtime_ns", "version"):
+        index[column] = index[column].astype(np.int64)
+
+    if changed:
+        write_cached_table(index_path, index)
+        logger.info(f"Indexed {len(index)} files in {temp_dir}")
+    return index
+
+
+def read_mps_dimensions(mps_path: Path) -> Tuple[int, int]:
+    """Number of constraint rows and columns of an MPS file
+
+    Rows are counted in the ROWS section (the objective row N is left out). Columns are
+    counted by name changes in the COLUMNS section without parsing the coefficients.
+    Other headers before it (e.g. OBJSENSE) and comment lines are skipped; reading stops
+    where COLUMNS ends, so right-hand sides and bounds are never read.
+    """
+    rows, columns = 0, 0
+    section = None
+    previous = None
+
+    with open(mps_path, 'rb') as f:
+        for line in f:
+            fields = line.split(None, 1)
+            if not fields or fields[0].startswith(b"*"):
+                continue
+            if not line[:1].isspace():
+                if section == b"COLUMNS":
+                    break
+                section = fields[0]
+                continue
+
+            if section == b"ROWS":
+                if fields[0] != b"N":
+                    rows += 1
+            elif section == b"COLUMNS":
+                if b"'MARKER'" in line:
+                    continue
+                if fields[0] != previous:
+                    columns += 1
+                    previous = fields[0]
+
+    return rows, columns
+
+
+def get_sp_idx(building: int, period: int) -> str:
+    """Subproblem label as used in iteration_timings.json, e.g. "(1, 0)" """
+    return f"({building}, {period})"
+
+
+def _describe_file(path: Path, size: int, mtime_ns: int) -> dict:
+    match = ARTIFACT_NAME.match(path.name)
+    if match:
+        pre_calc, building, period, depth, extension = match.groups()
+        kind = "pre_calc" if pre_calc else ("model" if extension == "mps" else "shared")
+        building, period, depth = int(building), int(period), int(depth)
+    else:
+        kind, building, period, depth = "shared", -1, -1, -1
+
+    rows, columns = np.nan, np.nan
+    if kind == "model":
+        try:
+            rows, columns = read_mps_dimensions(path)
+        except OSError as e:
+            logger.warning(f"Could not read MPS file {path}: {e}")
+
+    return {
+        "file": path.name, "kind": kind, "building": building, "period": period, "depth": depth,
+        "size": size, "mtime_ns": mtime_ns, "rows": rows, "columns": columns, "version": ARTIFACT_INDEX_VERSION
+    }
+
+
+def read_cached_table(table_path: Path, columns: List[str], version: int) -> pd.DataFrame:
+    """Stored CSV table, empty if missing, unreadable or written with other columns or version"""
+    try:
+        table = pd.read_csv(table_path)
+    except FileNotFoundError:
+        return pd.DataFrame(columns=columns)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read cached table {table_path}: {e}")
+        return pd.DataFrame(columns=columns)
+
+    if list(table.columns) != columns or (table["version"] != version).any():
+        return pd.DataFrame(columns=columns)
+    return table
+
+
+def write_cached_table(table_path: Path, table: pd.DataFrame) -> Optional[Path]:
+    """Write a CSV table atomically, None if the directory is not writable"""
+    tmp_path = None
+    try:
+        table_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=table_path.parent, prefix=f".{table_path.name}-")
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            table.to_csv(f, index=False)
+        os.replace(tmp_path, table_path)
+        tmp_path = None
+        return table_path
+
+    except OSError as e:
+        logger.warning(f"Could not write cached table {table_path}: {e}")
+        return None
+
+    finally:
+        if tmp_path is not None:
+            Path(tmp_path).unlink(missing_ok=True)
@@ -40,22 +40,36 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Import application components
-from config.app_config import APP_TITLE, APP_ICON, LAYOUT, INITIAL_SIDEBAR_STATE
+from config.app_config import APP_TITLE, APP_ICON, LAYOUT, INITIAL_SIDEBAR_STATE, INSTANCE_WATCHER_ENABLED
 from core.instance_manager import InstanceManager
 from components.sidebar import Sidebar
 from components.pages.instance_overview import InstanceOverviewPage, InstanceCreatorPage
 from components.pages.optimization_results import OptimizationResultsPage
+from components.pages.timeseries_explorer import TimeseriesExplorerPage
+from components.pages.solver_performance import SolverPerformancePage
+from components.pages.iis_explorer import IisExplorerPage
+
+@st.cache_resource
+def get_instance_manager() -> InstanceManager:
+    """Instance manager shared by all reruns and sessions (keeps its caches alive)"""
+    instance_manager = InstanceManager()
+    if INSTANCE_WATCHER_ENABLED:
+        instance_manager.start_watcher()
+    return instance_manager
 
 class OptiPortApp:
     """Main application class for the OptiPort visualization interface"""
     
     def __init__(self):
-        self.instance_manager = InstanceManager()
+        self.instance_manager = get_instance_manager()
         self.sidebar = Sidebar(APP_TITLE, APP_ICON)
 
         # Initialize pages
         self.instance_overview_page = InstanceOverviewPage(self.instance_manager)
         self.results_page = OptimizationResultsPage(self.instance_manager)
+        self.timeseries_page = TimeseriesExplorerPage(self.instance_manager)
+        self.solver_performance_page = SolverPerformancePage(self.instance_manager)
+        self.iis_explorer_page = IisExplorerPage(self.instance_manager)
         self.creator_page = InstanceCreatorPage(self.instance_manager)
         
         # Session state initialization
@@ -342,6 +356,15 @@ class OptiPortApp:
             elif page_name == "Optimierungsergebnisse":
                 self.results_page.render(st.session_state.selected_instance)
                 
+            elif page_name == "Zeitreihen":
+                self.timeseries_page.render(st.session_state.selected_instance)
+                
+            elif page_name == "Solver-Performance":
+                self.solver_performance_page.render(st.session_state.selected_instance)
+                
+            elif page_name == "IIS-Analyse":
+                self.iis_explorer_page.render(st.session_state.selected_instance)
+                
             elif page_name == "Neues Portfolio":
                 self.creator_page.render()
                 
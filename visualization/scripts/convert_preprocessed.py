@@ -0,0 +1,44 @@
+"""
+Convert the preprocessed pickles of use cases into memory-mappable columnar data
+
+Usage (from the visualization directory):
+    python scripts/convert_preprocessed.py                 # all use cases
+    python scripts/convert_preprocessed.py example other   # selected use cases
+
+The app converts the pickles on first use as well, this script just does it ahead
+of time (e.g. after a preprocessing run on a large portfolio).
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Make the application packages importable
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.app_config import USE_CASES_PATH
+from core.preprocessed_data import convert_preprocessed_pickle, read_preprocessed
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Convert preprocessed pickles to columnar data")
+    arg_parser.add_argument("use_cases", nargs="*", help="Use case names (default: all)")
+    arg_parser.add_argument("--force", action="store_true", help="Convert even if the data is up to date")
+    args = arg_parser.parse_args()
+
+    use_case_paths = [USE_CASES_PATH / name for name in args.use_cases] or sorted(
+        path for path in USE_CASES_PATH.iterdir() if path.is_dir() and not path.name.startswith('.')
+    )
+
+    for use_case_path in use_case_paths:
+        for pkl_path in sorted((use_case_path / "data" / "preprocessed").glob("*/*.pkl")):
+            if not args.force and read_preprocessed(pkl_path) is not None:
+                print(f"up to date  {pkl_path}")
+                continue
+            start = time.perf_counter()
+            entry_path = convert_preprocessed_pickle(pkl_path)
+            print(f"converted   {pkl_path} -> {entry_path} ({time.perf_counter() - start:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Build the columnar tables of the processed_results JSON files of Benders runs
+
+Usage (from the visualization directory):
+    python scripts/convert_processed_results.py                 # all use cases
+    python scripts/convert_processed_results.py example other   # selected use cases
+
+The app builds the tables on first use as well, this script just does it ahead of time
+(e.g. after a run on a large portfolio). Only new or changed files are read.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Make the application packages importable
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.app_config import USE_CASES_PATH, PROCESSED_RESULTS_WORKERS
+from core.processed_results import PROCESSED_RESULTS_DIR, load_processed_results
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Build columnar tables of processed Benders results")
+    arg_parser.add_argument("use_cases", nargs="*", help="Use case names (default: all)")
+    arg_parser.add_argument("--workers", type=int, default=PROCESSED_RESULTS_WORKERS, help="Threads reading the JSON files")
+    args = arg_parser.parse_args()
+
+    use_case_paths = [USE_CASES_PATH / name for name in args.use_cases] or sorted(
+        path for path in USE_CASES_PATH.iterdir() if path.is_dir() and not path.name.startswith('.')
+    )
+
+    for use_case_path in use_case_paths:
+        for results_dir in sorted((use_case_path / "results").glob(f"*/{PROCESSED_RESULTS_DIR}")):
+            start = time.perf_counter()
+            results = load_processed_results(results_dir, args.workers)
+            truncated = results.truncated_files
+            print(
+                f"{len(results.table):>10,} rows  {results_dir} ({len(results.files)} files, "
+                f"{len(truncated)} truncated, {time.perf_counter() - start:.2f}s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
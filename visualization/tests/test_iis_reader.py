@@ -0,0 +1,71 @@
+"""
+Tests for the IIS (.ilp) reader
+"""
+import math
+
+from core.data_models import MISSING_INT
+from core.iis_reader import read_iis
+
+# IIS as written by Gurobi, with an indicator, a lazy constraint and general constraints
+ILP_WITH_INDICATOR = """\\ Model example_copy
+\\ LP format - for model browsing. Use MPS format to capture full model detail.
+Minimize
+ 
+Subject To
+ energy_balance[0,2,dhw,0]: - Q_dhw_0_2 + 2.5 E_av_0_2_hp_air >= 0
+ ind_boiler[0,2]: X_in_0_2_boi = 1 -> Q_boi_0_2 + Q_hp_0_2
+   <= 40
+ max_credits[3]: L_3 <= 1e+06
+Lazy Constraints
+ lazy_cap[1,4]: E_in_1_4_pv - E_av_1_4_pv <= 0
+Bounds
+ -infinity <= Q_dhw_0_2 <= 12
+ E_av_0_2_hp_air >= 1
+ L_3 free
+Binaries
+ X_in_0_2_boi
+General Constraints
+ GC0: Q_max_0 = MAX ( Q_boi_0_2 , Q_hp_0_2 , 0 )
+ GC1: X_any_0 = OR ( X_in_0_2_boi , X_in_0_2_hp )
+End
+"""
+
+
+def write_ilp(tmp_path, text):
+    path = tmp_path / "model.ilp"
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_indicator_and_general_constraints_are_skipped(tmp_path):
+    model = read_iis(write_ilp(tmp_path, ILP_WITH_INDICATOR), index_layout={"max_credits": ("period",)})
+
+    names = model.constraints["name"].tolist()
+    assert names == ["energy_balance[0,2,dhw,0]", "max_credits[3]", "lazy_cap[1,4]"]
+    assert "->" not in model.variable_index
+    assert not any(name.startswith("R") for name in names)
+    assert model.integer_variables == frozenset({"X_in_0_2_boi"})
+
+
+def test_linear_constraints_and_bounds(tmp_path):
+    model = read_iis(write_ilp(tmp_path, ILP_WITH_INDICATOR), index_layout={"max_credits": ("period",)})
+    constraints = model.constraints.set_index("name")
+
+    balance = constraints.loc["energy_balance[0,2,dhw,0]"]
+    assert balance["family"] == "energy_balance"
+    assert (balance["building"], balance["period"]) == (0, 2)
+    assert balance["variables"] == ("Q_dhw_0_2", "E_av_0_2_hp_air")
+    assert balance["coefficients"] == (-1.0, 2.5)
+    assert (balance["sense"], balance["rhs"]) == (">=", 0.0)
+
+    credits = constraints.loc["max_credits[3]"]
+    assert (credits["building"], credits["period"]) == (MISSING_INT, 3)
+    assert credits["rhs"] == 1e6
+
+    bounds = model.bounds.set_index("variable")
+    assert tuple(bounds.loc["Q_dhw_0_2"]) == (-math.inf, 12.0)
+    assert tuple(bounds.loc["E_av_0_2_hp_air"]) == (1.0, math.inf)
+    assert tuple(bounds.loc["L_3"]) == (-math.inf, math.inf)
+    assert tuple(bounds.loc["X_in_0_2_boi"]) == (0.0, 1.0)
+
+    assert model.get_constraints_of(["E_in_1_4_pv"])["name"].tolist() == ["lazy_cap[1,4]"]
@@ -0,0 +1,79 @@
+"""
+Tests for the parallel solution parser: chunked parsing must give the serial columns
+"""
+import numpy as np
+import pytest
+
+import core.solution_parser as solution_parser
+from core.data_models import MISSING_CODE
+from core.solution_parser import SolutionParser, split_byte_ranges
+from config.app_config import USE_CASES_PATH
+
+EXAMPLE_SOLUTION = USE_CASES_PATH / "example" / "results" / "example.sol"
+
+CATEGORICAL_FIELDS = [
+    ("building_id_codes", "building_ids"),
+    ("variable_type_codes", "variable_types"),
+    ("technology_codes", "technologies"),
+    ("category_codes", "categories"),
+    ("measure_codes", "measures")
+]
+
+
+@pytest.fixture
+def solution_file(tmp_path):
+    """example.sol with variables of the first chunk repeated at the end with new values"""
+    lines = EXAMPLE_SOLUTION.read_text(encoding="utf-8").splitlines()
+    variables = [line for line in lines if line and not line.startswith("#")]
+    repeated = [variables[0], variables[1], variables[len(variables) // 2]]
+    lines += [f"{line.split()[0]} {index + 7}.5" for index, line in enumerate(repeated)]
+
+    path = tmp_path / "example.sol"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def decode(columns, codes_field, lookup_field):
+    lookup = getattr(columns, lookup_field)
+    return [lookup[code] if code != MISSING_CODE else None for code in getattr(columns, codes_field).tolist()]
+
+
+def assert_same_columns(actual, expected):
+    assert actual.names == expected.names
+    assert actual.index == expected.index
+    np.testing.assert_array_equal(actual.values, expected.values)
+    np.testing.assert_array_equal(actual.time_period, expected.time_period)
+    for codes_field, lookup_field in CATEGORICAL_FIELDS:
+        assert decode(actual, codes_field, lookup_field) == decode(expected, codes_field, lookup_field)
+
+
+@pytest.mark.parametrize("workers", [1, 3, 7])
+def test_parallel_parse_matches_serial(solution_file, workers):
+    serial = SolutionParser().parse_solution_file(solution_file, workers=1).columns
+    # The repeated names lie in other chunks than their first occurrence
+    byte_ranges = split_byte_ranges(solution_file, workers)
+    assert len(byte_ranges) == workers
+
+    parallel = SolutionParser()._parse_parallel(solution_file, workers)
+
+    assert_same_columns(parallel, serial)
+    first = serial.names[0]
+    assert parallel.values[parallel.index[first]] == 7.5
+
+
+def test_parse_solution_file_uses_parallel_parse(solution_file, monkeypatch):
+    monkeypatch.setattr(solution_parser, "PARALLEL_PARSE_MIN_BYTES", 0)
+    chunked = []
+    parse_parallel = SolutionParser._parse_parallel
+
+    def spy(self, file_path, workers):
+        chunked.append(workers)
+        return parse_parallel(self, file_path, workers)
+
+    monkeypatch.setattr(SolutionParser, "_parse_parallel", spy)
+    serial = SolutionParser().parse_solution_file(solution_file, workers=1)
+    parallel = SolutionParser(workers=3).parse_solution_file(solution_file)
+
+    assert chunked == [3]
+    assert_same_columns(parallel.columns, serial.columns)
+    assert parallel.objective_value == serial.objective_value
@@ -9,6 +9,11 @@ from config.translations import get_technology_translation
 
 logger = logging.getLogger(__name__)
 
+# Columns of create_variables_dataframe
+VARIABLES_DATAFRAME_COLUMNS = [
+    'variable', 'variable_type', 'value', 'building_id', 'time_period', 'technology', 'category', 'measure'
+]
+
 def categorize_technology(technology_name: str) -> str:
     """Categorize a technology based on its name"""
     tech_lower = technology_name.lower()
@@ -252,6 +257,45 @@ def create_summary_table(variables: Dict[str, Any]) -> pd.DataFrame:
     
     return pd.DataFrame(data)
 
+def create_variables_dataframe(solution) -> pd.DataFrame:
+    """Create a DataFrame with one row per solution variable
+    
+    Columnar solutions are converted array by array (categorical string columns,
+    nullable integer columns) without creating a Python object per variable.
+    """
+    columns = getattr(solution, 'columns', None)
+
+    if columns is None:
+        return pd.DataFrame([
+            {
+                'variable': var_name,
+                'variable_type': var.variable_type,
+                'value': var.value,
+                'building_id': var.building_id,
+                'time_period': var.time_period,
+                'technology': var.technology,
+                'category': var.category,
+                'measure': var.measure
+            }
+            for var_name, var in solution.variables.items()
+        ], columns=VARIABLES_DATAFRAME_COLUMNS).astype({'building_id': 'category', 'time_period': 'Int32'})
+
+    from core.data_models import MISSING_INT
+
+    def nullable_int(values: np.ndarray) -> pd.arrays.IntegerArray:
+        return pd.arrays.IntegerArray(values.astype(np.int32), values == MISSING_INT)
+
+    return pd.DataFrame({
+        'variable': columns.names,
+        'variable_type': pd.Categorical.from_codes(columns.variable_type_codes, columns.variable_types),
+        'value': columns.values,
+        'building_id': pd.Categorical.from_codes(columns.building_id_codes, columns.building_ids),
+        'time_period': nullable_int(columns.time_period),
+        'technology': pd.Categorical.from_codes(columns.technology_codes, columns.technologies),
+        'category': pd.Categorical.from_codes(columns.category_codes, columns.categories),
+        'measure': pd.Categorical.from_codes(columns.measure_codes, columns.measures)
+    }, columns=VARIABLES_DATAFRAME_COLUMNS)
+
 def format_currency(value: float, currency: str = "€") -> str:
     """Format currency values with appropriate scaling"""
     abs_value = abs(value)
@@ -0,0 +1,77 @@
+"""
+Server-side downsampling of long time series for plotting
+"""
+import numpy as np
+
+# Points selected per output point in the min/max preselection
+MINMAX_RATIO = 4
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: indices of `n_out` points that keep the visual shape"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # First and last point are always kept, the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        # Average of the next bucket (or the last point) as third triangle corner
+        next_start, next_end = end, edges[bucket + 2] if bucket + 2 < len(edges) else n
+        next_x = x[next_start:next_end].mean()
+        next_y = y[next_start:next_end].mean()
+
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+
+    return selected
+
+
+def minmax_lttb(x: np.ndarray, y: np.ndarray, n_out: int, ratio: int = MINMAX_RATIO) -> np.ndarray:
+    """LTTB on a min/max preselection, keeps the peaks of the series
+
+    The series is first reduced to the minimum and maximum of `n_out * ratio / 2`
+    buckets (cheap, vectorized), then LTTB picks `n_out` of those points. The global
+    minimum and maximum are always part of the result.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    y = np.asarray(y, dtype=np.float64)
+    n_buckets = max((n_out * ratio) // 2, 1)
+    if n_buckets * 2 < n:
+        # Bucket boundaries over the inner points, first and last point stay as they are
+        edges = np.linspace(1, n - 1, n_buckets + 1).astype(np.int64)
+        candidates = [0]
+        for start, end in zip(edges[:-1], edges[1:]):
+            if end > start:
+                bucket = y[start:end]
+                candidates.extend(sorted({start + int(np.argmin(bucket)), start + int(np.argmax(bucket))}))
+        candidates.append(n - 1)
+        candidates = np.array(candidates, dtype=np.int64)
+    else:
+        candidates = np.arange(n)
+
+    selected = candidates[lttb(np.asarray(x)[candidates], y[candidates], n_out)]
+    extremes = [int(np.nanargmin(y)), int(np.nanargmax(y))] if not np.all(np.isnan(y)) else []
+    return np.union1d(selected, extremes).astype(np.int64)
+
+
+def downsample(x: np.ndarray, y: np.ndarray, max_points: int):
+    """(x, y) reduced to about `max_points` points, unchanged if already short enough"""
+    if len(y) <= max_points:
+        return np.asarray(x), np.asarray(y)
+    indices = minmax_lttb(np.arange(len(y)) if not np.issubdtype(np.asarray(x).dtype, np.number) else x, y, max_points)
+    return np.asarray(x)[indices], np.asarray(y)[indices]
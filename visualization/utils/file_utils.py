@@ -2,6 +2,7 @@
 File utilities for handling different file formats
 """
 import json
+import re
 import pandas as pd
 from pathlib import Path
 from typing import Dict, Any, Optional, List
@@ -9,6 +10,12 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Buffer size for scanning files without parsing them
+SCAN_BUFFER_SIZE = 1024 * 1024
+
+# Characters that change the record state while counting CSV records
+CSV_LINE_BREAK_OR_QUOTE = re.compile(rb'["\n]')
+
 def read_json_file(file_path: Path) -> Optional[Dict[str, Any]]:
     """Read and parse a JSON file"""
     try:
@@ -26,6 +33,48 @@ def read_csv_file(file_path: Path, **kwargs) -> Optional[pd.DataFrame]:
         logger.error(f"Error reading CSV file {file_path}: {e}")
         return None
 
+def count_csv_records(file_path: Path, has_header: bool = True) -> int:
+    """Count the records of a CSV file without parsing it
+    
+    The file is scanned in binary chunks for line breaks. Line breaks inside quoted
+    fields do not end a record and blank lines are not counted, like in pd.read_csv.
+    Works for any delimiter.
+    """
+    records = 0
+    in_quotes = False
+    has_content = False  # current record has non-whitespace content
+
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(SCAN_BUFFER_SIZE)
+            if not chunk:
+                break
+
+            start = 0
+            for match in CSV_LINE_BREAK_OR_QUOTE.finditer(chunk):
+                position = match.start()
+                if not has_content and chunk[start:position].strip():
+                    has_content = True
+                start = position + 1
+
+                if chunk[position] == ord('"'):
+                    # Escaped quotes ("") toggle twice
+                    in_quotes = not in_quotes
+                    has_content = True
+                elif not in_quotes:
+                    if has_content:
+                        records += 1
+                    has_content = False
+
+            if not has_content and chunk[start:].strip():
+                has_content = True
+
+    # Last record without trailing line break
+    if has_content:
+        records += 1
+
+    return max(records - 1, 0) if has_header else records
+
 def write_json_file(data: Dict[str, Any], file_path: Path) -> bool:
     """Write data to a JSON file"""
     try:
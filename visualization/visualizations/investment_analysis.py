@@ -4,6 +4,7 @@ Investment analysis visualization showing technology adoption over time
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
+from collections.abc import Mapping
 from typing import Dict, List
 import streamlit as st
 
@@ -28,7 +29,7 @@ class InvestmentAnalysis(BaseVisualization):
             l_vars = solution.get_variables_by_type("L")
         elif instance_data is not None:
             # Extrahiere Q, D, L Variablen aus instance_data
-            variables = instance_data.get("variables") if isinstance(instance_data, dict) else getattr(instance_data, "variables", None)
+            variables = instance_data.get("variables") if isinstance(instance_data, Mapping) else getattr(instance_data, "variables", None)
             q_vars = {k: v for k, v in variables.items() if k.startswith("Q_")}
             d_vars = {k: v for k, v in variables.items() if k.startswith("D_")}
             l_vars = {k: v for k, v in variables.items() if k.startswith("L_")}
@@ -0,0 +1,145 @@
+"""
+Timeline (Gantt) of Benders subproblem jobs with one lane per subprocess
+"""
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+from typing import Optional, Tuple
+
+from .base_viz import BaseVisualization
+from core.benders_timings import BendersTimings, JOB_PHASES
+from config.visualization_config import JOB_PHASE_LABELS, JOB_PHASE_COLORS, TIMELINE_CONFIG
+
+class SubproblemTimeline(BaseVisualization):
+    """Gantt chart of the job phases per subprocess across iterations
+
+    Segments are drawn as thick Scattergl lines (WebGL, one trace per phase). If the
+    selected iterations contain more than TIMELINE_CONFIG["max_segments"] phase
+    segments, they are aggregated per subprocess into time bins: each bin shows how
+    long every phase was active in it, the rest of the bin stays empty (idle).
+    """
+
+    def __init__(self):
+        super().__init__(
+            title="Zeitachse der Subprozesse",
+            description="Phasen der Subproblem-Jobs je Subprozess über die Iterationen (Startzeiten rekonstruiert aus den Laufzeiten)"
+        )
+
+    def create_figure(self, solution=None, instance_data=None, timings: BendersTimings = None,
+                      iteration_range: Optional[Tuple[int, int]] = None, **kwargs) -> go.Figure:
+        """Create the timeline for the iterations in `iteration_range` (all if None)"""
+        if timings is None or timings.jobs.empty:
+            return self._create_empty_figure("Keine Job-Daten vorhanden")
+
+        first, last = iteration_range if iteration_range else (None, None)
+        schedule = timings.get_job_schedule(first, last)
+        if schedule.empty:
+            return self._create_empty_figure("Keine Jobs im gewählten Bereich")
+
+        aggregated = len(schedule) > TIMELINE_CONFIG["max_segments"]
+        if aggregated:
+            schedule = self._aggregate(schedule, TIMELINE_CONFIG["bins"])
+
+        lanes = sorted(schedule["subprocess_idx"].unique())
+        fig = go.Figure()
+
+        for phase in JOB_PHASES:
+            segments = schedule[schedule["phase"] == phase]
+            if segments.empty:
+                continue
+            fig.add_trace(go.Scattergl(
+                **self._segment_coordinates(segments, aggregated),
+                mode="lines",
+                line=dict(color=JOB_PHASE_COLORS[phase], width=TIMELINE_CONFIG["lane_width"]),
+                name=JOB_PHASE_LABELS[phase],
+                hoverinfo="text",
+                connectgaps=False
+            ))
+
+        fig.update_layout(
+            template=self.config["default_theme"],
+            height=max(self.config["height"]["small"], 40 + 28 * len(lanes)),
+            xaxis_title="Zeit seit Start (s)",
+            yaxis=dict(
+                title="Subprozess",
+                tickmode="array",
+                tickvals=lanes,
+                autorange="reversed"
+            ),
+            hovermode="closest",
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, x=0)
+        )
+        if aggregated:
+            fig.update_layout(title=f"Aggregiert in {TIMELINE_CONFIG['bins']} Zeitabschnitte – für Einzeljobs Iterationsbereich verkleinern")
+        return fig
+
+    def render(self, timings: BendersTimings, iteration_range: Optional[Tuple[int, int]] = None):
+        """Render the timeline in Streamlit"""
+        st.subheader(self.title)
+        if self.description:
+            st.caption(self.description)
+
+        try:
+            fig = self.create_figure(timings=timings, iteration_range=iteration_range)
+            fig.update_layout(
+                font_family=self.config["font_family"],
+                font_size=self.config["legend_size"]
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        except Exception as e:
+            st.error(f"Fehler beim Erstellen der Zeitachse: {e}")
+            st.exception(e)
+
+    @staticmethod
+    def _segment_coordinates(segments: pd.DataFrame, aggregated: bool) -> dict:
+        """x/y/hovertext arrays of line segments separated by gaps (None)"""
+        count = len(segments)
+        x = np.empty(count * 3, dtype=object)
+        y = np.empty(count * 3, dtype=object)
+        x[0::3], x[1::3], x[2::3] = segments["start"].to_numpy(), segments["end"].to_numpy(), None
+        y[0::3] = y[1::3] = segments["subprocess_idx"].to_numpy()
+        y[2::3] = None
+
+        durations = (segments["end"] - segments["start"]).to_numpy()
+        if aggregated:
+            labels = [f"Subprozess {lane}<br>{duration:.3f} s aktiv" for lane, duration in zip(segments["subprocess_idx"], durations)]
+        else:
+            labels = [
+                f"SP {sp_idx} · Iteration {iteration}<br>Subprozess {lane}<br>{duration:.4f} s"
+                for sp_idx, iteration, lane, duration in zip(segments["sp_idx"], segments["iteration"], segments["subprocess_idx"], durations)
+            ]
+        text = np.empty(count * 3, dtype=object)
+        text[0::3] = text[1::3] = labels
+        text[2::3] = None
+
+        return dict(x=x, y=y, hovertext=text)
+
+    @staticmethod
+    def _aggregate(schedule: pd.DataFrame, bins: int) -> pd.DataFrame:
+        """Active time per subprocess, time bin and phase, laid out from the bin start"""
+        edges = np.linspace(schedule["start"].min(), schedule["end"].max(), bins + 1)
+        bin_width = edges[1] - edges[0]
+        # Segments are assigned to the bin they start in (they are short compared to a bin)
+        schedule = schedule.assign(
+            bin=np.clip(np.searchsorted(edges, schedule["start"].to_numpy(), side="right") - 1, 0, bins - 1),
+            duration=schedule["end"] - schedule["start"]
+        )
+        totals = schedule.groupby(["subprocess_idx", "bin", "phase"], sort=False)["duration"].sum().reset_index()
+
+        # Stack the phases of a bin in execution order, capped at the bin width
+        totals["order"] = totals["phase"].map({phase: number for number, phase in enumerate(JOB_PHASES)})
+        totals = totals.sort_values(["subprocess_idx", "bin", "order"])
+        offsets = totals.groupby(["subprocess_idx", "bin"])["duration"].cumsum() - totals["duration"]
+        bin_starts = edges[totals["bin"].to_numpy()]
+        starts = bin_starts + np.minimum(offsets.to_numpy(), bin_width)
+        ends = bin_starts + np.minimum((offsets + totals["duration"]).to_numpy(), bin_width)
+
+        return pd.DataFrame({
+            "iteration": None,
+            "subprocess_idx": totals["subprocess_idx"].to_numpy(),
+            "sp_idx": None,
+            "phase": totals["phase"].to_numpy(),
+            "start": starts,
+            "end": ends
+        })